@@ -0,0 +1,87 @@
+####################################################################
+# Benchmark of the str and bytes paths through RoboxPostProcessing
+#
+#   python benchmarks/benchmark_bytes.py [--scale N] [--runs N]
+#
+# Every corpus of benchmark_postprocessing.py is exported like
+# RoboxPrinterPlugin.write does it, through a fresh layer cache:
+#
+#   str          the layers as str, every output block is encoded
+#                (what write() does)
+#   str->bytes   every layer is encoded first and decoded again a
+#                segment at a time by the processor
+#   bytes        the layers are bytes already (files read from disk)
+#
+# The time (best of --runs), the time spent encoding the layers and
+# the tracemalloc peak are reported, the outputs must be equal.
+####################################################################
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from plugin_loader import load_plugin_module
+from benchmark_postprocessing import HashingSink, corpora
+
+RoboxPostProcessing = load_plugin_module("RoboxPostProcessing")
+
+paths = ["str", "str->bytes", "bytes"]
+
+
+# export - writes the layers like RoboxPrinterPlugin._writeLayers, returns the sink and the seconds spent encoding
+def export(path: str, chunks, model: str):
+    processor = RoboxPostProcessing.RoboxPostProcessing(model, True)
+    statistics = RoboxPostProcessing.ExportStatistics()
+    processor.statistics = statistics
+    cache = RoboxPostProcessing.LayerCache()
+    sink = HashingSink()
+    for gcode in chunks:
+        if path == "str->bytes":
+            encode_start = time.perf_counter()
+            gcode = gcode.encode()
+            statistics.add_time("encode", time.perf_counter() - encode_start)
+        cache.process_into(processor, sink, gcode)
+    return sink, statistics.seconds["encode"]
+
+
+# peak_memory - the tracemalloc peak of one export in MB
+def peak_memory(path: str, chunks, model: str) -> float:
+    tracemalloc.start()
+    export(path, chunks, model)
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return peak
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the str and bytes paths of RoboxPostProcessing")
+    parser.add_argument("--scale", type=int, default=1, help="multiplies the corpus sizes")
+    parser.add_argument("--runs", type=int, default=5, help="exports per path, the fastest is reported")
+    arguments = parser.parse_args(argv)
+
+    model = RoboxPostProcessing.Model.dual.value
+    failures = 0
+    print("%-17s %-11s %9s %9s %9s" % ("corpus", "path", "seconds", "encode s", "peak MB"))
+    for corpus_name, chunks in corpora(arguments.scale).items():
+        inputs = {"str": chunks, "str->bytes": chunks, "bytes": [chunk.encode() for chunk in chunks]}
+        digests = set()
+        for path in paths:
+            best = None
+            for _ in range(arguments.runs):
+                start = time.perf_counter()
+                sink, encode_seconds = export(path, inputs[path], model)
+                seconds = time.perf_counter() - start
+                if best is None or seconds < best[0]:
+                    best = (seconds, encode_seconds)
+            digests.add(sink.digest.hexdigest())
+            print("%-17s %-11s %9.3f %9.3f %9.1f" % (corpus_name, path, best[0], best[1],
+                                                   peak_memory(path, inputs[path], model)))
+        if len(digests) != 1:
+            print("FAILED: the outputs of %s differ" % corpus_name)
+            failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
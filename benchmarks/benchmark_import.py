@@ -0,0 +1,111 @@
+####################################################################
+# Import-time benchmark for the Robox plugin modules
+#
+#   python benchmarks/benchmark_import.py [--runs N] [--top N] [--full]
+#
+# Every module is imported in a fresh interpreter started with
+# python -X importtime, the cumulative time of the module and the
+# heaviest imports it pulls in are reported (best of --runs).
+# The modules that don't need Cura are always measured; --full also
+# imports the whole plugin package, that needs UM, cura and PyQt5 on
+# the path, so run it with Cura's Python.
+#
+# Every run also reports the modules that should not be imported when
+# the plugin loads (distutils, QtGui, the snapshot and zipfile).
+####################################################################
+
+import argparse
+import os
+import subprocess
+import sys
+
+benchmarks_path = os.path.dirname(os.path.abspath(__file__))
+plugins_path = os.path.normpath(os.path.join(benchmarks_path, "..", "files", "plugins"))
+
+headless_modules = ["_version", "G3DremHeader", "RoboxPostProcessing", "RoboxBatchProcessing"]
+
+# imported lazily by the plugin, finding one of them at import time is a regression
+lazy_modules = ["distutils", "distutils.version", "PyQt5.QtGui", "cura.Snapshot", "zipfile"]
+
+
+# import_code - the code that imports the module, an import statement as -X importtime doesn't see importlib calls
+def import_code(module: str, full: bool) -> str:
+    if full:
+        return "import sys; sys.path.insert(0, %r); import RoboxPrinterPlugin" % plugins_path
+    # the same namespace package as plugin_loader, so the plugin's __init__ (and UM) isn't imported
+    return "import sys; sys.path.insert(0, %r); import _plugin_loader; _plugin_loader.register_package(); " \
+           "import RoboxPrinterPlugin.%s" % (os.path.join(plugins_path, "RoboxPrinterPlugin"), module)
+
+
+# measure - imports the module in a new interpreter, returns [(self us, cumulative us, depth, name)] or the error
+def measure(code: str):
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, universal_newlines=True)
+    entries = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        stripped = name.lstrip()
+        entries.append((int(self_us), int(cumulative_us), (len(name) - len(stripped) - 1) // 2, stripped))
+    if process.returncode != 0:
+        return process.stderr.strip().splitlines()[-1]
+    return entries
+
+
+# imported_by - the entry of the target and the entries of everything it imported, which -X importtime prints
+# right before it, indented deeper
+def imported_by(entries, target: str):
+    for index in range(len(entries) - 1, -1, -1):
+        if entries[index][3] == target:
+            depth = entries[index][2]
+            start = index
+            while start > 0 and entries[start - 1][2] > depth:
+                start -= 1
+            return entries[index], entries[start:index]
+    return None, []
+
+
+def report(label: str, code: str, target: str, runs: int, top: int) -> bool:
+    best = None
+    for _ in range(runs):
+        entries = measure(code)
+        if isinstance(entries, str):
+            print("%-32s skipped: %s" % (label, entries))
+            return True
+        target_entry, children = imported_by(entries, target)
+        if target_entry is None:
+            print("%-32s skipped: %s was already imported" % (label, target))
+            return True
+        if best is None or target_entry[1] < best[0]:
+            best = (target_entry[1], [target_entry] + children)
+
+    cumulative, entries = best
+    names = set(entry[3] for entry in entries)
+    eager = [name for name in lazy_modules if name in names]
+    print("%-32s %8.1f ms  %4d modules  eager: %s" % (label, cumulative / 1000, len(entries),
+                                                    ", ".join(eager) if eager else "-"))
+    for self_us, cumulative_us, depth, name in sorted(entries[1:], key=lambda entry: -entry[1])[:top]:
+        print("    %8.1f ms  %s" % (cumulative_us / 1000, name))
+    return not eager
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the import time of the Robox plugin modules")
+    parser.add_argument("--runs", type=int, default=5, help="imports per module, the fastest is reported")
+    parser.add_argument("--top", type=int, default=5, help="number of heaviest imports listed per module")
+    parser.add_argument("--full", action="store_true", help="also import the plugin package (needs Cura's Python)")
+    arguments = parser.parse_args(argv)
+
+    clean = True
+    for module in headless_modules:
+        clean = report(module, import_code(module, False), "RoboxPrinterPlugin." + module, arguments.runs,
+                       arguments.top) and clean
+    if arguments.full:
+        clean = report("RoboxPrinterPlugin (package)", import_code("", True), "RoboxPrinterPlugin", arguments.runs,
+                       arguments.top) and clean
+    return 0 if clean else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+####################################################################
+# Peak memory benchmark for converting large g-code files
+#
+#   python benchmarks/benchmark_memory.py [--size-mb N] [--keep DIR]
+#
+# Generates a synthetic g-code file of about --size-mb MB and
+# converts it with RoboxBatchProcessing three ways, each in a fresh
+# interpreter so the peak resident set size (ru_maxrss) belongs to
+# that conversion alone:
+#
+#   read    the whole file read into one string, then processed
+#   stream  convert_file reading the file in 1 MB text blocks
+#   mmap    convert_file with the memory-mapped reader (--mmap)
+#
+# Time, MB/s and peak RSS are reported, the outputs must be equal.
+# Needs the resource module, so it doesn't run on Windows.
+####################################################################
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from plugin_loader import load_plugin_module
+
+RoboxBatchProcessing = load_plugin_module("RoboxBatchProcessing")
+RoboxPostProcessing = load_plugin_module("RoboxPostProcessing")
+
+modes = ["read", "stream", "mmap"]
+model = RoboxPostProcessing.Model.dual.value
+
+
+# write_corpus - writes synthetic dual tool layers until the file has about size_bytes bytes
+def write_corpus(path: str, size_bytes: int):
+    from benchmark_postprocessing import synthetic_layers
+    block = "".join(synthetic_layers("dual_tool", 50, 400)).encode()
+    with open(path, "wb") as output:
+        for _ in range(max(size_bytes // len(block), 1)):
+            output.write(block)
+
+
+# peak_rss_mb - the peak resident set size of this process, ru_maxrss is in KB on Linux and in bytes on macOS
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+# convert - runs one conversion in this process and prints its record, called in a child interpreter
+def convert(mode: str, input_path: str, output_path: str):
+    start = time.perf_counter()
+    if mode == "read":
+        processor = RoboxPostProcessing.RoboxPostProcessing(model, True)
+        with open(input_path, "r", encoding="utf-8") as source:
+            data = source.read()
+        with open(output_path, "wb") as output:
+            output.write(processor.get_header().encode())
+            processor.process_into(output, data)
+    else:
+        RoboxBatchProcessing.convert_file(input_path, output_path, model, True, use_mmap=mode == "mmap")
+    print(json.dumps({"seconds": time.perf_counter() - start, "peak_rss_mb": peak_rss_mb()}))
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the peak memory of the g-code readers")
+    parser.add_argument("--size-mb", type=int, default=64, help="size of the generated g-code file")
+    parser.add_argument("--keep", help="directory for the generated files, kept after the run")
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "INPUT", "OUTPUT"), help=argparse.SUPPRESS)
+    arguments = parser.parse_args(argv)
+
+    if resource is None:
+        print("skipped: the resource module is not available on this platform")
+        return 0
+    if arguments.child:
+        convert(*arguments.child)
+        return 0
+
+    directory = arguments.keep or tempfile.mkdtemp(prefix="robox-memory-")
+    os.makedirs(directory, exist_ok=True)
+    try:
+        input_path = os.path.join(directory, "large.gcode")
+        write_corpus(input_path, arguments.size_mb << 20)
+        input_mb = os.path.getsize(input_path) / (1 << 20)
+        print("input: %.1f MB" % input_mb)
+
+        digests = set()
+        for mode in modes:
+            output_path = os.path.join(directory, "large.%s.rb.gcode" % mode)
+            process = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode, input_path,
+                                      output_path], stdout=subprocess.PIPE, universal_newlines=True, check=True)
+            record = json.loads(process.stdout)
+            digests.add(file_digest(output_path))
+            print("%-8s %8.2f s  %8.1f MB/s  peak RSS %8.1f MB" % (
+                mode, record["seconds"], input_mb / record["seconds"], record["peak_rss_mb"]))
+        if len(digests) != 1:
+            print("FAILED: the outputs differ")
+            return 1
+        return 0
+    finally:
+        if not arguments.keep:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+####################################################################
+# Benchmark and golden-output check for RoboxPostProcessing
+#
+#   python benchmarks/benchmark_postprocessing.py [--scale N] [--update-golden]
+#
+# Every corpus is run for both printer models with the close valve
+# option on and off, through both engines, with the layers as str and
+# as bytes (the engine shows as "/b"). The output of each run
+# (header + layers, as RoboxPrinterPlugin.write produces it) is
+# hashed and compared with benchmarks/golden.json; lines/s, MB/s and
+# the tracemalloc peak are reported. The str runs are also made with
+# the layers rewritten in parallel (iter_parallel, as --segment-jobs
+# does), which has to give the same output. Runs offline, Cura and Qt
+# are not needed.
+#
+# corpus/tool_words.gcode holds lines whose T words are removed by
+# the rewrite, which changes their E words ("E T100 T1" becomes
+# "E00"); scan_state has to find the same valve state for them.
+#
+# The golden digests are made with --scale 1, other scales only
+# report timings. --update-golden rewrites them from the regex
+# engine, which is the reference behaviour.
+####################################################################
+
+import argparse
+import concurrent.futures
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from plugin_loader import load_plugin_module
+
+RoboxPostProcessing = load_plugin_module("RoboxPostProcessing")
+
+benchmarks_path = os.path.dirname(os.path.abspath(__file__))
+golden_path = os.path.join(benchmarks_path, "golden.json")
+corpus_path = os.path.join(benchmarks_path, "corpus")
+
+
+# synthetic_layers - generates Cura-like layer chunks, kind is single_tool, dual_tool or heavy_retraction
+def synthetic_layers(kind: str, layers: int, moves: int, seed: int = 1):
+    generator = random.Random(seed)
+    chunks = []
+    tool = 0
+    for layer in range(layers):
+        lines = [";LAYER:%d" % layer, "G0 F3600 X%.3f Y%.3f Z%.2f" % (
+            generator.uniform(0, 200), generator.uniform(0, 200), 0.3 + layer * 0.2)]
+        if kind == "dual_tool" and layer > 0:
+            tool = 1 - tool
+            lines += ["T%d" % tool, "M104 S%d" % generator.choice((200, 210, 230)), "M109 S%d T%d" % (210, tool),
+                      "G1 F1500 E-6.5 T%d" % tool]
+        retraction_rate = 0.25 if kind == "heavy_retraction" else 0.02
+        lines.append(";TYPE:WALL-OUTER")
+        for move in range(moves):
+            if generator.random() < retraction_rate:
+                lines += ["G1 F1500 E-6.5",
+                          "G0 F3600 X%.3f Y%.3f" % (generator.uniform(0, 200), generator.uniform(0, 200)),
+                          "G1 F1500 E6.5"]
+            lines.append("G1 X%.3f Y%.3f E%.5f" % (generator.uniform(0, 200), generator.uniform(0, 200),
+                                                  generator.uniform(0.01, 0.2)))
+        chunks.append("\n".join(lines) + "\n")
+    return chunks
+
+
+# file_layers - splits a g-code file into chunks at its ;LAYER: lines, like Cura's gcode_list
+def file_layers(path: str):
+    with open(path, "r", encoding="utf-8") as source:
+        text = source.read()
+    chunks = []
+    start = 0
+    while True:
+        end = text.find("\n;LAYER:", start)
+        if end < 0:
+            chunks.append(text[start:])
+            return chunks
+        chunks.append(text[start:end + 1])
+        start = end + 1
+
+
+def corpora(scale: int):
+    return {
+        "single_tool": synthetic_layers("single_tool", 20 * scale, 2000),
+        "dual_tool": synthetic_layers("dual_tool", 20 * scale, 2000),
+        "heavy_retraction": synthetic_layers("heavy_retraction", 20 * scale, 2000),
+        "robox_dual_cube": file_layers(os.path.join(corpus_path, "robox_dual_cube.gcode")) * scale,
+        "tool_words": file_layers(os.path.join(corpus_path, "tool_words.gcode")) * scale,
+    }
+
+
+class HashingSink:
+    def __init__(self):
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.digest.update(data)
+        self.size += len(data)
+        return len(data)
+
+
+def run(chunks, model: str, close_valve: bool, engine):
+    processor = RoboxPostProcessing.RoboxPostProcessing(model, close_valve, engine)
+    sink = HashingSink()
+    sink.write(processor.get_header().encode())
+    for gcode in chunks:
+        processor.process_into(sink, gcode)
+    return sink
+
+
+# run_parallel - like run, with the layers rewritten by the executor from the states scan_state finds
+def run_parallel(chunks, model: str, close_valve: bool, engine, executor):
+    processor = RoboxPostProcessing.RoboxPostProcessing(model, close_valve, engine)
+    sink = HashingSink()
+    sink.write(processor.get_header().encode())
+    for block in processor.iter_parallel(chunks, executor):
+        sink.write(block.encode())
+    return sink
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark RoboxPostProcessing and check it against golden outputs")
+    parser.add_argument("--scale", type=int, default=1, help="multiplies the corpus sizes, golden check only at 1")
+    parser.add_argument("--update-golden", action="store_true", help="rewrite golden.json from the regex engine")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    arguments = parser.parse_args(argv)
+
+    golden = {}
+    if os.path.isfile(golden_path):
+        with open(golden_path, "r", encoding="utf-8") as f:
+            golden = json.load(f)
+    check_golden = arguments.scale == 1 and not arguments.update_golden
+
+    failures = 0
+    executor = concurrent.futures.ThreadPoolExecutor(4)
+    print("%-17s %-20s %-5s %-11s %10s %8s %9s %8s %7s" % ("corpus", "model", "valve", "engine", "lines/s", "MB/s",
+                                                            "peak MB", "parallel", "golden"))
+    for corpus_name, chunks in corpora(arguments.scale).items():
+        size = sum(len(chunk) for chunk in chunks)
+        lines = sum(chunk.count("\n") + 1 for chunk in chunks)
+        inputs = {"": chunks, "/b": [chunk.encode() for chunk in chunks]}
+        for model in RoboxPostProcessing.Model:
+            for close_valve in (True, False):
+                key = "%s/%s/%s" % (corpus_name, model.value, "close_valve" if close_valve else "open_valve")
+                for engine, input_label in itertools.product(RoboxPostProcessing.Engine, inputs):
+                    start = time.perf_counter()
+                    sink = run(inputs[input_label], model.value, close_valve, engine)
+                    seconds = time.perf_counter() - start
+                    digest = sink.digest.hexdigest()
+
+                    peak = float("nan")
+                    if not arguments.no_memory:
+                        tracemalloc.start()
+                        run(inputs[input_label], model.value, close_valve, engine)
+                        peak = tracemalloc.get_traced_memory()[1] / 1e6
+                        tracemalloc.stop()
+
+                    parallel = "-"
+                    if not input_label:  # iter_parallel takes the layers as str
+                        if run_parallel(chunks, model.value, close_valve, engine, executor).digest.hexdigest() == digest:
+                            parallel = "same"
+                        else:
+                            parallel = "FAILED"
+                            failures += 1
+
+                    if arguments.update_golden and engine == RoboxPostProcessing.Engine.regex and not input_label:
+                        golden[key] = digest
+                    status = "-"
+                    if check_golden:
+                        if key not in golden:
+                            status = "missing"
+                            failures += 1
+                        elif golden[key] == digest:
+                            status = "ok"
+                        else:
+                            status = "FAILED"
+                            failures += 1
+                    print("%-17s %-20s %-5s %-11s %10.0f %8.2f %9.1f %8s %7s" % (
+                        corpus_name, model.value, "close" if close_valve else "open", engine.value + input_label,
+                        lines / seconds,
+                        size / 1e6 / seconds, peak, parallel, status))
+
+    if arguments.update_golden:
+        with open(golden_path, "w", encoding="utf-8") as f:
+            json.dump(golden, f, indent=4, sort_keys=True)
+            f.write("\n")
+        print("golden outputs written to " + golden_path)
+    executor.shutdown()
+    if failures:
+        print("%d run(s) did not match the golden outputs or their serial output" % failures)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+####################################################################
+# Equivalence check and benchmark of the optional output stages
+#
+#   python benchmarks/benchmark_stages.py [--seed N] [--rounds N]
+#
+# CommandOptimizer, ValvePlanner and ToolChangePlanner may only
+# change how the printer gets somewhere, never what it prints. Each
+# corpus is post-processed for both printer models with the stages
+# off and on, and the g-code of both runs is simulated:
+# - CommandOptimizer and ValvePlanner get the output written in
+#   blocks of random size, cut anywhere in a line, --rounds times;
+#   the moves (position, feedrate, tool, extrusion), the other
+#   commands and the valve state wherever filament is pushed have to
+#   stay as they were. The valve planner keeps the valve open over
+#   travels up to 2 mm (the default), 100 mm or any length
+# - ToolChangePlanner (Robox Dual only) moves islands within a layer,
+#   so each layer has to print the same extrusions with the same tool,
+#   and the file has to switch nozzles as many times less as the
+#   planner reports
+# - all stages together have to print what ToolChangePlanner alone
+#   does
+# The committed corpora never give ToolChangePlanner a layer to
+# reorder, so layers with several islands of both tools per layer
+# are generated for it. The bytes and lines, valve actuations or
+# nozzle switches saved and the MB/s of each stage are reported, and
+# the script exits with 1 if any run is not equivalent.
+####################################################################
+
+import argparse
+import collections
+import io
+import random
+import sys
+import time
+
+from plugin_loader import load_plugin_module
+from benchmark_postprocessing import corpora
+
+RoboxPostProcessing = load_plugin_module("RoboxPostProcessing")
+
+checked_corpora = ("dual_tool", "heavy_retraction", "robox_dual_cube")
+valve_travels = (2.0, 100.0, float("inf"))
+
+
+# island_layers - generates layers whose islands are printed with T0 and T1 in random order, each island starts
+# retracted with a travel that sets X, Y, Z and F, like Cura writes them with relative extrusion
+def island_layers(layers: int, islands: int, seed: int = 1):
+    generator = random.Random(seed)
+    chunks = [";FLAVOR:RepRap\nM83\nG90\nG0 F3600 X0 Y0 Z0.3\nG1 F1500 E-6.5\n"]
+    for layer in range(layers):
+        z = "%.2f" % (0.3 + layer * 0.2)
+        lines = [";LAYER:%d" % layer]
+        for _ in range(generator.randint(1, islands)):
+            lines += ["T%d" % generator.randint(0, 1), "M104 S%d" % generator.choice((200, 210)),
+                      "G0 F%d X%.3f Y%.3f Z%s" % (generator.choice((3600, 7200)), generator.uniform(0, 200),
+                                                  generator.uniform(0, 200), z),
+                      "G1 F1500 E6.5", ";TYPE:WALL-OUTER"]
+            for _ in range(generator.randint(1, 40)):
+                lines.append("G1 F1200 X%.3f Y%.3f E%.5f" % (generator.uniform(0, 200), generator.uniform(0, 200),
+                                                            generator.uniform(0.01, 0.2)))
+            lines.append("G1 F1500 E-6.5")
+        lines.append(";TIME_ELAPSED:%.1f" % (layer * 12.5))
+        chunks.append("\n".join(lines) + "\n")
+    return chunks
+
+
+def _number(value: bytes):
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+# motion - the moves the printer makes (position, feedrate, tool and extrusion they end with), the other commands
+# in order and the valve state where filament is pushed; a retraction undone right away is no motion
+def motion(data: bytes):
+    position = dict.fromkeys((b"X", b"Y", b"Z"))
+    feedrate = tool = valve = None
+    relative = False
+    events = []
+    for line in data.split(b"\n"):
+        words = line.split(b";", 1)[0].split()
+        if not words:
+            continue
+        code = words[0]
+        if code == b"G0" or code == b"G1":
+            if len(words) == 1:  # a bare move ends somewhere unknown
+                position = dict.fromkeys(position)
+                events.append((code, feedrate))
+                continue
+            moved = False
+            amounts = []
+            for word in words[1:]:
+                letter, value = word[:1], _number(word[1:])
+                if letter == b"F":
+                    feedrate = value
+                elif letter in position:
+                    moved = moved or relative or position[letter] != value
+                    position[letter] = (position[letter], value) if relative else value
+                elif letter == b"B":
+                    valve = value
+                else:
+                    amounts.append((letter, value))
+            pushed = any(letter in b"ED" and isinstance(value, float) and value > 0 for letter, value in amounts)
+            if moved:
+                events.append((tuple(position.values()), feedrate, tool, tuple(amounts), valve if pushed else None))
+            elif amounts:
+                if (len(amounts) == 1 and events and events[-1][0] == b"extrude" and len(events[-1][1]) == 1 and
+                        events[-1][1][0][0] == amounts[0][0] and isinstance(amounts[0][1], float) and
+                        amounts[0][1] > 0 and events[-1][1][0][1] == -amounts[0][1]):
+                    events.pop()  # the retraction is undone before anything moved
+                else:
+                    events.append((b"extrude", tuple(amounts), feedrate, valve if pushed else None))
+        elif (code == b"T0" or code == b"T1") and len(words) == 1:
+            if code != tool:  # the nozzle switch moves the head
+                events.append((code,))
+                position = dict.fromkeys(position)
+            tool = code
+        else:
+            if code == b"G90" or code == b"G91":
+                relative = code == b"G91"
+            elif code == b"G92":
+                for word in words[1:]:
+                    if word[:1] in position:
+                        position[word[:1]] = _number(word[1:])
+            elif code[:1] == b"G" and code != b"G4":  # homing, arcs... end somewhere unknown
+                position = dict.fromkeys(position)
+            events.append(tuple(words))
+    events.append((b"end", tool, valve))
+    return events
+
+
+# layer_prints - per layer, what is printed with which tool: the extruding moves from where to where, the
+# retractions and the temperatures, in any order
+def layer_prints(data: bytes):
+    layers = []
+    prints = collections.Counter()
+    position = dict.fromkeys((b"X", b"Y", b"Z", b"F"))
+    tool = None
+    for line in data.split(b"\n"):
+        if line.lstrip().startswith(b";LAYER:"):
+            layers.append(prints)
+            prints = collections.Counter()
+        words = line.split(b";", 1)[0].split()
+        if not words:
+            continue
+        code = words[0]
+        if (code == b"T0" or code == b"T1") and len(words) == 1:
+            tool = code
+        elif code == b"G0" or code == b"G1":
+            start = tuple(position.values())
+            amounts = []
+            for word in words[1:]:
+                if word[:1] in position:
+                    position[word[:1]] = _number(word[1:])
+                elif word[:1] != b"B":
+                    amounts.append(word)
+            if amounts:
+                prints[(tool, start if start[:3] != tuple(position.values())[:3] else None,
+                        tuple(position.values()), tuple(amounts))] += 1
+        elif code[:1] == b"M":
+            prints[(tool,) + tuple(words)] += 1
+    layers.append(prints)
+    return layers
+
+
+# tool_switches - the nozzle switches of the g-code, the first tool select is not one
+def tool_switches(data: bytes) -> int:
+    return sum(1 for event in motion(data) if event[0] in (b"T0", b"T1")) - 1
+
+
+# random_blocks - data cut at random offsets into blocks from 1 byte to 64 kB
+def random_blocks(data: bytes, generator: random.Random):
+    start = 0
+    while start < len(data):
+        size = int(2 ** generator.uniform(0, 16))
+        yield data[start:start + size]
+        start += size
+
+
+# process - post-processes the layers like the export does, the tool planner reorders them first and the
+# streaming stages get the output in random blocks; returns the output and the seconds spent in the stages
+def process(chunks, model: str, generator: random.Random, tool_planner=None, stages=()):
+    processor = RoboxPostProcessing.RoboxPostProcessing(model, True)
+    output = io.BytesIO()
+    output.write(processor.get_header().encode())
+    processed = io.BytesIO()
+    seconds = 0.0
+    for gcode in chunks:
+        if tool_planner is not None:
+            start = time.perf_counter()
+            gcode = tool_planner.reorder(gcode, processor.selectedTool)
+            seconds += time.perf_counter() - start
+        processor.process_into(processed, gcode.encode())
+    data = processed.getvalue()
+    if not stages:
+        output.write(data)
+        return output.getvalue(), seconds
+    blocks = list(random_blocks(data, generator))
+    start = time.perf_counter()
+    stream = output
+    for stage in stages:
+        stream = stage.wrap(stream)
+    for block in blocks:
+        stream.write(block)
+    stream.finish()
+    return output.getvalue(), seconds + time.perf_counter() - start
+
+
+# checks - the runs checked for a model: name, whether the tool planner reorders the layers and a function making
+# the streaming stages, in the order the export wraps them
+def checks(model: str, generator: random.Random):
+    runs = [("CommandOptimizer", False, lambda: [RoboxPostProcessing.CommandOptimizer()])]
+    for travel in valve_travels:
+        runs.append(("ValvePlanner %g" % travel, False,
+                     lambda travel=travel: [RoboxPostProcessing.ValvePlanner(travel)]))
+    if model == RoboxPostProcessing.Model.dual.value:
+        runs.append(("ToolChangePlanner", True, list))
+        runs.append(("all", True, lambda: [RoboxPostProcessing.CommandOptimizer(),
+                                           RoboxPostProcessing.ValvePlanner(generator.choice(valve_travels))]))
+    return runs
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check that the optional output stages keep the printed result")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the block sizes and the generated layers")
+    parser.add_argument("--rounds", type=int, default=3, help="runs with other random block sizes per stage")
+    arguments = parser.parse_args(argv)
+
+    generator = random.Random(arguments.seed)
+    inputs = {name: chunks for name, chunks in corpora(1).items() if name in checked_corpora}
+    inputs["tool_islands"] = island_layers(40, 8, arguments.seed)
+
+    failures = 0
+    print("%-17s %-20s %-18s %10s %16s %8s %11s" % ("corpus", "model", "stage", "bytes", "saved", "MB/s", "result"))
+    for corpus_name, chunks in inputs.items():
+        for model in RoboxPostProcessing.Model:
+            plain, _ = process(chunks, model.value, generator)
+            expected_motion = {False: motion(plain)}
+            if model == RoboxPostProcessing.Model.dual:
+                expected_motion[True] = motion(process(chunks, model.value, generator,
+                                                       RoboxPostProcessing.ToolChangePlanner())[0])
+                plain_prints = layer_prints(plain)
+                plain_switches = tool_switches(plain)
+            for name, reorder, make_stages in checks(model.value, generator):
+                equivalent = True
+                best = float("inf")
+                for _ in range(arguments.rounds):
+                    tool_planner = RoboxPostProcessing.ToolChangePlanner() if reorder else None
+                    stages = make_stages()
+                    output, seconds = process(chunks, model.value, generator, tool_planner, stages)
+                    best = min(best, seconds)
+                    if stages:  # the same motion as without them
+                        equivalent = equivalent and motion(output) == expected_motion[reorder]
+                    if reorder:  # the islands are moved, what each layer prints stays
+                        switches = tool_planner.switches_before - tool_planner.switches_after
+                        equivalent = (equivalent and layer_prints(output) == plain_prints and
+                                      plain_switches - tool_switches(output) == switches)
+                if not stages:
+                    saved = "%d switches" % switches
+                elif isinstance(stages[-1], RoboxPostProcessing.ValvePlanner) and not reorder:
+                    saved = "%d actuations" % (2 * stages[-1].kept_open)
+                else:
+                    saved = "%d lines" % stages[0].as_dict()["lines_saved"]
+                if not equivalent:
+                    failures += 1
+                print("%-17s %-20s %-18s %10d %16s %8.2f %11s" % (
+                    corpus_name, model.value, name, len(plain) - len(output), saved,
+                    len(plain) / 1e6 / max(best, 1e-9), "equivalent" if equivalent else "FAILED"))
+
+    if failures:
+        print("%d stage run(s) changed what is printed" % failures)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6566 @@
+ ;FLAVOR:Marlin(Volumetric)
+ ;TIME:2430
+ ;Generated with Cura_SteamEngine 3.6.0
+T0
+M82  ;absolute extrusion mode
+T0  ; Select First tool - ensures post processing scripts function correctly.
+M83  ;Set Extruder to Relative moves  
+G90  ;Use X Y Z Absolute positioning - Home All Axes  
+M104 S150  ; Set nozzle to temp so any ooze is squished on bed probe in subsquent levelling macros  
+M140 S95.0  ; Start warming Bed  
+M109 
+ ; Wait for Nozzle to get to extruder temp.  
+G0  ; Go to Zero position  
+G0 Z5  ;Move up 5mm if homed  
+G28 Y  ;Home Y  
+G0 Y115  ;Position Y  
+G39  ;Clear the bed levelling points  
+G28 Z  ;Home Z  
+G0 Z10  ;Move up 10mm if homed  
+G28 X  ;Home X - End Home_all_Axis_in_sequence Macro  
+  
+M190 S95.0  ; Wait for Bed to get to temp.  
+M104 S200  ; Double check to ensure nozzle temp  
+M104 T200  ; Double check to ensure nozzle temp  
+M109 
+ ; Wait for Nozzle to get to extruder temp.  
+M170 S40  ; Set Ambient temp (40°C PLA higher for plastics that warp e.g. 70° for ABS  
+  
+M128  ; Head light off to warn before move - Start of LED flash alert macro  
+G4 P300  ; Hold for 300 milliseconds  
+M129  ; Headlight on  
+G4 P600  ; Hold light on for 600 msecs  
+M128  ; Head light off  
+G4 P300  ; Pause for 300 miliiseconds  
+M129  ; Headlight on  
+G4 P600  ; Hold light on for 600 msecs  
+M128  ; Head light off  
+G4 P300  ; Pause for 300 miliiseconds  
+M129  ; Head light on  
+G0 Y2 X105  ; Move to front - Remove leftover ooze macro  
+M129  ; Head LED on - to see better  
+G0 Z10  ; Lift head 10mm to make it easier to remove ooze with tweezers  
+G4 P7000  ; Hold for 7000 milliseconds to remove old ooze  
+M128  ; Head light off to warn before move - Start of LED flash alert macro  
+G4 P300  ; Hold for 300 milliseconds  
+M129  ; Headlight on  
+G4 P600  ; Hold light on for 600 msecs  
+M128  ; Head light off  
+G4 P300  ; Pause for 300 miliiseconds  
+M129  ; Headlight on  
+G4 P600  ; Hold light on for 600 msecs  
+M128  ; Head light off  
+G4 P300  ; Pause for 300 miliiseconds  
+M129  ; Head light on  
+  
+ ;Ensure the Gantry is Level  
+G0 X20 Y75  ;Level Gantry Position 1  
+G28 Z  ;Home Z  
+G0 Z4  ;Move up 4mm  
+G0 X180 Y75  ;Level Gantry Position 2  
+G28 Z  ;Home Z  
+G0 Z4  ;Move up 4mm  
+G38  ;Level gantry   
+  
+ ; 7 point Bed probing  
+G0 Y20  
+G28 Z  
+G0 Z2  
+G0 X105  
+G28 Z  
+G0 Z2  
+G0 X20  
+G28 Z  
+G0 Z2  
+G0 Y130  
+G28 Z  
+G0 Z2  
+G0 X105  
+G28 Z  
+G0 Z2  
+G0 X180  
+G28 Z  
+G0 Z2  
+G0 X105 Y75  
+G28 Z  
+G0 Z2  
+G39 S0.5  ;set washout over the first 2mm   
+  
+ ; Purge Nozzles   
+ ; Purge T1(Dual Material)  
+G0 X180 Y2 Z0.4 ; 0.4mm before drag printhead into extrusion to pull off surplus  
+T1  
+G0 B1  
+G1 E5 F500  ; UnRetract the retract from retract at end of previous print  
+G36 E100 F1200 ;   
+G1 E100 X145 F250  
+G0 Z1  
+G0 B0  
+  
+  
+ ;Purge T0 (Dual Material)  
+G0 X70 Y2 Z0.4 ; 0.4mm before drag printhead into extrusion to pull off surplus  
+T0  
+G0 B1  
+G1 D5 F500  ; UnRetract the retract from retract at end of previous print  
+G36 D100 F1200 ;   
+G1 D100 X110 F250  
+G0 Z1  
+G0 B0  
+ ; End of Start gcode  
+T0   ;
+M83  ;relative extrusion mode
+G10
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+ ;LAYER_COUNT:73
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:0
+M107
+M104 S250 T1
+G0 F3600 X80.865 Y64.631 Z0.3
+ ;TYPE:SKIRT
+G11
+G1 F1200 X81.076 Y64.42 E0.05371
+G1 X81.347 Y64.206 E0.06216
+G1 X81.661 Y64.059 E0.06241
+G1 X82.137 Y63.981 E0.08682
+G1 X109.863 Y63.981 E4.99068
+G1 X110.207 Y64.021 E0.06234
+G1 X110.532 Y64.138 E0.06218
+G1 X110.924 Y64.42 E0.08692
+G1 X111.135 Y64.631 E0.05371
+G1 X111.349 Y64.902 E0.06216
+G1 X111.496 Y65.216 E0.06241
+G1 X111.574 Y65.692 E0.08682
+G1 X111.574 Y90.308 E4.43088
+G1 X111.534 Y90.652 E0.06234
+G1 X111.417 Y90.977 E0.06218
+G1 X111.135 Y91.369 E0.08692
+G1 X110.924 Y91.58 E0.05371
+G1 X110.653 Y91.794 E0.06216
+G1 X110.339 Y91.941 E0.06241
+G1 X109.863 Y92.019 E0.08682
+G1 X82.137 Y92.019 E4.99068
+G1 X81.793 Y91.979 E0.06234
+G1 X81.468 Y91.862 E0.06218
+G1 X81.076 Y91.58 E0.08692
+G1 X80.865 Y91.369 E0.05371
+G1 X80.651 Y91.098 E0.06216
+G1 X80.504 Y90.784 E0.06241
+G1 X80.426 Y90.308 E0.08682
+G1 X80.426 Y65.692 E4.43088
+G1 X80.466 Y65.348 E0.06234
+G1 X80.583 Y65.023 E0.06218
+G1 X80.865 Y64.631 E0.08692
+G0 F3600 X81.29 Y65.056
+G1 F1200 X81.501 Y64.845 E0.05371
+G1 X81.716 Y64.686 E0.04813
+G1 X81.968 Y64.597 E0.04811
+G1 X82.137 Y64.581 E0.03056
+G1 X109.863 Y64.581 E4.99068
+G1 X110.128 Y64.621 E0.04824
+G1 X110.369 Y64.737 E0.04814
+G1 X110.499 Y64.845 E0.03042
+G1 X110.71 Y65.056 E0.05371
+G1 X110.869 Y65.271 E0.04813
+G1 X110.958 Y65.523 E0.04811
+G1 X110.974 Y65.692 E0.03056
+G1 X110.974 Y90.308 E4.43088
+G1 X110.934 Y90.573 E0.04824
+G1 X110.818 Y90.814 E0.04814
+G1 X110.71 Y90.944 E0.03042
+G1 X110.499 Y91.155 E0.05371
+G1 X110.284 Y91.314 E0.04813
+G1 X110.032 Y91.403 E0.04811
+G1 X109.863 Y91.419 E0.03056
+G1 X82.137 Y91.419 E4.99068
+G1 X81.872 Y91.379 E0.04824
+G1 X81.631 Y91.263 E0.04814
+G1 X81.501 Y91.155 E0.03042
+G1 X81.29 Y90.944 E0.05371
+G1 X81.131 Y90.729 E0.04813
+G1 X81.042 Y90.477 E0.04811
+G1 X81.026 Y90.308 E0.03056
+G1 X81.026 Y65.692 E4.43088
+G1 X81.066 Y65.427 E0.04824
+G1 X81.182 Y65.186 E0.04814
+G1 X81.29 Y65.056 E0.03042
+G0 F3600 X81.714 Y65.48
+M104 S185
+G1 F1200 X81.925 Y65.269 E0.05371
+G1 X82.058 Y65.192 E0.02766
+G1 X82.137 Y65.181 E0.01436
+G1 X109.863 Y65.181 E4.99068
+G1 X110.012 Y65.22 E0.02772
+G1 X110.075 Y65.269 E0.01437
+G1 X110.286 Y65.48 E0.05371
+G1 X110.363 Y65.613 E0.02766
+G1 X110.374 Y65.692 E0.01436
+G1 X110.374 Y90.308 E4.43088
+G1 X110.335 Y90.457 E0.02772
+G1 X110.286 Y90.52 E0.01437
+G1 X110.075 Y90.731 E0.05371
+G1 X109.942 Y90.808 E0.02766
+G1 X109.863 Y90.819 E0.01436
+G1 X82.137 Y90.819 E4.99068
+G1 X81.988 Y90.78 E0.02772
+G1 X81.925 Y90.731 E0.01437
+G1 X81.714 Y90.52 E0.05371
+G1 X81.637 Y90.387 E0.02766
+G1 X81.626 Y90.308 E0.01436
+G1 X81.626 Y65.692 E4.43088
+G1 X81.665 Y65.543 E0.02772
+G1 X81.714 Y65.48 E0.01437
+G10
+ ;MESH:2_color_box_a.STL
+G0 F3600 X81.455 Y65.223
+G0 X81.265 Y65.418
+G0 X81.265 Y90.582
+G0 X81.863 Y91.18
+G0 X101.714 Y91.184
+G0 X101.714 Y85.48
+T1
+M109 T250
+M104 S175 T0
+G0 F1600 X121.714 Y105.48 Z0.3
+G10
+G0 X121.714 Y115.48
+G0 X111.548 Y93.7
+ ;TYPE:SKIRT
+G11
+G1 F1200 X111.057 Y93.915 E0.11578
+G1 X110.539 Y94.055 E0.1159
+G1 X109.863 Y94.119 E0.14667
+G1 X82.137 Y94.119 E5.98882
+G1 X81.602 Y94.079 E0.11588
+G1 X81.079 Y93.96 E0.11586
+G1 X80.58 Y93.765 E0.11572
+G1 X80.115 Y93.497 E0.11593
+G1 X79.591 Y93.065 E0.14669
+G1 X79.38 Y92.854 E0.06445
+G1 X79.031 Y92.447 E0.11581
+G1 X78.745 Y91.993 E0.1159
+G1 X78.53 Y91.502 E0.11578
+G1 X78.39 Y90.984 E0.1159
+G1 X78.326 Y90.308 E0.14667
+G1 X78.326 Y65.692 E5.31706
+G1 X78.366 Y65.157 E0.11588
+G1 X78.485 Y64.634 E0.11586
+G1 X78.68 Y64.135 E0.11572
+G1 X78.948 Y63.67 E0.11593
+G1 X79.38 Y63.146 E0.14669
+G1 X79.591 Y62.935 E0.06445
+G1 X79.998 Y62.586 E0.11581
+G1 X80.452 Y62.3 E0.1159
+G1 X80.943 Y62.085 E0.11578
+G1 X81.461 Y61.945 E0.1159
+G1 X82.137 Y61.881 E0.14667
+G1 X109.863 Y61.881 E5.98882
+G1 X110.398 Y61.921 E0.11588
+G1 X110.921 Y62.04 E0.11586
+G1 X111.42 Y62.235 E0.11572
+G1 X111.885 Y62.503 E0.11593
+G1 X112.409 Y62.935 E0.14669
+G1 X112.62 Y63.146 E0.06445
+G1 X112.969 Y63.553 E0.11581
+G1 X113.255 Y64.007 E0.1159
+G1 X113.47 Y64.498 E0.11578
+G1 X113.61 Y65.016 E0.1159
+G1 X113.674 Y65.692 E0.14667
+G1 X113.674 Y90.308 E5.31706
+G1 X113.634 Y90.843 E0.11588
+G1 X113.515 Y91.366 E0.11586
+G1 X113.32 Y91.865 E0.11572
+G1 X113.052 Y92.33 E0.11593
+G1 X112.62 Y92.854 E0.14669
+G1 X112.409 Y93.065 E0.06445
+G1 X112.002 Y93.414 E0.11581
+G1 X111.548 Y93.7 E0.1159
+G0 F1600 X111.121 Y93.11
+G1 F1200 X110.673 Y93.283 E0.10373
+G1 X110.204 Y93.379 E0.1034
+G1 X109.863 Y93.399 E0.07378
+G1 X82.137 Y93.399 E5.98882
+G1 X81.659 Y93.359 E0.10361
+G1 X81.194 Y93.24 E0.10368
+G1 X80.756 Y93.046 E0.10347
+G1 X80.356 Y92.782 E0.10352
+G1 X80.101 Y92.555 E0.07374
+G1 X79.89 Y92.344 E0.06445
+G1 X79.58 Y91.978 E0.1036
+G1 X79.335 Y91.566 E0.10354
+G1 X79.162 Y91.118 E0.10373
+G1 X79.066 Y90.649 E0.1034
+G1 X79.046 Y90.308 E0.07378
+G1 X79.046 Y65.692 E5.31706
+G1 X79.086 Y65.214 E0.10361
+G1 X79.205 Y64.749 E0.10368
+G1 X79.399 Y64.311 E0.10347
+G1 X79.663 Y63.911 E0.10352
+G1 X79.89 Y63.656 E0.07374
+G1 X80.101 Y63.445 E0.06445
+G1 X80.467 Y63.135 E0.1036
+G1 X80.879 Y62.89 E0.10354
+G1 X81.327 Y62.717 E0.10373
+G1 X81.796 Y62.621 E0.1034
+G1 X82.137 Y62.601 E0.07378
+G1 X109.863 Y62.601 E5.98882
+G1 X110.341 Y62.641 E0.10361
+G1 X110.806 Y62.76 E0.10368
+G1 X111.244 Y62.954 E0.10347
+G1 X111.644 Y63.218 E0.10352
+G1 X111.899 Y63.445 E0.07374
+G1 X112.11 Y63.656 E0.06445
+G1 X112.42 Y64.022 E0.1036
+G1 X112.665 Y64.434 E0.10354
+G1 X112.838 Y64.882 E0.10373
+G1 X112.934 Y65.351 E0.1034
+G1 X112.954 Y65.692 E0.07378
+G1 X112.954 Y90.308 E5.31706
+G1 X112.914 Y90.786 E0.10361
+G1 X112.795 Y91.251 E0.10368
+G1 X112.601 Y91.689 E0.10347
+G1 X112.337 Y92.089 E0.10352
+G1 X112.11 Y92.344 E0.07374
+G1 X111.899 Y92.555 E0.06445
+G1 X111.533 Y92.865 E0.1036
+G1 X111.121 Y93.11 E0.10354
+G0 F1600 X110.705 Y92.508
+G1 F1200 X110.309 Y92.633 E0.0897
+G1 X109.863 Y92.679 E0.09685
+G1 X82.137 Y92.679 E5.98882
+G1 X81.724 Y92.639 E0.08963
+G1 X81.326 Y92.521 E0.08967
+G1 X80.958 Y92.329 E0.08966
+G1 X80.61 Y92.046 E0.09689
+G1 X80.399 Y91.835 E0.06445
+G1 X80.135 Y91.515 E0.08961
+G1 X79.937 Y91.15 E0.08969
+G1 X79.812 Y90.754 E0.0897
+G1 X79.766 Y90.308 E0.09685
+G1 X79.766 Y65.692 E5.31706
+G1 X79.806 Y65.279 E0.08963
+G1 X79.924 Y64.881 E0.08967
+G1 X80.116 Y64.513 E0.08966
+G1 X80.399 Y64.165 E0.09689
+G1 X80.61 Y63.954 E0.06445
+G1 X80.93 Y63.69 E0.08961
+G1 X81.295 Y63.492 E0.08969
+G1 X81.691 Y63.367 E0.0897
+G1 X82.137 Y63.321 E0.09685
+G1 X109.863 Y63.321 E5.98882
+G1 X110.276 Y63.361 E0.08963
+G1 X110.674 Y63.479 E0.08967
+G1 X111.042 Y63.671 E0.08966
+G1 X111.39 Y63.954 E0.09689
+G1 X111.601 Y64.165 E0.06445
+G1 X111.865 Y64.485 E0.08961
+G1 X112.063 Y64.85 E0.08969
+G1 X112.188 Y65.246 E0.0897
+G1 X112.234 Y65.692 E0.09685
+G1 X112.234 Y90.308 E5.31706
+G1 X112.194 Y90.721 E0.08963
+G1 X112.076 Y91.119 E0.08967
+G1 X111.884 Y91.487 E0.08966
+G1 X111.601 Y91.835 E0.09689
+G1 X111.39 Y92.046 E0.06445
+G1 X111.07 Y92.31 E0.08961
+G1 X110.705 Y92.508 E0.08969
+G10
+G0 F1600 X108.98 Y89.425
+G0 X108.924 Y89.369
+G0 X109.714 Y90.159
+ ;TYPE:WALL-OUTER
+G11
+G1 F600 X82.286 Y90.159 E5.92445
+G1 X82.286 Y65.841 E5.25269
+G1 X109.714 Y65.841 E5.92445
+G1 X109.714 Y90.159 E5.25269
+G0 F1600 X109.414 Y90.159
+G0 X108.994 Y89.439
+ ;TYPE:WALL-INNER
+G1 F600 X83.006 Y89.439 E5.61341
+G1 X83.006 Y66.561 E4.94165
+G1 X108.994 Y66.561 E5.61341
+G1 X108.994 Y89.439 E4.94165
+G0 F1600 X108.274 Y88.719
+G1 F600 X83.726 Y88.719 E5.30237
+G1 X83.726 Y67.281 E4.63061
+G1 X108.274 Y67.281 E5.30237
+G1 X108.274 Y88.719 E4.63061
+G0 F1600 X107.564 Y88.009
+ ;TYPE:SKIN
+G1 F600 X84.436 Y88.009 E4.99565
+G1 X84.436 Y67.991 E4.32389
+G1 X107.564 Y67.991 E4.99565
+G1 X107.564 Y88.009 E4.32389
+G0 F1600 X107.233 Y68.54
+G1 F600 X107.014 Y68.321 E0.0669
+G0 F1600 X105.996 Y68.321
+G1 F600 X107.233 Y69.558 E0.37787
+G0 F1600 X107.233 Y70.577
+G1 F600 X104.977 Y68.321 E0.68914
+G0 F1600 X103.959 Y68.321
+G1 F600 X107.233 Y71.595 E1.00011
+G0 F1600 X107.233 Y72.613
+G1 F600 X102.941 Y68.321 E1.31108
+G0 F1600 X101.923 Y68.321
+G1 F600 X107.233 Y73.631 E1.62205
+G0 F1600 X107.233 Y74.649
+G1 F600 X100.904 Y68.321 E1.93317
+G0 F1600 X99.886 Y68.321
+G1 F600 X107.233 Y75.668 E2.24429
+G0 F1600 X107.233 Y76.686
+G1 F600 X98.868 Y68.321 E2.55526
+G0 F1600 X97.85 Y68.321
+G1 F600 X107.233 Y77.704 E2.86623
+G0 F1600 X107.233 Y78.722
+G1 F600 X96.831 Y68.321 E3.17735
+G0 F1600 X95.813 Y68.321
+G1 F600 X107.233 Y79.741 E3.48847
+G0 F1600 X107.233 Y80.759
+G1 F600 X94.795 Y68.321 E3.79944
+G0 F1600 X93.777 Y68.321
+G1 F600 X107.233 Y81.777 E4.11041
+G0 F1600 X107.233 Y82.795
+G1 F600 X92.758 Y68.321 E4.42153
+G0 F1600 X91.74 Y68.321
+G1 F600 X107.233 Y83.814 E4.73265
+G0 F1600 X107.233 Y84.832
+G1 F600 X90.722 Y68.321 E5.04362
+G0 F1600 X89.704 Y68.321
+G1 F600 X107.233 Y85.85 E5.35459
+G0 F1600 X107.233 Y86.868
+G1 F600 X88.686 Y68.321 E5.66555
+G0 F1600 X87.667 Y68.321
+G1 F600 X107.024 Y87.678 E5.91299
+G0 F1600 X106.006 Y87.678
+G1 F600 X86.649 Y68.321 E5.91299
+G0 F1600 X85.631 Y68.321
+G1 F600 X104.988 Y87.678 E5.91299
+G0 F1600 X103.97 Y87.678
+G1 F600 X84.765 Y68.473 E5.86655
+G0 F1600 X84.765 Y69.491
+G1 F600 X102.951 Y87.678 E5.55543
+G0 F1600 X101.933 Y87.678
+G1 F600 X84.765 Y70.509 E5.24446
+G0 F1600 X84.765 Y71.528
+G1 F600 X100.915 Y87.678 E4.93334
+G0 F1600 X99.897 Y87.678
+G1 F600 X84.765 Y72.546 E4.62237
+G0 F1600 X84.765 Y73.564
+G1 F600 X98.878 Y87.678 E4.31125
+G0 F1600 X97.86 Y87.678
+G1 F600 X84.765 Y74.582 E4.00028
+G0 F1600 X84.765 Y75.601
+G1 F600 X96.842 Y87.678 E3.68916
+G0 F1600 X95.824 Y87.678
+G1 F600 X84.765 Y76.619 E3.37819
+G0 F1600 X84.765 Y77.637
+G1 F600 X94.806 Y87.678 E3.06723
+G0 F1600 X93.787 Y87.678
+G1 F600 X84.765 Y78.656 E2.75595
+G0 F1600 X84.765 Y79.674
+G1 F600 X92.769 Y87.678 E2.44498
+G0 F1600 X91.751 Y87.678
+G1 F600 X84.765 Y80.692 E2.13401
+G0 F1600 X84.765 Y81.711
+G1 F600 X90.733 Y87.678 E1.82289
+G0 F1600 X89.714 Y87.678
+G1 F600 X84.765 Y82.729 E1.51177
+G0 F1600 X84.765 Y83.747
+G1 F600 X88.696 Y87.678 E1.2008
+G0 F1600 X87.678 Y87.678
+G1 F600 X84.765 Y84.765 E0.88983
+G0 F1600 X84.765 Y85.784
+G1 F600 X86.66 Y87.678 E0.57871
+G0 F1600 X85.641 Y87.678
+G1 F600 X84.765 Y86.802 E0.26759
+ ;MESH:NONMESH
+G0 F1600 X108.574 Y89.019
+ ;TIME_ELAPSED:149.649014
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:1
+M140 S95
+M106 S255
+ ;MESH:2_color_box_a.STL
+G0 F3200 X108.574 Y89.019 Z0.6
+ ;TYPE:WALL-INNER
+G1 F1200 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F3200 X109.174 Y89.619
+G1 F1200 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F3200 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1200 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F3200 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F750 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F3200 X107.713 Y87.447
+G1 F750 X107.002 Y88.159 E0.18112
+G0 F3200 X106.153 Y88.159
+G1 F750 X107.713 Y86.599 E0.39711
+G0 F3200 X107.713 Y85.75
+G1 F750 X105.305 Y88.159 E0.6131
+G0 F3200 X104.456 Y88.159
+G1 F750 X107.713 Y84.902 E0.8291
+G0 F3200 X107.713 Y84.053
+G1 F750 X103.608 Y88.159 E1.04509
+G0 F3200 X102.759 Y88.159
+G1 F750 X107.713 Y83.205 E1.26108
+G0 F3200 X107.713 Y82.356
+G1 F750 X101.911 Y88.159 E1.47708
+G0 F3200 X101.062 Y88.159
+G1 F750 X107.713 Y81.508 E1.69307
+G0 F3200 X107.713 Y80.659
+G1 F750 X100.214 Y88.159 E1.90906
+G0 F3200 X99.365 Y88.159
+G1 F750 X107.713 Y79.811 E2.12505
+G0 F3200 X107.713 Y78.962
+G1 F750 X98.516 Y88.159 E2.34117
+G0 F3200 X97.668 Y88.159
+G1 F750 X107.713 Y78.114 E2.55704
+G0 F3200 X107.713 Y77.265
+G1 F750 X96.819 Y88.159 E2.77316
+G0 F3200 X95.971 Y88.159
+G1 F750 X107.713 Y76.417 E2.98903
+G0 F3200 X107.713 Y75.568
+G1 F750 X95.122 Y88.159 E3.20515
+G0 F3200 X94.274 Y88.159
+G1 F750 X107.713 Y74.719 E3.42114
+G0 F3200 X107.713 Y73.871
+G1 F750 X93.425 Y88.159 E3.63713
+G0 F3200 X92.577 Y88.159
+G1 F750 X107.713 Y73.022 E3.85312
+G0 F3200 X107.713 Y72.174
+G1 F750 X91.728 Y88.159 E4.06912
+G0 F3200 X90.88 Y88.159
+G1 F750 X107.713 Y71.325 E4.28511
+G0 F3200 X107.713 Y70.477
+G1 F750 X90.031 Y88.159 E4.5011
+G0 F3200 X89.183 Y88.159
+G1 F750 X107.713 Y69.628 E4.7171
+G0 F3200 X107.713 Y68.78
+G1 F750 X88.334 Y88.159 E4.93309
+G0 F3200 X87.486 Y88.159
+G1 F750 X107.713 Y67.931 E5.14908
+G0 F3200 X106.955 Y67.841
+G1 F750 X86.637 Y88.159 E5.17212
+G0 F3200 X85.789 Y88.159
+G1 F750 X106.107 Y67.841 E5.17212
+G0 F3200 X105.258 Y67.841
+G1 F750 X84.94 Y88.159 E5.17212
+G0 F3200 X84.286 Y87.964
+G1 F750 X104.409 Y67.841 E5.12248
+G0 F3200 X103.561 Y67.841
+G1 F750 X84.286 Y87.116 E4.90661
+G0 F3200 X84.286 Y86.267
+G1 F750 X102.712 Y67.841 E4.69049
+G0 F3200 X101.864 Y67.841
+G1 F750 X84.286 Y85.419 E4.47463
+G0 F3200 X84.286 Y84.57
+G1 F750 X101.015 Y67.841 E4.25851
+G0 F3200 X100.167 Y67.841
+G1 F750 X84.286 Y83.722 E4.04264
+G0 F3200 X84.286 Y82.873
+G1 F750 X99.318 Y67.841 E3.82652
+G0 F3200 X98.47 Y67.841
+G1 F750 X84.286 Y82.025 E3.61066
+G0 F3200 X84.286 Y81.176
+G1 F750 X97.621 Y67.841 E3.39454
+G0 F3200 X96.773 Y67.841
+G1 F750 X84.286 Y80.328 E3.17867
+G0 F3200 X84.286 Y79.479
+G1 F750 X95.924 Y67.841 E2.96255
+G0 F3200 X95.076 Y67.841
+G1 F750 X84.286 Y78.63 E2.74656
+G0 F3200 X84.286 Y77.782
+G1 F750 X94.227 Y67.841 E2.53057
+G0 F3200 X93.379 Y67.841
+G1 F750 X84.286 Y76.933 E2.31457
+G0 F3200 X84.286 Y76.085
+G1 F750 X92.53 Y67.841 E2.09858
+G0 F3200 X91.682 Y67.841
+G1 F750 X84.286 Y75.236 E1.88259
+G0 F3200 X84.286 Y74.388
+G1 F750 X90.833 Y67.841 E1.66659
+G0 F3200 X89.984 Y67.841
+G1 F750 X84.286 Y73.539 E1.45047
+G0 F3200 X84.286 Y72.691
+G1 F750 X89.136 Y67.841 E1.23461
+G0 F3200 X88.287 Y67.841
+G1 F750 X84.286 Y71.842 E1.01849
+G0 F3200 X84.286 Y70.994
+G1 F750 X87.439 Y67.841 E0.80262
+G0 F3200 X86.59 Y67.841
+G1 F750 X84.286 Y70.145 E0.5865
+G0 F3200 X84.286 Y69.297
+G1 F750 X85.742 Y67.841 E0.37064
+G0 F3200 X84.893 Y67.841
+G1 F750 X84.286 Y68.448 E0.15452
+ ;MESH:NONMESH
+G0 F3200 X108.574 Y89.019
+ ;TIME_ELAPSED:237.308968
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:2
+ ;MESH:2_color_box_a.STL
+G0 F4800 X108.574 Y89.019 Z0.9
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y68.681
+G1 F900 X106.873 Y67.841 E0.21383
+G0 F4800 X106.025 Y67.841
+G1 F900 X107.713 Y69.529 E0.42969
+G0 F4800 X107.713 Y70.378
+G1 F900 X105.176 Y67.841 E0.64581
+G0 F4800 X104.327 Y67.841
+G1 F900 X107.713 Y71.226 E0.86181
+G0 F4800 X107.713 Y72.075
+G1 F900 X103.479 Y67.841 E1.0778
+G0 F4800 X102.63 Y67.841
+G1 F900 X107.713 Y72.923 E1.29379
+G0 F4800 X107.713 Y73.772
+G1 F900 X101.782 Y67.841 E1.50979
+G0 F4800 X100.933 Y67.841
+G1 F900 X107.713 Y74.62 E1.72578
+G0 F4800 X107.713 Y75.469
+G1 F900 X100.085 Y67.841 E1.94177
+G0 F4800 X99.236 Y67.841
+G1 F900 X107.713 Y76.318 E2.15789
+G0 F4800 X107.713 Y77.166
+G1 F900 X98.388 Y67.841 E2.37376
+G0 F4800 X97.539 Y67.841
+G1 F900 X107.713 Y78.015 E2.58988
+G0 F4800 X107.713 Y78.863
+G1 F900 X96.691 Y67.841 E2.80574
+G0 F4800 X95.842 Y67.841
+G1 F900 X107.713 Y79.712 E3.02186
+G0 F4800 X107.713 Y80.56
+G1 F900 X94.994 Y67.841 E3.23773
+G0 F4800 X94.145 Y67.841
+G1 F900 X107.713 Y81.409 E3.45385
+G0 F4800 X107.713 Y82.257
+G1 F900 X93.297 Y67.841 E3.66971
+G0 F4800 X92.448 Y67.841
+G1 F900 X107.713 Y83.106 E3.88583
+G0 F4800 X107.713 Y83.954
+G1 F900 X91.6 Y67.841 E4.1017
+G0 F4800 X90.751 Y67.841
+G1 F900 X107.713 Y84.803 E4.31782
+G0 F4800 X107.713 Y85.651
+G1 F900 X89.902 Y67.841 E4.53381
+G0 F4800 X89.054 Y67.841
+G1 F900 X107.713 Y86.5 E4.74981
+G0 F4800 X107.713 Y87.348
+G1 F900 X88.205 Y67.841 E4.9658
+G0 F4800 X87.357 Y67.841
+G1 F900 X107.674 Y88.158 E5.17186
+G0 F4800 X106.826 Y88.158
+G1 F900 X86.508 Y67.841 E5.17199
+G0 F4800 X85.66 Y67.841
+G1 F900 X105.977 Y88.158 E5.17186
+G0 F4800 X105.129 Y88.158
+G1 F900 X84.811 Y67.841 E5.17199
+G0 F4800 X84.285 Y68.163
+G1 F900 X104.28 Y88.158 E5.0899
+G0 F4800 X103.432 Y88.158
+G1 F900 X84.285 Y69.012 E4.8739
+G0 F4800 X84.285 Y69.86
+G1 F900 X102.583 Y88.158 E4.65791
+G0 F4800 X101.734 Y88.158
+G1 F900 X84.285 Y70.709 E4.44179
+G0 F4800 X84.285 Y71.557
+G1 F900 X100.886 Y88.158 E4.22592
+G0 F4800 X100.037 Y88.158
+G1 F900 X84.285 Y72.406 E4.0098
+G0 F4800 X84.285 Y73.254
+G1 F900 X99.189 Y88.158 E3.79394
+G0 F4800 X98.34 Y88.158
+G1 F900 X84.285 Y74.103 E3.57782
+G0 F4800 X84.285 Y74.951
+G1 F900 X97.492 Y88.158 E3.36195
+G0 F4800 X96.643 Y88.158
+G1 F900 X84.285 Y75.8 E3.14583
+G0 F4800 X84.285 Y76.648
+G1 F900 X95.795 Y88.158 E2.92997
+G0 F4800 X94.946 Y88.158
+G1 F900 X84.285 Y77.497 E2.71385
+G0 F4800 X84.285 Y78.346
+G1 F900 X94.098 Y88.158 E2.49785
+G0 F4800 X93.249 Y88.158
+G1 F900 X84.285 Y79.194 E2.28186
+G0 F4800 X84.285 Y80.043
+G1 F900 X92.401 Y88.158 E2.06587
+G0 F4800 X91.552 Y88.158
+G1 F900 X84.285 Y80.891 E1.84988
+G0 F4800 X84.285 Y81.74
+G1 F900 X90.704 Y88.158 E1.63388
+G0 F4800 X89.855 Y88.158
+G1 F900 X84.285 Y82.588 E1.41789
+G0 F4800 X84.285 Y83.437
+G1 F900 X89.007 Y88.158 E1.2019
+G0 F4800 X88.158 Y88.158
+G1 F900 X84.285 Y84.285 E0.9859
+G0 F4800 X84.285 Y85.134
+G1 F900 X87.31 Y88.158 E0.76991
+G0 F4800 X86.461 Y88.158
+G1 F900 X84.285 Y85.982 E0.55392
+G0 F4800 X84.285 Y86.831
+G1 F900 X85.612 Y88.158 E0.3378
+G0 F4800 X84.764 Y88.158
+G1 F900 X84.285 Y87.679 E0.12193
+ ;MESH:NONMESH
+G0 F4800 X85.219 Y67.221
+ ;TIME_ELAPSED:308.139380
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:3
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z1.2
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:325.378400
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:4
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z1.5
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:342.617419
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:5
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z1.8
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:359.856439
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:6
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z2.1
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:377.095458
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:7
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z2.4
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:394.334478
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:8
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z2.7
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:411.573497
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:9
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z3
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:428.812517
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:10
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z3.3
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X108.574 Y89.019
+ ;TIME_ELAPSED:445.654396
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:11
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z3.6
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y87.447
+G1 F900 X107.002 Y88.159 E0.18112
+G0 F4800 X106.153 Y88.159
+G1 F900 X107.713 Y86.599 E0.39711
+G0 F4800 X107.713 Y85.75
+G1 F900 X105.305 Y88.159 E0.6131
+G0 F4800 X104.456 Y88.159
+G1 F900 X107.713 Y84.902 E0.8291
+G0 F4800 X107.713 Y84.053
+G1 F900 X103.608 Y88.159 E1.04509
+G0 F4800 X102.759 Y88.159
+G1 F900 X107.713 Y83.205 E1.26108
+G0 F4800 X107.713 Y82.356
+G1 F900 X101.911 Y88.159 E1.47708
+G0 F4800 X101.062 Y88.159
+G1 F900 X107.713 Y81.508 E1.69307
+G0 F4800 X107.713 Y80.659
+G1 F900 X100.214 Y88.159 E1.90906
+G0 F4800 X99.365 Y88.159
+G1 F900 X107.713 Y79.811 E2.12505
+G0 F4800 X107.713 Y78.962
+G1 F900 X98.516 Y88.159 E2.34117
+G0 F4800 X97.668 Y88.159
+G1 F900 X107.713 Y78.114 E2.55704
+G0 F4800 X107.713 Y77.265
+G1 F900 X96.819 Y88.159 E2.77316
+G0 F4800 X95.971 Y88.159
+G1 F900 X107.713 Y76.417 E2.98903
+G0 F4800 X107.713 Y75.568
+G1 F900 X95.122 Y88.159 E3.20515
+G0 F4800 X94.274 Y88.159
+G1 F900 X107.713 Y74.719 E3.42114
+G0 F4800 X107.713 Y73.871
+G1 F900 X93.425 Y88.159 E3.63713
+G0 F4800 X92.577 Y88.159
+G1 F900 X107.713 Y73.022 E3.85312
+G0 F4800 X107.713 Y72.174
+G1 F900 X91.728 Y88.159 E4.06912
+G0 F4800 X90.88 Y88.159
+G1 F900 X107.713 Y71.325 E4.28511
+G0 F4800 X107.713 Y70.477
+G1 F900 X90.031 Y88.159 E4.5011
+G0 F4800 X89.183 Y88.159
+G1 F900 X107.713 Y69.628 E4.7171
+G0 F4800 X107.713 Y68.78
+G1 F900 X88.334 Y88.159 E4.93309
+G0 F4800 X87.486 Y88.159
+G1 F900 X107.713 Y67.931 E5.14908
+G0 F4800 X106.955 Y67.841
+G1 F900 X86.637 Y88.159 E5.17212
+G0 F4800 X85.789 Y88.159
+G1 F900 X106.107 Y67.841 E5.17212
+G0 F4800 X105.258 Y67.841
+G1 F900 X84.94 Y88.159 E5.17212
+G0 F4800 X84.286 Y87.964
+G1 F900 X104.409 Y67.841 E5.12248
+G0 F4800 X103.561 Y67.841
+G1 F900 X84.286 Y87.116 E4.90661
+G0 F4800 X84.286 Y86.267
+G1 F900 X102.712 Y67.841 E4.69049
+G0 F4800 X101.864 Y67.841
+G1 F900 X84.286 Y85.419 E4.47463
+G0 F4800 X84.286 Y84.57
+G1 F900 X101.015 Y67.841 E4.25851
+G0 F4800 X100.167 Y67.841
+G1 F900 X84.286 Y83.722 E4.04264
+G0 F4800 X84.286 Y82.873
+G1 F900 X99.318 Y67.841 E3.82652
+G0 F4800 X98.47 Y67.841
+G1 F900 X84.286 Y82.025 E3.61066
+G0 F4800 X84.286 Y81.176
+G1 F900 X97.621 Y67.841 E3.39454
+G0 F4800 X96.773 Y67.841
+G1 F900 X84.286 Y80.328 E3.17867
+G0 F4800 X84.286 Y79.479
+G1 F900 X95.924 Y67.841 E2.96255
+G0 F4800 X95.076 Y67.841
+G1 F900 X84.286 Y78.63 E2.74656
+G0 F4800 X84.286 Y77.782
+G1 F900 X94.227 Y67.841 E2.53057
+G0 F4800 X93.379 Y67.841
+G1 F900 X84.286 Y76.933 E2.31457
+G0 F4800 X84.286 Y76.085
+G1 F900 X92.53 Y67.841 E2.09858
+G0 F4800 X91.682 Y67.841
+G1 F900 X84.286 Y75.236 E1.88259
+G0 F4800 X84.286 Y74.388
+G1 F900 X90.833 Y67.841 E1.66659
+G0 F4800 X89.984 Y67.841
+G1 F900 X84.286 Y73.539 E1.45047
+G0 F4800 X84.286 Y72.691
+G1 F900 X89.136 Y67.841 E1.23461
+G0 F4800 X88.287 Y67.841
+G1 F900 X84.286 Y71.842 E1.01849
+G0 F4800 X84.286 Y70.994
+G1 F900 X87.439 Y67.841 E0.80262
+G0 F4800 X86.59 Y67.841
+G1 F900 X84.286 Y70.145 E0.5865
+G0 F4800 X84.286 Y69.297
+G1 F900 X85.742 Y67.841 E0.37064
+G0 F4800 X84.893 Y67.841
+G1 F900 X84.286 Y68.448 E0.15452
+ ;MESH:NONMESH
+G0 F4800 X108.574 Y89.019
+ ;TIME_ELAPSED:516.395731
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:12
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z3.9
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y68.681
+G1 F900 X106.873 Y67.841 E0.21383
+G0 F4800 X106.025 Y67.841
+G1 F900 X107.713 Y69.529 E0.42969
+G0 F4800 X107.713 Y70.378
+G1 F900 X105.176 Y67.841 E0.64581
+G0 F4800 X104.327 Y67.841
+G1 F900 X107.713 Y71.226 E0.86181
+G0 F4800 X107.713 Y72.075
+G1 F900 X103.479 Y67.841 E1.0778
+G0 F4800 X102.63 Y67.841
+G1 F900 X107.713 Y72.923 E1.29379
+G0 F4800 X107.713 Y73.772
+G1 F900 X101.782 Y67.841 E1.50979
+G0 F4800 X100.933 Y67.841
+G1 F900 X107.713 Y74.62 E1.72578
+G0 F4800 X107.713 Y75.469
+G1 F900 X100.085 Y67.841 E1.94177
+G0 F4800 X99.236 Y67.841
+G1 F900 X107.713 Y76.318 E2.15789
+G0 F4800 X107.713 Y77.166
+G1 F900 X98.388 Y67.841 E2.37376
+G0 F4800 X97.539 Y67.841
+G1 F900 X107.713 Y78.015 E2.58988
+G0 F4800 X107.713 Y78.863
+G1 F900 X96.691 Y67.841 E2.80574
+G0 F4800 X95.842 Y67.841
+G1 F900 X107.713 Y79.712 E3.02186
+G0 F4800 X107.713 Y80.56
+G1 F900 X94.994 Y67.841 E3.23773
+G0 F4800 X94.145 Y67.841
+G1 F900 X107.713 Y81.409 E3.45385
+G0 F4800 X107.713 Y82.257
+G1 F900 X93.297 Y67.841 E3.66971
+G0 F4800 X92.448 Y67.841
+G1 F900 X107.713 Y83.106 E3.88583
+G0 F4800 X107.713 Y83.954
+G1 F900 X91.6 Y67.841 E4.1017
+G0 F4800 X90.751 Y67.841
+G1 F900 X107.713 Y84.803 E4.31782
+G0 F4800 X107.713 Y85.651
+G1 F900 X89.902 Y67.841 E4.53381
+G0 F4800 X89.054 Y67.841
+G1 F900 X107.713 Y86.5 E4.74981
+G0 F4800 X107.713 Y87.348
+G1 F900 X88.205 Y67.841 E4.9658
+G0 F4800 X87.357 Y67.841
+G1 F900 X107.674 Y88.158 E5.17186
+G0 F4800 X106.826 Y88.158
+G1 F900 X86.508 Y67.841 E5.17199
+G0 F4800 X85.66 Y67.841
+G1 F900 X105.977 Y88.158 E5.17186
+G0 F4800 X105.129 Y88.158
+G1 F900 X84.811 Y67.841 E5.17199
+G0 F4800 X84.285 Y68.163
+G1 F900 X104.28 Y88.158 E5.0899
+G0 F4800 X103.432 Y88.158
+G1 F900 X84.285 Y69.012 E4.8739
+G0 F4800 X84.285 Y69.86
+G1 F900 X102.583 Y88.158 E4.65791
+G0 F4800 X101.734 Y88.158
+G1 F900 X84.285 Y70.709 E4.44179
+G0 F4800 X84.285 Y71.557
+G1 F900 X100.886 Y88.158 E4.22592
+G0 F4800 X100.037 Y88.158
+G1 F900 X84.285 Y72.406 E4.0098
+G0 F4800 X84.285 Y73.254
+G1 F900 X99.189 Y88.158 E3.79394
+G0 F4800 X98.34 Y88.158
+G1 F900 X84.285 Y74.103 E3.57782
+G0 F4800 X84.285 Y74.951
+G1 F900 X97.492 Y88.158 E3.36195
+G0 F4800 X96.643 Y88.158
+G1 F900 X84.285 Y75.8 E3.14583
+G0 F4800 X84.285 Y76.648
+G1 F900 X95.795 Y88.158 E2.92997
+G0 F4800 X94.946 Y88.158
+G1 F900 X84.285 Y77.497 E2.71385
+G0 F4800 X84.285 Y78.346
+G1 F900 X94.098 Y88.158 E2.49785
+G0 F4800 X93.249 Y88.158
+G1 F900 X84.285 Y79.194 E2.28186
+G0 F4800 X84.285 Y80.043
+G1 F900 X92.401 Y88.158 E2.06587
+G0 F4800 X91.552 Y88.158
+G1 F900 X84.285 Y80.891 E1.84988
+G0 F4800 X84.285 Y81.74
+G1 F900 X90.704 Y88.158 E1.63388
+G0 F4800 X89.855 Y88.158
+G1 F900 X84.285 Y82.588 E1.41789
+G0 F4800 X84.285 Y83.437
+G1 F900 X89.007 Y88.158 E1.2019
+G0 F4800 X88.158 Y88.158
+G1 F900 X84.285 Y84.285 E0.9859
+G0 F4800 X84.285 Y85.134
+G1 F900 X87.31 Y88.158 E0.76991
+G0 F4800 X86.461 Y88.158
+G1 F900 X84.285 Y85.982 E0.55392
+G0 F4800 X84.285 Y86.831
+G1 F900 X85.612 Y88.158 E0.3378
+G0 F4800 X84.764 Y88.158
+G1 F900 X84.285 Y87.679 E0.12193
+ ;MESH:NONMESH
+G0 F4800 X108.574 Y89.019
+ ;TIME_ELAPSED:587.274226
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:13
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z4.2
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y87.447
+G1 F900 X107.002 Y88.159 E0.18112
+G0 F4800 X106.153 Y88.159
+G1 F900 X107.713 Y86.599 E0.39711
+G0 F4800 X107.713 Y85.75
+G1 F900 X105.305 Y88.159 E0.6131
+G0 F4800 X104.456 Y88.159
+G1 F900 X107.713 Y84.902 E0.8291
+G0 F4800 X107.713 Y84.053
+G1 F900 X103.608 Y88.159 E1.04509
+G0 F4800 X102.759 Y88.159
+G1 F900 X107.713 Y83.205 E1.26108
+G0 F4800 X107.713 Y82.356
+G1 F900 X101.911 Y88.159 E1.47708
+G0 F4800 X101.062 Y88.159
+G1 F900 X107.713 Y81.508 E1.69307
+G0 F4800 X107.713 Y80.659
+G1 F900 X100.214 Y88.159 E1.90906
+G0 F4800 X99.365 Y88.159
+G1 F900 X107.713 Y79.811 E2.12505
+G0 F4800 X107.713 Y78.962
+G1 F900 X98.516 Y88.159 E2.34117
+G0 F4800 X97.668 Y88.159
+G1 F900 X107.713 Y78.114 E2.55704
+G0 F4800 X107.713 Y77.265
+G1 F900 X96.819 Y88.159 E2.77316
+G0 F4800 X95.971 Y88.159
+G1 F900 X107.713 Y76.417 E2.98903
+G0 F4800 X107.713 Y75.568
+G1 F900 X95.122 Y88.159 E3.20515
+G0 F4800 X94.274 Y88.159
+G1 F900 X107.713 Y74.719 E3.42114
+G0 F4800 X107.713 Y73.871
+G1 F900 X93.425 Y88.159 E3.63713
+G0 F4800 X92.577 Y88.159
+G1 F900 X107.713 Y73.022 E3.85312
+G0 F4800 X107.713 Y72.174
+G1 F900 X91.728 Y88.159 E4.06912
+G0 F4800 X90.88 Y88.159
+G1 F900 X107.713 Y71.325 E4.28511
+G0 F4800 X107.713 Y70.477
+G1 F900 X90.031 Y88.159 E4.5011
+G0 F4800 X89.183 Y88.159
+G1 F900 X107.713 Y69.628 E4.7171
+G0 F4800 X107.713 Y68.78
+G1 F900 X88.334 Y88.159 E4.93309
+G0 F4800 X87.486 Y88.159
+G1 F900 X107.713 Y67.931 E5.14908
+G0 F4800 X106.955 Y67.841
+G1 F900 X86.637 Y88.159 E5.17212
+G0 F4800 X85.789 Y88.159
+G1 F900 X106.107 Y67.841 E5.17212
+G0 F4800 X105.258 Y67.841
+G1 F900 X84.94 Y88.159 E5.17212
+G0 F4800 X84.286 Y87.964
+G1 F900 X104.409 Y67.841 E5.12248
+G0 F4800 X103.561 Y67.841
+G1 F900 X84.286 Y87.116 E4.90661
+G0 F4800 X84.286 Y86.267
+G1 F900 X102.712 Y67.841 E4.69049
+G0 F4800 X101.864 Y67.841
+G1 F900 X84.286 Y85.419 E4.47463
+G0 F4800 X84.286 Y84.57
+G1 F900 X101.015 Y67.841 E4.25851
+G0 F4800 X100.167 Y67.841
+G1 F900 X84.286 Y83.722 E4.04264
+G0 F4800 X84.286 Y82.873
+G1 F900 X99.318 Y67.841 E3.82652
+G0 F4800 X98.47 Y67.841
+G1 F900 X84.286 Y82.025 E3.61066
+G0 F4800 X84.286 Y81.176
+G1 F900 X97.621 Y67.841 E3.39454
+G0 F4800 X96.773 Y67.841
+M104 S190 T0
+G1 F900 X84.286 Y80.328 E3.17867
+G0 F4800 X84.286 Y79.479
+G1 F900 X95.924 Y67.841 E2.96255
+G0 F4800 X95.076 Y67.841
+G1 F900 X84.286 Y78.63 E2.74656
+G0 F4800 X84.286 Y77.782
+M104 T235
+G1 F900 X94.227 Y67.841 E2.53057
+G0 F4800 X93.379 Y67.841
+G1 F900 X84.286 Y76.933 E2.31457
+G0 F4800 X84.286 Y76.085
+G1 F900 X92.53 Y67.841 E2.09858
+G0 F4800 X91.682 Y67.841
+G1 F900 X84.286 Y75.236 E1.88259
+G0 F4800 X84.286 Y74.388
+G1 F900 X90.833 Y67.841 E1.66659
+G0 F4800 X89.984 Y67.841
+G1 F900 X84.286 Y73.539 E1.45047
+G0 F4800 X84.286 Y72.691
+G1 F900 X89.136 Y67.841 E1.23461
+G0 F4800 X88.287 Y67.841
+G1 F900 X84.286 Y71.842 E1.01849
+G0 F4800 X84.286 Y70.994
+G1 F900 X87.439 Y67.841 E0.80262
+G0 F4800 X86.59 Y67.841
+G1 F900 X84.286 Y70.145 E0.5865
+G0 F4800 X84.286 Y69.297
+G1 F900 X85.742 Y67.841 E0.37064
+G0 F4800 X84.893 Y67.841
+G1 F900 X84.286 Y68.448 E0.15452
+G10
+ ;MESH:NONMESH
+G0 F4800 X82.84 Y66.395
+G0 X81.261 Y66.395
+G0 X0.00 Y0.00
+ ;TIME_ELAPSED:659.264598
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:14
+T0
+M109 S190
+M104 S150 T1
+ ;MESH:2_color_box_b.STL
+G0 F7200 X0.00 Y0.00 Z4.5
+G0 X0.00 Y10
+G0 X81.544 Y65.099
+G0 X82.24 Y65.795
+G0 X109.674 Y90.149
+G0 X109.774 Y90.219
+M104 S200
+ ;TYPE:WALL-OUTER
+G11
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y67.335
+G1 F1800 X108.219 Y66.641 E0.17666
+G0 F7200 X107.37 Y66.641
+G1 F1800 X108.913 Y68.184 E0.39278
+G0 F7200 X108.913 Y69.032
+G1 F1800 X106.522 Y66.641 E0.60865
+G0 F7200 X105.673 Y66.641
+G1 F1800 X108.913 Y69.881 E0.82477
+G0 F7200 X108.913 Y70.729
+G1 F1800 X104.825 Y66.641 E1.04063
+G0 F7200 X103.976 Y66.641
+G1 F1800 X108.913 Y71.578 E1.25676
+G0 F7200 X108.913 Y72.426
+G1 F1800 X103.127 Y66.641 E1.47275
+G0 F7200 X102.279 Y66.641
+G1 F1800 X108.913 Y73.275 E1.68874
+G0 F7200 X108.913 Y74.123
+G1 F1800 X101.43 Y66.641 E1.90473
+G0 F7200 X100.582 Y66.641
+G1 F1800 X108.913 Y74.972 E2.12073
+G0 F7200 X108.913 Y75.82
+G1 F1800 X99.733 Y66.641 E2.33672
+G0 F7200 X98.885 Y66.641
+G1 F1800 X108.913 Y76.669 E2.55271
+G0 F7200 X108.913 Y77.517
+G1 F1800 X98.036 Y66.641 E2.7687
+G0 F7200 X97.188 Y66.641
+G1 F1800 X108.913 Y78.366 E2.9847
+G0 F7200 X108.913 Y79.215
+G1 F1800 X96.339 Y66.641 E3.20082
+G0 F7200 X95.491 Y66.641
+G1 F1800 X108.913 Y80.063 E3.41668
+G0 F7200 X108.913 Y80.912
+G1 F1800 X94.642 Y66.641 E3.6328
+G0 F7200 X93.794 Y66.641
+G1 F1800 X108.913 Y81.76 E3.84867
+G0 F7200 X108.913 Y82.609
+G1 F1800 X92.945 Y66.641 E4.06479
+G0 F7200 X92.097 Y66.641
+G1 F1800 X108.913 Y83.457 E4.28065
+G0 F7200 X108.913 Y84.306
+G1 F1800 X91.248 Y66.641 E4.49677
+G0 F7200 X90.4 Y66.641
+G1 F1800 X108.913 Y85.154 E4.71264
+G0 F7200 X108.913 Y86.003
+G1 F1800 X89.551 Y66.641 E4.92876
+G0 F7200 X88.703 Y66.641
+G1 F1800 X108.913 Y86.851 E5.14463
+G0 F7200 X108.913 Y87.7
+G1 F1800 X87.854 Y66.641 E5.36075
+G0 F7200 X87.005 Y66.641
+G1 F1800 X108.913 Y88.548 E5.57674
+G0 F7200 X108.874 Y89.358
+G1 F1800 X86.157 Y66.641 E5.7828
+G0 F7200 X85.308 Y66.641
+G1 F1800 X108.026 Y89.358 E5.78293
+G0 F7200 X107.177 Y89.358
+G1 F1800 X84.46 Y66.641 E5.7828
+G0 F7200 X83.611 Y66.641
+G1 F1800 X106.329 Y89.358 E5.78293
+G0 F7200 X105.48 Y89.358
+G1 F1800 X83.085 Y66.963 E5.70084
+G0 F7200 X83.085 Y67.811
+G1 F1800 X104.632 Y89.358 E5.48497
+G0 F7200 X103.783 Y89.358
+G1 F1800 X83.085 Y68.66 E5.26885
+G0 F7200 X83.085 Y69.508
+G1 F1800 X102.934 Y89.358 E5.05286
+G0 F7200 X102.086 Y89.358
+G1 F1800 X83.085 Y70.357 E4.83686
+G0 F7200 X83.085 Y71.205
+G1 F1800 X101.237 Y89.358 E4.62087
+G0 F7200 X100.389 Y89.358
+G1 F1800 X83.085 Y72.054 E4.40488
+G0 F7200 X83.085 Y72.902
+G1 F1800 X99.54 Y89.358 E4.18889
+G0 F7200 X98.692 Y89.358
+G1 F1800 X83.085 Y73.751 E3.97289
+G0 F7200 X83.085 Y74.599
+G1 F1800 X97.843 Y89.358 E3.7569
+G0 F7200 X96.995 Y89.358
+G1 F1800 X83.085 Y75.448 E3.54091
+G0 F7200 X83.085 Y76.296
+G1 F1800 X96.146 Y89.358 E3.32492
+G0 F7200 X95.298 Y89.358
+G1 F1800 X83.085 Y77.145 E3.10892
+G0 F7200 X83.085 Y77.993
+G1 F1800 X94.449 Y89.358 E2.89293
+G0 F7200 X93.601 Y89.358
+G1 F1800 X83.085 Y78.843 E2.67681
+G0 F7200 X83.085 Y79.691
+G1 F1800 X92.752 Y89.358 E2.46082
+G0 F7200 X91.904 Y89.358
+G1 F1800 X83.085 Y80.54 E2.24482
+G0 F7200 X83.085 Y81.388
+G1 F1800 X91.055 Y89.358 E2.02883
+G0 F7200 X90.207 Y89.358
+G1 F1800 X83.085 Y82.237 E1.81284
+G0 F7200 X83.085 Y83.085
+G1 F1800 X89.358 Y89.358 E1.59685
+G0 F7200 X88.509 Y89.358
+G1 F1800 X83.085 Y83.934 E1.38072
+G0 F7200 X83.085 Y84.782
+G1 F1800 X87.661 Y89.358 E1.16486
+G0 F7200 X86.812 Y89.358
+G1 F1800 X83.085 Y85.631 E0.94874
+G0 F7200 X83.085 Y86.479
+G1 F1800 X85.964 Y89.358 E0.73287
+G0 F7200 X85.115 Y89.358
+G1 F1800 X83.085 Y87.328 E0.51675
+G0 F7200 X83.085 Y88.176
+G1 F1800 X84.267 Y89.358 E0.30089
+G0 F7200 X83.418 Y89.358
+G1 F1800 X83.085 Y89.025 E0.08477
+ ;MESH:NONMESH
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:701.977513
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:15
+ ;MESH:2_color_box_b.STL
+G0 X109.774 Y90.219 Z4.8
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y88.793
+G1 F1800 X108.347 Y89.359 E0.14408
+G0 F7200 X107.499 Y89.359
+G1 F1800 X108.913 Y87.944 E0.36007
+G0 F7200 X108.913 Y87.096
+G1 F1800 X106.65 Y89.359 E0.57607
+G0 F7200 X105.802 Y89.359
+G1 F1800 X108.913 Y86.247 E0.79206
+G0 F7200 X108.913 Y85.399
+G1 F1800 X104.953 Y89.359 E1.00805
+G0 F7200 X104.105 Y89.359
+G1 F1800 X108.913 Y84.55 E1.22404
+G0 F7200 X108.913 Y83.702
+G1 F1800 X103.256 Y89.359 E1.44004
+G0 F7200 X102.408 Y89.359
+G1 F1800 X108.913 Y82.853 E1.65603
+G0 F7200 X108.913 Y82.005
+G1 F1800 X101.559 Y89.359 E1.87202
+G0 F7200 X100.711 Y89.359
+G1 F1800 X108.913 Y81.156 E2.08802
+G0 F7200 X108.913 Y80.308
+G1 F1800 X99.862 Y89.359 E2.30401
+G0 F7200 X99.014 Y89.359
+G1 F1800 X108.913 Y79.459 E2.52
+G0 F7200 X108.913 Y78.611
+G1 F1800 X98.165 Y89.359 E2.73599
+G0 F7200 X97.316 Y89.359
+G1 F1800 X108.913 Y77.762 E2.95211
+G0 F7200 X108.913 Y76.914
+G1 F1800 X96.468 Y89.359 E3.16798
+G0 F7200 X95.619 Y89.359
+G1 F1800 X108.913 Y76.065 E3.3841
+G0 F7200 X108.913 Y75.217
+G1 F1800 X94.771 Y89.359 E3.59997
+G0 F7200 X93.922 Y89.359
+G1 F1800 X108.913 Y74.368 E3.81609
+G0 F7200 X108.913 Y73.52
+G1 F1800 X93.074 Y89.359 E4.03195
+G0 F7200 X92.225 Y89.359
+G1 F1800 X108.913 Y72.671 E4.24807
+G0 F7200 X108.913 Y71.822
+G1 F1800 X91.377 Y89.359 E4.46406
+G0 F7200 X90.528 Y89.359
+G1 F1800 X108.913 Y70.974 E4.68006
+G0 F7200 X108.913 Y70.125
+G1 F1800 X89.68 Y89.359 E4.89605
+G0 F7200 X88.831 Y89.359
+G1 F1800 X108.913 Y69.277 E5.11204
+G0 F7200 X108.913 Y68.428
+G1 F1800 X87.983 Y89.359 E5.32804
+G0 F7200 X87.134 Y89.359
+G1 F1800 X108.913 Y67.58 E5.54403
+G0 F7200 X108.913 Y66.731
+G1 F1800 X86.286 Y89.359 E5.76002
+G0 F7200 X85.437 Y89.359
+G1 F1800 X108.156 Y66.64 E5.78331
+G0 F7200 X107.307 Y66.64
+G1 F1800 X84.589 Y89.359 E5.78319
+G0 F7200 X83.74 Y89.359
+G1 F1800 X106.459 Y66.64 E5.78331
+G0 F7200 X105.61 Y66.64
+G1 F1800 X83.086 Y89.164 E5.73367
+G0 F7200 X83.086 Y88.316
+G1 F1800 X104.762 Y66.64 E5.51781
+G0 F7200 X103.913 Y66.64
+G1 F1800 X83.086 Y87.467 E5.30169
+G0 F7200 X83.086 Y86.619
+G1 F1800 X103.065 Y66.64 E5.08582
+G0 F7200 X102.216 Y66.64
+G1 F1800 X83.086 Y85.77 E4.8697
+G0 F7200 X83.086 Y84.922
+G1 F1800 X101.367 Y66.64 E4.65371
+G0 F7200 X100.519 Y66.64
+G1 F1800 X83.086 Y84.073 E4.43772
+G0 F7200 X83.086 Y83.225
+G1 F1800 X99.67 Y66.64 E4.22172
+G0 F7200 X98.822 Y66.64
+G1 F1800 X83.086 Y82.376 E4.00573
+G0 F7200 X83.086 Y81.527
+G1 F1800 X97.973 Y66.64 E3.78961
+G0 F7200 X97.125 Y66.64
+G1 F1800 X83.086 Y80.679 E3.57375
+G0 F7200 X83.086 Y79.83
+G1 F1800 X96.276 Y66.64 E3.35763
+G0 F7200 X95.428 Y66.64
+G1 F1800 X83.086 Y78.982 E3.14176
+G0 F7200 X83.086 Y78.133
+G1 F1800 X94.579 Y66.64 E2.92564
+G0 F7200 X93.731 Y66.64
+G1 F1800 X83.085 Y77.286 E2.71003
+G0 F7200 X83.085 Y76.437
+G1 F1800 X92.882 Y66.64 E2.49391
+G0 F7200 X92.034 Y66.64
+G1 F1800 X83.085 Y75.589 E2.27804
+G0 F7200 X83.085 Y74.74
+G1 F1800 X91.185 Y66.64 E2.06192
+G0 F7200 X90.337 Y66.64
+G1 F1800 X83.085 Y73.891 E1.84593
+G0 F7200 X83.085 Y73.043
+G1 F1800 X89.488 Y66.64 E1.62994
+G0 F7200 X88.64 Y66.64
+G1 F1800 X83.085 Y72.194 E1.41394
+G0 F7200 X83.085 Y71.346
+G1 F1800 X87.791 Y66.64 E1.19795
+G0 F7200 X86.943 Y66.64
+G1 F1800 X83.085 Y70.497 E0.98196
+G0 F7200 X83.085 Y69.649
+G1 F1800 X86.094 Y66.64 E0.76597
+G0 F7200 X85.245 Y66.64
+G1 F1800 X83.085 Y68.8 E0.54985
+G0 F7200 X83.085 Y67.952
+G1 F1800 X84.397 Y66.64 E0.33398
+G0 F7200 X83.548 Y66.64
+G1 F1800 X83.085 Y67.103 E0.11786
+ ;MESH:NONMESH
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:743.341478
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:16
+ ;MESH:2_color_box_b.STL
+G0 X109.774 Y90.219 Z5.1
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y67.335
+G1 F1800 X108.219 Y66.641 E0.17666
+G0 F7200 X107.37 Y66.641
+G1 F1800 X108.913 Y68.184 E0.39278
+G0 F7200 X108.913 Y69.032
+G1 F1800 X106.522 Y66.641 E0.60865
+G0 F7200 X105.673 Y66.641
+G1 F1800 X108.913 Y69.881 E0.82477
+G0 F7200 X108.913 Y70.729
+G1 F1800 X104.825 Y66.641 E1.04063
+G0 F7200 X103.976 Y66.641
+G1 F1800 X108.913 Y71.578 E1.25676
+G0 F7200 X108.913 Y72.426
+G1 F1800 X103.127 Y66.641 E1.47275
+G0 F7200 X102.279 Y66.641
+G1 F1800 X108.913 Y73.275 E1.68874
+G0 F7200 X108.913 Y74.123
+G1 F1800 X101.43 Y66.641 E1.90473
+G0 F7200 X100.582 Y66.641
+G1 F1800 X108.913 Y74.972 E2.12073
+G0 F7200 X108.913 Y75.82
+G1 F1800 X99.733 Y66.641 E2.33672
+G0 F7200 X98.885 Y66.641
+G1 F1800 X108.913 Y76.669 E2.55271
+G0 F7200 X108.913 Y77.517
+G1 F1800 X98.036 Y66.641 E2.7687
+G0 F7200 X97.188 Y66.641
+G1 F1800 X108.913 Y78.366 E2.9847
+G0 F7200 X108.913 Y79.215
+G1 F1800 X96.339 Y66.641 E3.20082
+G0 F7200 X95.491 Y66.641
+G1 F1800 X108.913 Y80.063 E3.41668
+G0 F7200 X108.913 Y80.912
+G1 F1800 X94.642 Y66.641 E3.6328
+G0 F7200 X93.794 Y66.641
+G1 F1800 X108.913 Y81.76 E3.84867
+G0 F7200 X108.913 Y82.609
+G1 F1800 X92.945 Y66.641 E4.06479
+G0 F7200 X92.097 Y66.641
+G1 F1800 X108.913 Y83.457 E4.28065
+G0 F7200 X108.913 Y84.306
+G1 F1800 X91.248 Y66.641 E4.49677
+G0 F7200 X90.4 Y66.641
+G1 F1800 X108.913 Y85.154 E4.71264
+G0 F7200 X108.913 Y86.003
+G1 F1800 X89.551 Y66.641 E4.92876
+G0 F7200 X88.703 Y66.641
+G1 F1800 X108.913 Y86.851 E5.14463
+G0 F7200 X108.913 Y87.7
+G1 F1800 X87.854 Y66.641 E5.36075
+G0 F7200 X87.005 Y66.641
+G1 F1800 X108.913 Y88.548 E5.57674
+G0 F7200 X108.874 Y89.358
+G1 F1800 X86.157 Y66.641 E5.7828
+G0 F7200 X85.308 Y66.641
+G1 F1800 X108.026 Y89.358 E5.78293
+G0 F7200 X107.177 Y89.358
+G1 F1800 X84.46 Y66.641 E5.7828
+G0 F7200 X83.611 Y66.641
+G1 F1800 X106.329 Y89.358 E5.78293
+G0 F7200 X105.48 Y89.358
+G1 F1800 X83.085 Y66.963 E5.70084
+G0 F7200 X83.085 Y67.811
+G1 F1800 X104.632 Y89.358 E5.48497
+G0 F7200 X103.783 Y89.358
+G1 F1800 X83.085 Y68.66 E5.26885
+G0 F7200 X83.085 Y69.508
+G1 F1800 X102.934 Y89.358 E5.05286
+G0 F7200 X102.086 Y89.358
+G1 F1800 X83.085 Y70.357 E4.83686
+G0 F7200 X83.085 Y71.205
+G1 F1800 X101.237 Y89.358 E4.62087
+G0 F7200 X100.389 Y89.358
+G1 F1800 X83.085 Y72.054 E4.40488
+G0 F7200 X83.085 Y72.902
+G1 F1800 X99.54 Y89.358 E4.18889
+G0 F7200 X98.692 Y89.358
+G1 F1800 X83.085 Y73.751 E3.97289
+G0 F7200 X83.085 Y74.599
+G1 F1800 X97.843 Y89.358 E3.7569
+G0 F7200 X96.995 Y89.358
+G1 F1800 X83.085 Y75.448 E3.54091
+G0 F7200 X83.085 Y76.296
+G1 F1800 X96.146 Y89.358 E3.32492
+G0 F7200 X95.298 Y89.358
+G1 F1800 X83.085 Y77.145 E3.10892
+G0 F7200 X83.085 Y77.993
+G1 F1800 X94.449 Y89.358 E2.89293
+G0 F7200 X93.601 Y89.358
+G1 F1800 X83.085 Y78.843 E2.67681
+G0 F7200 X83.085 Y79.691
+G1 F1800 X92.752 Y89.358 E2.46082
+G0 F7200 X91.904 Y89.358
+G1 F1800 X83.085 Y80.54 E2.24482
+G0 F7200 X83.085 Y81.388
+G1 F1800 X91.055 Y89.358 E2.02883
+G0 F7200 X90.207 Y89.358
+G1 F1800 X83.085 Y82.237 E1.81284
+G0 F7200 X83.085 Y83.085
+G1 F1800 X89.358 Y89.358 E1.59685
+G0 F7200 X88.509 Y89.358
+G1 F1800 X83.085 Y83.934 E1.38072
+G0 F7200 X83.085 Y84.782
+G1 F1800 X87.661 Y89.358 E1.16486
+G0 F7200 X86.812 Y89.358
+G1 F1800 X83.085 Y85.631 E0.94874
+G0 F7200 X83.085 Y86.479
+G1 F1800 X85.964 Y89.358 E0.73287
+G0 F7200 X85.115 Y89.358
+G1 F1800 X83.085 Y87.328 E0.51675
+G0 F7200 X83.085 Y88.176
+G1 F1800 X84.267 Y89.358 E0.30089
+G0 F7200 X83.418 Y89.358
+G1 F1800 X83.085 Y89.025 E0.08477
+ ;MESH:NONMESH
+G0 F7200 X84.019 Y66.021
+ ;TIME_ELAPSED:784.782902
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:17
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z5.4
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:793.017415
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:18
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z5.7
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:801.251929
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:19
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z6
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:809.486443
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:20
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z6.3
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:817.720957
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:21
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z6.6
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:825.955470
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:22
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z6.9
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:834.189984
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:23
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z7.2
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:842.424498
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:24
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z7.5
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:850.659011
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:25
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z7.8
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:858.618971
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:26
+ ;MESH:2_color_box_b.STL
+G0 X109.774 Y90.219 Z8.1
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y67.335
+G1 F1800 X108.219 Y66.641 E0.17666
+G0 F7200 X107.37 Y66.641
+G1 F1800 X108.913 Y68.184 E0.39278
+G0 F7200 X108.913 Y69.032
+G1 F1800 X106.522 Y66.641 E0.60865
+G0 F7200 X105.673 Y66.641
+G1 F1800 X108.913 Y69.881 E0.82477
+G0 F7200 X108.913 Y70.729
+G1 F1800 X104.825 Y66.641 E1.04063
+G0 F7200 X103.976 Y66.641
+G1 F1800 X108.913 Y71.578 E1.25676
+G0 F7200 X108.913 Y72.426
+G1 F1800 X103.127 Y66.641 E1.47275
+G0 F7200 X102.279 Y66.641
+G1 F1800 X108.913 Y73.275 E1.68874
+G0 F7200 X108.913 Y74.123
+G1 F1800 X101.43 Y66.641 E1.90473
+G0 F7200 X100.582 Y66.641
+G1 F1800 X108.913 Y74.972 E2.12073
+G0 F7200 X108.913 Y75.82
+G1 F1800 X99.733 Y66.641 E2.33672
+G0 F7200 X98.885 Y66.641
+G1 F1800 X108.913 Y76.669 E2.55271
+G0 F7200 X108.913 Y77.517
+G1 F1800 X98.036 Y66.641 E2.7687
+G0 F7200 X97.188 Y66.641
+G1 F1800 X108.913 Y78.366 E2.9847
+G0 F7200 X108.913 Y79.215
+G1 F1800 X96.339 Y66.641 E3.20082
+G0 F7200 X95.491 Y66.641
+G1 F1800 X108.913 Y80.063 E3.41668
+G0 F7200 X108.913 Y80.912
+G1 F1800 X94.642 Y66.641 E3.6328
+G0 F7200 X93.794 Y66.641
+G1 F1800 X108.913 Y81.76 E3.84867
+G0 F7200 X108.913 Y82.609
+G1 F1800 X92.945 Y66.641 E4.06479
+G0 F7200 X92.097 Y66.641
+G1 F1800 X108.913 Y83.457 E4.28065
+G0 F7200 X108.913 Y84.306
+G1 F1800 X91.248 Y66.641 E4.49677
+G0 F7200 X90.4 Y66.641
+G1 F1800 X108.913 Y85.154 E4.71264
+G0 F7200 X108.913 Y86.003
+G1 F1800 X89.551 Y66.641 E4.92876
+G0 F7200 X88.703 Y66.641
+G1 F1800 X108.913 Y86.851 E5.14463
+G0 F7200 X108.913 Y87.7
+G1 F1800 X87.854 Y66.641 E5.36075
+G0 F7200 X87.005 Y66.641
+G1 F1800 X108.913 Y88.548 E5.57674
+G0 F7200 X108.874 Y89.358
+G1 F1800 X86.157 Y66.641 E5.7828
+G0 F7200 X85.308 Y66.641
+G1 F1800 X108.026 Y89.358 E5.78293
+G0 F7200 X107.177 Y89.358
+G1 F1800 X84.46 Y66.641 E5.7828
+G0 F7200 X83.611 Y66.641
+G1 F1800 X106.329 Y89.358 E5.78293
+G0 F7200 X105.48 Y89.358
+G1 F1800 X83.085 Y66.963 E5.70084
+G0 F7200 X83.085 Y67.811
+G1 F1800 X104.632 Y89.358 E5.48497
+G0 F7200 X103.783 Y89.358
+G1 F1800 X83.085 Y68.66 E5.26885
+G0 F7200 X83.085 Y69.508
+G1 F1800 X102.934 Y89.358 E5.05286
+G0 F7200 X102.086 Y89.358
+G1 F1800 X83.085 Y70.357 E4.83686
+G0 F7200 X83.085 Y71.205
+G1 F1800 X101.237 Y89.358 E4.62087
+G0 F7200 X100.389 Y89.358
+G1 F1800 X83.085 Y72.054 E4.40488
+G0 F7200 X83.085 Y72.902
+G1 F1800 X99.54 Y89.358 E4.18889
+G0 F7200 X98.692 Y89.358
+G1 F1800 X83.085 Y73.751 E3.97289
+G0 F7200 X83.085 Y74.599
+G1 F1800 X97.843 Y89.358 E3.7569
+G0 F7200 X96.995 Y89.358
+G1 F1800 X83.085 Y75.448 E3.54091
+G0 F7200 X83.085 Y76.296
+G1 F1800 X96.146 Y89.358 E3.32492
+G0 F7200 X95.298 Y89.358
+G1 F1800 X83.085 Y77.145 E3.10892
+G0 F7200 X83.085 Y77.993
+G1 F1800 X94.449 Y89.358 E2.89293
+G0 F7200 X93.601 Y89.358
+G1 F1800 X83.085 Y78.843 E2.67681
+G0 F7200 X83.085 Y79.691
+G1 F1800 X92.752 Y89.358 E2.46082
+G0 F7200 X91.904 Y89.358
+G1 F1800 X83.085 Y80.54 E2.24482
+G0 F7200 X83.085 Y81.388
+G1 F1800 X91.055 Y89.358 E2.02883
+G0 F7200 X90.207 Y89.358
+G1 F1800 X83.085 Y82.237 E1.81284
+G0 F7200 X83.085 Y83.085
+G1 F1800 X89.358 Y89.358 E1.59685
+G0 F7200 X88.509 Y89.358
+G1 F1800 X83.085 Y83.934 E1.38072
+G0 F7200 X83.085 Y84.782
+G1 F1800 X87.661 Y89.358 E1.16486
+G0 F7200 X86.812 Y89.358
+G1 F1800 X83.085 Y85.631 E0.94874
+G0 F7200 X83.085 Y86.479
+G1 F1800 X85.964 Y89.358 E0.73287
+G0 F7200 X85.115 Y89.358
+G1 F1800 X83.085 Y87.328 E0.51675
+G0 F7200 X83.085 Y88.176
+G1 F1800 X84.267 Y89.358 E0.30089
+G0 F7200 X83.418 Y89.358
+G1 F1800 X83.085 Y89.025 E0.08477
+ ;MESH:NONMESH
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:900.093472
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:27
+ ;MESH:2_color_box_b.STL
+G0 X109.774 Y90.219 Z8.4
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y88.793
+G1 F1800 X108.347 Y89.359 E0.14408
+G0 F7200 X107.499 Y89.359
+G1 F1800 X108.913 Y87.944 E0.36007
+G0 F7200 X108.913 Y87.096
+G1 F1800 X106.65 Y89.359 E0.57607
+G0 F7200 X105.802 Y89.359
+G1 F1800 X108.913 Y86.247 E0.79206
+G0 F7200 X108.913 Y85.399
+G1 F1800 X104.953 Y89.359 E1.00805
+G0 F7200 X104.105 Y89.359
+G1 F1800 X108.913 Y84.55 E1.22404
+G0 F7200 X108.913 Y83.702
+G1 F1800 X103.256 Y89.359 E1.44004
+G0 F7200 X102.408 Y89.359
+G1 F1800 X108.913 Y82.853 E1.65603
+G0 F7200 X108.913 Y82.005
+G1 F1800 X101.559 Y89.359 E1.87202
+G0 F7200 X100.711 Y89.359
+G1 F1800 X108.913 Y81.156 E2.08802
+G0 F7200 X108.913 Y80.308
+G1 F1800 X99.862 Y89.359 E2.30401
+G0 F7200 X99.014 Y89.359
+G1 F1800 X108.913 Y79.459 E2.52
+G0 F7200 X108.913 Y78.611
+G1 F1800 X98.165 Y89.359 E2.73599
+G0 F7200 X97.316 Y89.359
+G1 F1800 X108.913 Y77.762 E2.95211
+G0 F7200 X108.913 Y76.914
+G1 F1800 X96.468 Y89.359 E3.16798
+G0 F7200 X95.619 Y89.359
+G1 F1800 X108.913 Y76.065 E3.3841
+G0 F7200 X108.913 Y75.217
+G1 F1800 X94.771 Y89.359 E3.59997
+G0 F7200 X93.922 Y89.359
+G1 F1800 X108.913 Y74.368 E3.81609
+G0 F7200 X108.913 Y73.52
+G1 F1800 X93.074 Y89.359 E4.03195
+G0 F7200 X92.225 Y89.359
+G1 F1800 X108.913 Y72.671 E4.24807
+G0 F7200 X108.913 Y71.822
+G1 F1800 X91.377 Y89.359 E4.46406
+G0 F7200 X90.528 Y89.359
+G1 F1800 X108.913 Y70.974 E4.68006
+G0 F7200 X108.913 Y70.125
+G1 F1800 X89.68 Y89.359 E4.89605
+G0 F7200 X88.831 Y89.359
+G1 F1800 X108.913 Y69.277 E5.11204
+G0 F7200 X108.913 Y68.428
+G1 F1800 X87.983 Y89.359 E5.32804
+G0 F7200 X87.134 Y89.359
+G1 F1800 X108.913 Y67.58 E5.54403
+G0 F7200 X108.913 Y66.731
+G1 F1800 X86.286 Y89.359 E5.76002
+G0 F7200 X85.437 Y89.359
+G1 F1800 X108.156 Y66.64 E5.78331
+G0 F7200 X107.307 Y66.64
+G1 F1800 X84.589 Y89.359 E5.78319
+G0 F7200 X83.74 Y89.359
+G1 F1800 X106.459 Y66.64 E5.78331
+G0 F7200 X105.61 Y66.64
+G1 F1800 X83.086 Y89.164 E5.73367
+G0 F7200 X83.086 Y88.316
+G1 F1800 X104.762 Y66.64 E5.51781
+G0 F7200 X103.913 Y66.64
+G1 F1800 X83.086 Y87.467 E5.30169
+G0 F7200 X83.086 Y86.619
+G1 F1800 X103.065 Y66.64 E5.08582
+G0 F7200 X102.216 Y66.64
+G1 F1800 X83.086 Y85.77 E4.8697
+G0 F7200 X83.086 Y84.922
+G1 F1800 X101.367 Y66.64 E4.65371
+G0 F7200 X100.519 Y66.64
+G1 F1800 X83.086 Y84.073 E4.43772
+G0 F7200 X83.086 Y83.225
+G1 F1800 X99.67 Y66.64 E4.22172
+G0 F7200 X98.822 Y66.64
+G1 F1800 X83.086 Y82.376 E4.00573
+G0 F7200 X83.086 Y81.527
+G1 F1800 X97.973 Y66.64 E3.78961
+G0 F7200 X97.125 Y66.64
+M104 S240 T1
+G1 F1800 X83.086 Y80.679 E3.57375
+G0 F7200 X83.086 Y79.83
+G1 F1800 X96.276 Y66.64 E3.35763
+G0 F7200 X95.428 Y66.64
+G1 F1800 X83.086 Y78.982 E3.14176
+G0 F7200 X83.086 Y78.133
+G1 F1800 X94.579 Y66.64 E2.92564
+G0 F7200 X93.731 Y66.64
+G1 F1800 X83.085 Y77.286 E2.71003
+G0 F7200 X83.085 Y76.437
+G1 F1800 X92.882 Y66.64 E2.49391
+G0 F7200 X92.034 Y66.64
+G1 F1800 X83.085 Y75.589 E2.27804
+G0 F7200 X83.085 Y74.74
+G1 F1800 X91.185 Y66.64 E2.06192
+G0 F7200 X90.337 Y66.64
+G1 F1800 X83.085 Y73.891 E1.84593
+G0 F7200 X83.085 Y73.043
+G1 F1800 X89.488 Y66.64 E1.62994
+G0 F7200 X88.64 Y66.64
+G1 F1800 X83.085 Y72.194 E1.41394
+G0 F7200 X83.085 Y71.346
+G1 F1800 X87.791 Y66.64 E1.19795
+G0 F7200 X86.943 Y66.64
+G1 F1800 X83.085 Y70.497 E0.98196
+G0 F7200 X83.085 Y69.649
+G1 F1800 X86.094 Y66.64 E0.76597
+G0 F7200 X85.245 Y66.64
+G1 F1800 X83.085 Y68.8 E0.54985
+G0 F7200 X83.085 Y67.952
+G1 F1800 X84.397 Y66.64 E0.33398
+G0 F7200 X83.548 Y66.64
+G1 F1800 X83.085 Y67.103 E0.11786
+ ;MESH:NONMESH
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:941.457438
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:28
+ ;MESH:2_color_box_b.STL
+G0 X109.774 Y90.219 Z8.7
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y67.335
+G1 F1800 X108.219 Y66.641 E0.17666
+G0 F7200 X107.37 Y66.641
+G1 F1800 X108.913 Y68.184 E0.39278
+G0 F7200 X108.913 Y69.032
+G1 F1800 X106.522 Y66.641 E0.60865
+G0 F7200 X105.673 Y66.641
+G1 F1800 X108.913 Y69.881 E0.82477
+G0 F7200 X108.913 Y70.729
+G1 F1800 X104.825 Y66.641 E1.04063
+G0 F7200 X103.976 Y66.641
+G1 F1800 X108.913 Y71.578 E1.25676
+G0 F7200 X108.913 Y72.426
+G1 F1800 X103.127 Y66.641 E1.47275
+G0 F7200 X102.279 Y66.641
+G1 F1800 X108.913 Y73.275 E1.68874
+G0 F7200 X108.913 Y74.123
+G1 F1800 X101.43 Y66.641 E1.90473
+G0 F7200 X100.582 Y66.641
+G1 F1800 X108.913 Y74.972 E2.12073
+G0 F7200 X108.913 Y75.82
+G1 F1800 X99.733 Y66.641 E2.33672
+G0 F7200 X98.885 Y66.641
+G1 F1800 X108.913 Y76.669 E2.55271
+G0 F7200 X108.913 Y77.517
+G1 F1800 X98.036 Y66.641 E2.7687
+G0 F7200 X97.188 Y66.641
+G1 F1800 X108.913 Y78.366 E2.9847
+G0 F7200 X108.913 Y79.215
+G1 F1800 X96.339 Y66.641 E3.20082
+G0 F7200 X95.491 Y66.641
+G1 F1800 X108.913 Y80.063 E3.41668
+G0 F7200 X108.913 Y80.912
+G1 F1800 X94.642 Y66.641 E3.6328
+G0 F7200 X93.794 Y66.641
+G1 F1800 X108.913 Y81.76 E3.84867
+G0 F7200 X108.913 Y82.609
+G1 F1800 X92.945 Y66.641 E4.06479
+G0 F7200 X92.097 Y66.641
+G1 F1800 X108.913 Y83.457 E4.28065
+G0 F7200 X108.913 Y84.306
+G1 F1800 X91.248 Y66.641 E4.49677
+G0 F7200 X90.4 Y66.641
+G1 F1800 X108.913 Y85.154 E4.71264
+G0 F7200 X108.913 Y86.003
+G1 F1800 X89.551 Y66.641 E4.92876
+G0 F7200 X88.703 Y66.641
+G1 F1800 X108.913 Y86.851 E5.14463
+G0 F7200 X108.913 Y87.7
+G1 F1800 X87.854 Y66.641 E5.36075
+G0 F7200 X87.005 Y66.641
+G1 F1800 X108.913 Y88.548 E5.57674
+G0 F7200 X108.874 Y89.358
+G1 F1800 X86.157 Y66.641 E5.7828
+G0 F7200 X85.308 Y66.641
+G1 F1800 X108.026 Y89.358 E5.78293
+G0 F7200 X107.177 Y89.358
+G1 F1800 X84.46 Y66.641 E5.7828
+G0 F7200 X83.611 Y66.641
+G1 F1800 X106.329 Y89.358 E5.78293
+G0 F7200 X105.48 Y89.358
+G1 F1800 X83.085 Y66.963 E5.70084
+G0 F7200 X83.085 Y67.811
+G1 F1800 X104.632 Y89.358 E5.48497
+G0 F7200 X103.783 Y89.358
+G1 F1800 X83.085 Y68.66 E5.26885
+G0 F7200 X83.085 Y69.508
+G1 F1800 X102.934 Y89.358 E5.05286
+G0 F7200 X102.086 Y89.358
+G1 F1800 X83.085 Y70.357 E4.83686
+G0 F7200 X83.085 Y71.205
+G1 F1800 X101.237 Y89.358 E4.62087
+G0 F7200 X100.389 Y89.358
+G1 F1800 X83.085 Y72.054 E4.40488
+G0 F7200 X83.085 Y72.902
+G1 F1800 X99.54 Y89.358 E4.18889
+G0 F7200 X98.692 Y89.358
+G1 F1800 X83.085 Y73.751 E3.97289
+G0 F7200 X83.085 Y74.599
+G1 F1800 X97.843 Y89.358 E3.7569
+G0 F7200 X96.995 Y89.358
+M104 S185
+G1 F1800 X83.085 Y75.448 E3.54091
+G0 F7200 X83.085 Y76.296
+G1 F1800 X96.146 Y89.358 E3.32492
+G0 F7200 X95.298 Y89.358
+G1 F1800 X83.085 Y77.145 E3.10892
+G0 F7200 X83.085 Y77.993
+G1 F1800 X94.449 Y89.358 E2.89293
+G0 F7200 X93.601 Y89.358
+G1 F1800 X83.085 Y78.843 E2.67681
+G0 F7200 X83.085 Y79.691
+G1 F1800 X92.752 Y89.358 E2.46082
+G0 F7200 X91.904 Y89.358
+G1 F1800 X83.085 Y80.54 E2.24482
+G0 F7200 X83.085 Y81.388
+G1 F1800 X91.055 Y89.358 E2.02883
+G0 F7200 X90.207 Y89.358
+G1 F1800 X83.085 Y82.237 E1.81284
+G0 F7200 X83.085 Y83.085
+G1 F1800 X89.358 Y89.358 E1.59685
+G0 F7200 X88.509 Y89.358
+G1 F1800 X83.085 Y83.934 E1.38072
+G0 F7200 X83.085 Y84.782
+G1 F1800 X87.661 Y89.358 E1.16486
+G0 F7200 X86.812 Y89.358
+G1 F1800 X83.085 Y85.631 E0.94874
+G0 F7200 X83.085 Y86.479
+G1 F1800 X85.964 Y89.358 E0.73287
+G0 F7200 X85.115 Y89.358
+G1 F1800 X83.085 Y87.328 E0.51675
+G0 F7200 X83.085 Y88.176
+G1 F1800 X84.267 Y89.358 E0.30089
+G0 F7200 X83.418 Y89.358
+G1 F1800 X83.085 Y89.025 E0.08477
+ ;MESH:NONMESH
+G0 F7200 X108.574 Y89.019
+ ;TIME_ELAPSED:982.921356
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:29
+G10 S1
+T1
+M109 T240
+M104 S175 T0
+ ;MESH:2_color_box_a.STL
+G0 F4800 X108.574 Y89.019 Z9
+M104 T250
+ ;TYPE:WALL-INNER
+G11
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y87.447
+G1 F900 X107.002 Y88.159 E0.18112
+G0 F4800 X106.153 Y88.159
+G1 F900 X107.713 Y86.599 E0.39711
+G0 F4800 X107.713 Y85.75
+G1 F900 X105.305 Y88.159 E0.6131
+G0 F4800 X104.456 Y88.159
+G1 F900 X107.713 Y84.902 E0.8291
+G0 F4800 X107.713 Y84.053
+G1 F900 X103.608 Y88.159 E1.04509
+G0 F4800 X102.759 Y88.159
+G1 F900 X107.713 Y83.205 E1.26108
+G0 F4800 X107.713 Y82.356
+G1 F900 X101.911 Y88.159 E1.47708
+G0 F4800 X101.062 Y88.159
+G1 F900 X107.713 Y81.508 E1.69307
+G0 F4800 X107.713 Y80.659
+G1 F900 X100.214 Y88.159 E1.90906
+G0 F4800 X99.365 Y88.159
+G1 F900 X107.713 Y79.811 E2.12505
+G0 F4800 X107.713 Y78.962
+G1 F900 X98.516 Y88.159 E2.34117
+G0 F4800 X97.668 Y88.159
+G1 F900 X107.713 Y78.114 E2.55704
+G0 F4800 X107.713 Y77.265
+G1 F900 X96.819 Y88.159 E2.77316
+G0 F4800 X95.971 Y88.159
+G1 F900 X107.713 Y76.417 E2.98903
+G0 F4800 X107.713 Y75.568
+G1 F900 X95.122 Y88.159 E3.20515
+G0 F4800 X94.274 Y88.159
+G1 F900 X107.713 Y74.719 E3.42114
+G0 F4800 X107.713 Y73.871
+G1 F900 X93.425 Y88.159 E3.63713
+G0 F4800 X92.577 Y88.159
+G1 F900 X107.713 Y73.022 E3.85312
+G0 F4800 X107.713 Y72.174
+G1 F900 X91.728 Y88.159 E4.06912
+G0 F4800 X90.88 Y88.159
+G1 F900 X107.713 Y71.325 E4.28511
+G0 F4800 X107.713 Y70.477
+G1 F900 X90.031 Y88.159 E4.5011
+G0 F4800 X89.183 Y88.159
+G1 F900 X107.713 Y69.628 E4.7171
+G0 F4800 X107.713 Y68.78
+G1 F900 X88.334 Y88.159 E4.93309
+G0 F4800 X87.486 Y88.159
+G1 F900 X107.713 Y67.931 E5.14908
+G0 F4800 X106.955 Y67.841
+G1 F900 X86.637 Y88.159 E5.17212
+G0 F4800 X85.789 Y88.159
+G1 F900 X106.107 Y67.841 E5.17212
+G0 F4800 X105.258 Y67.841
+G1 F900 X84.94 Y88.159 E5.17212
+G0 F4800 X84.286 Y87.964
+G1 F900 X104.409 Y67.841 E5.12248
+G0 F4800 X103.561 Y67.841
+G1 F900 X84.286 Y87.116 E4.90661
+G0 F4800 X84.286 Y86.267
+G1 F900 X102.712 Y67.841 E4.69049
+G0 F4800 X101.864 Y67.841
+G1 F900 X84.286 Y85.419 E4.47463
+G0 F4800 X84.286 Y84.57
+G1 F900 X101.015 Y67.841 E4.25851
+G0 F4800 X100.167 Y67.841
+G1 F900 X84.286 Y83.722 E4.04264
+G0 F4800 X84.286 Y82.873
+G1 F900 X99.318 Y67.841 E3.82652
+G0 F4800 X98.47 Y67.841
+G1 F900 X84.286 Y82.025 E3.61066
+G0 F4800 X84.286 Y81.176
+G1 F900 X97.621 Y67.841 E3.39454
+G0 F4800 X96.773 Y67.841
+G1 F900 X84.286 Y80.328 E3.17867
+G0 F4800 X84.286 Y79.479
+G1 F900 X95.924 Y67.841 E2.96255
+G0 F4800 X95.076 Y67.841
+G1 F900 X84.286 Y78.63 E2.74656
+G0 F4800 X84.286 Y77.782
+G1 F900 X94.227 Y67.841 E2.53057
+G0 F4800 X93.379 Y67.841
+G1 F900 X84.286 Y76.933 E2.31457
+G0 F4800 X84.286 Y76.085
+G1 F900 X92.53 Y67.841 E2.09858
+G0 F4800 X91.682 Y67.841
+G1 F900 X84.286 Y75.236 E1.88259
+G0 F4800 X84.286 Y74.388
+G1 F900 X90.833 Y67.841 E1.66659
+G0 F4800 X89.984 Y67.841
+G1 F900 X84.286 Y73.539 E1.45047
+G0 F4800 X84.286 Y72.691
+G1 F900 X89.136 Y67.841 E1.23461
+G0 F4800 X88.287 Y67.841
+G1 F900 X84.286 Y71.842 E1.01849
+G0 F4800 X84.286 Y70.994
+G1 F900 X87.439 Y67.841 E0.80262
+G0 F4800 X86.59 Y67.841
+G1 F900 X84.286 Y70.145 E0.5865
+G0 F4800 X84.286 Y69.297
+G1 F900 X85.742 Y67.841 E0.37064
+G0 F4800 X84.893 Y67.841
+G1 F900 X84.286 Y68.448 E0.15452
+ ;MESH:NONMESH
+G0 F4800 X108.574 Y89.019
+ ;TIME_ELAPSED:1054.279618
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:30
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z9.3
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y68.681
+G1 F900 X106.873 Y67.841 E0.21383
+G0 F4800 X106.025 Y67.841
+G1 F900 X107.713 Y69.529 E0.42969
+G0 F4800 X107.713 Y70.378
+G1 F900 X105.176 Y67.841 E0.64581
+G0 F4800 X104.327 Y67.841
+G1 F900 X107.713 Y71.226 E0.86181
+G0 F4800 X107.713 Y72.075
+G1 F900 X103.479 Y67.841 E1.0778
+G0 F4800 X102.63 Y67.841
+G1 F900 X107.713 Y72.923 E1.29379
+G0 F4800 X107.713 Y73.772
+G1 F900 X101.782 Y67.841 E1.50979
+G0 F4800 X100.933 Y67.841
+G1 F900 X107.713 Y74.62 E1.72578
+G0 F4800 X107.713 Y75.469
+G1 F900 X100.085 Y67.841 E1.94177
+G0 F4800 X99.236 Y67.841
+G1 F900 X107.713 Y76.318 E2.15789
+G0 F4800 X107.713 Y77.166
+G1 F900 X98.388 Y67.841 E2.37376
+G0 F4800 X97.539 Y67.841
+G1 F900 X107.713 Y78.015 E2.58988
+G0 F4800 X107.713 Y78.863
+G1 F900 X96.691 Y67.841 E2.80574
+G0 F4800 X95.842 Y67.841
+G1 F900 X107.713 Y79.712 E3.02186
+G0 F4800 X107.713 Y80.56
+G1 F900 X94.994 Y67.841 E3.23773
+G0 F4800 X94.145 Y67.841
+G1 F900 X107.713 Y81.409 E3.45385
+G0 F4800 X107.713 Y82.257
+G1 F900 X93.297 Y67.841 E3.66971
+G0 F4800 X92.448 Y67.841
+G1 F900 X107.713 Y83.106 E3.88583
+G0 F4800 X107.713 Y83.954
+G1 F900 X91.6 Y67.841 E4.1017
+G0 F4800 X90.751 Y67.841
+G1 F900 X107.713 Y84.803 E4.31782
+G0 F4800 X107.713 Y85.651
+G1 F900 X89.902 Y67.841 E4.53381
+G0 F4800 X89.054 Y67.841
+G1 F900 X107.713 Y86.5 E4.74981
+G0 F4800 X107.713 Y87.348
+G1 F900 X88.205 Y67.841 E4.9658
+G0 F4800 X87.357 Y67.841
+G1 F900 X107.674 Y88.158 E5.17186
+G0 F4800 X106.826 Y88.158
+G1 F900 X86.508 Y67.841 E5.17199
+G0 F4800 X85.66 Y67.841
+G1 F900 X105.977 Y88.158 E5.17186
+G0 F4800 X105.129 Y88.158
+G1 F900 X84.811 Y67.841 E5.17199
+G0 F4800 X84.285 Y68.163
+G1 F900 X104.28 Y88.158 E5.0899
+G0 F4800 X103.432 Y88.158
+G1 F900 X84.285 Y69.012 E4.8739
+G0 F4800 X84.285 Y69.86
+G1 F900 X102.583 Y88.158 E4.65791
+G0 F4800 X101.734 Y88.158
+G1 F900 X84.285 Y70.709 E4.44179
+G0 F4800 X84.285 Y71.557
+G1 F900 X100.886 Y88.158 E4.22592
+G0 F4800 X100.037 Y88.158
+G1 F900 X84.285 Y72.406 E4.0098
+G0 F4800 X84.285 Y73.254
+G1 F900 X99.189 Y88.158 E3.79394
+G0 F4800 X98.34 Y88.158
+G1 F900 X84.285 Y74.103 E3.57782
+G0 F4800 X84.285 Y74.951
+G1 F900 X97.492 Y88.158 E3.36195
+G0 F4800 X96.643 Y88.158
+G1 F900 X84.285 Y75.8 E3.14583
+G0 F4800 X84.285 Y76.648
+G1 F900 X95.795 Y88.158 E2.92997
+G0 F4800 X94.946 Y88.158
+G1 F900 X84.285 Y77.497 E2.71385
+G0 F4800 X84.285 Y78.346
+G1 F900 X94.098 Y88.158 E2.49785
+G0 F4800 X93.249 Y88.158
+G1 F900 X84.285 Y79.194 E2.28186
+G0 F4800 X84.285 Y80.043
+G1 F900 X92.401 Y88.158 E2.06587
+G0 F4800 X91.552 Y88.158
+G1 F900 X84.285 Y80.891 E1.84988
+G0 F4800 X84.285 Y81.74
+G1 F900 X90.704 Y88.158 E1.63388
+G0 F4800 X89.855 Y88.158
+G1 F900 X84.285 Y82.588 E1.41789
+G0 F4800 X84.285 Y83.437
+G1 F900 X89.007 Y88.158 E1.2019
+G0 F4800 X88.158 Y88.158
+G1 F900 X84.285 Y84.285 E0.9859
+G0 F4800 X84.285 Y85.134
+G1 F900 X87.31 Y88.158 E0.76991
+G0 F4800 X86.461 Y88.158
+G1 F900 X84.285 Y85.982 E0.55392
+G0 F4800 X84.285 Y86.831
+G1 F900 X85.612 Y88.158 E0.3378
+G0 F4800 X84.764 Y88.158
+G1 F900 X84.285 Y87.679 E0.12193
+ ;MESH:NONMESH
+G0 F4800 X108.574 Y89.019
+ ;TIME_ELAPSED:1125.158113
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:31
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z9.6
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y87.447
+G1 F900 X107.002 Y88.159 E0.18112
+G0 F4800 X106.153 Y88.159
+G1 F900 X107.713 Y86.599 E0.39711
+G0 F4800 X107.713 Y85.75
+G1 F900 X105.305 Y88.159 E0.6131
+G0 F4800 X104.456 Y88.159
+G1 F900 X107.713 Y84.902 E0.8291
+G0 F4800 X107.713 Y84.053
+G1 F900 X103.608 Y88.159 E1.04509
+G0 F4800 X102.759 Y88.159
+G1 F900 X107.713 Y83.205 E1.26108
+G0 F4800 X107.713 Y82.356
+G1 F900 X101.911 Y88.159 E1.47708
+G0 F4800 X101.062 Y88.159
+G1 F900 X107.713 Y81.508 E1.69307
+G0 F4800 X107.713 Y80.659
+G1 F900 X100.214 Y88.159 E1.90906
+G0 F4800 X99.365 Y88.159
+G1 F900 X107.713 Y79.811 E2.12505
+G0 F4800 X107.713 Y78.962
+G1 F900 X98.516 Y88.159 E2.34117
+G0 F4800 X97.668 Y88.159
+G1 F900 X107.713 Y78.114 E2.55704
+G0 F4800 X107.713 Y77.265
+G1 F900 X96.819 Y88.159 E2.77316
+G0 F4800 X95.971 Y88.159
+G1 F900 X107.713 Y76.417 E2.98903
+G0 F4800 X107.713 Y75.568
+G1 F900 X95.122 Y88.159 E3.20515
+G0 F4800 X94.274 Y88.159
+G1 F900 X107.713 Y74.719 E3.42114
+G0 F4800 X107.713 Y73.871
+G1 F900 X93.425 Y88.159 E3.63713
+G0 F4800 X92.577 Y88.159
+G1 F900 X107.713 Y73.022 E3.85312
+G0 F4800 X107.713 Y72.174
+G1 F900 X91.728 Y88.159 E4.06912
+G0 F4800 X90.88 Y88.159
+G1 F900 X107.713 Y71.325 E4.28511
+G0 F4800 X107.713 Y70.477
+G1 F900 X90.031 Y88.159 E4.5011
+G0 F4800 X89.183 Y88.159
+G1 F900 X107.713 Y69.628 E4.7171
+G0 F4800 X107.713 Y68.78
+G1 F900 X88.334 Y88.159 E4.93309
+G0 F4800 X87.486 Y88.159
+G1 F900 X107.713 Y67.931 E5.14908
+G0 F4800 X106.955 Y67.841
+G1 F900 X86.637 Y88.159 E5.17212
+G0 F4800 X85.789 Y88.159
+G1 F900 X106.107 Y67.841 E5.17212
+G0 F4800 X105.258 Y67.841
+G1 F900 X84.94 Y88.159 E5.17212
+G0 F4800 X84.286 Y87.964
+G1 F900 X104.409 Y67.841 E5.12248
+G0 F4800 X103.561 Y67.841
+G1 F900 X84.286 Y87.116 E4.90661
+G0 F4800 X84.286 Y86.267
+G1 F900 X102.712 Y67.841 E4.69049
+G0 F4800 X101.864 Y67.841
+G1 F900 X84.286 Y85.419 E4.47463
+G0 F4800 X84.286 Y84.57
+G1 F900 X101.015 Y67.841 E4.25851
+G0 F4800 X100.167 Y67.841
+G1 F900 X84.286 Y83.722 E4.04264
+G0 F4800 X84.286 Y82.873
+G1 F900 X99.318 Y67.841 E3.82652
+G0 F4800 X98.47 Y67.841
+G1 F900 X84.286 Y82.025 E3.61066
+G0 F4800 X84.286 Y81.176
+G1 F900 X97.621 Y67.841 E3.39454
+G0 F4800 X96.773 Y67.841
+G1 F900 X84.286 Y80.328 E3.17867
+G0 F4800 X84.286 Y79.479
+G1 F900 X95.924 Y67.841 E2.96255
+G0 F4800 X95.076 Y67.841
+G1 F900 X84.286 Y78.63 E2.74656
+G0 F4800 X84.286 Y77.782
+G1 F900 X94.227 Y67.841 E2.53057
+G0 F4800 X93.379 Y67.841
+G1 F900 X84.286 Y76.933 E2.31457
+G0 F4800 X84.286 Y76.085
+G1 F900 X92.53 Y67.841 E2.09858
+G0 F4800 X91.682 Y67.841
+G1 F900 X84.286 Y75.236 E1.88259
+G0 F4800 X84.286 Y74.388
+G1 F900 X90.833 Y67.841 E1.66659
+G0 F4800 X89.984 Y67.841
+G1 F900 X84.286 Y73.539 E1.45047
+G0 F4800 X84.286 Y72.691
+G1 F900 X89.136 Y67.841 E1.23461
+G0 F4800 X88.287 Y67.841
+G1 F900 X84.286 Y71.842 E1.01849
+G0 F4800 X84.286 Y70.994
+G1 F900 X87.439 Y67.841 E0.80262
+G0 F4800 X86.59 Y67.841
+G1 F900 X84.286 Y70.145 E0.5865
+G0 F4800 X84.286 Y69.297
+G1 F900 X85.742 Y67.841 E0.37064
+G0 F4800 X84.893 Y67.841
+G1 F900 X84.286 Y68.448 E0.15452
+ ;MESH:NONMESH
+G0 F4800 X85.219 Y67.221
+ ;TIME_ELAPSED:1195.520854
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:32
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z9.9
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:1212.759874
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:33
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z10.2
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:1229.998894
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:34
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z10.5
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:1247.237913
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:35
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z10.8
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:1264.476933
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:36
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z11.1
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:1281.715952
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:37
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z11.4
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:1298.954972
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:38
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z11.7
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:1316.193991
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:39
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z12
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X108.574 Y89.019
+ ;TIME_ELAPSED:1333.035870
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:40
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z12.3
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y68.681
+G1 F900 X106.873 Y67.841 E0.21383
+G0 F4800 X106.025 Y67.841
+G1 F900 X107.713 Y69.529 E0.42969
+G0 F4800 X107.713 Y70.378
+G1 F900 X105.176 Y67.841 E0.64581
+G0 F4800 X104.327 Y67.841
+G1 F900 X107.713 Y71.226 E0.86181
+G0 F4800 X107.713 Y72.075
+G1 F900 X103.479 Y67.841 E1.0778
+G0 F4800 X102.63 Y67.841
+G1 F900 X107.713 Y72.923 E1.29379
+G0 F4800 X107.713 Y73.772
+G1 F900 X101.782 Y67.841 E1.50979
+G0 F4800 X100.933 Y67.841
+G1 F900 X107.713 Y74.62 E1.72578
+G0 F4800 X107.713 Y75.469
+G1 F900 X100.085 Y67.841 E1.94177
+G0 F4800 X99.236 Y67.841
+G1 F900 X107.713 Y76.318 E2.15789
+G0 F4800 X107.713 Y77.166
+G1 F900 X98.388 Y67.841 E2.37376
+G0 F4800 X97.539 Y67.841
+G1 F900 X107.713 Y78.015 E2.58988
+G0 F4800 X107.713 Y78.863
+G1 F900 X96.691 Y67.841 E2.80574
+G0 F4800 X95.842 Y67.841
+G1 F900 X107.713 Y79.712 E3.02186
+G0 F4800 X107.713 Y80.56
+G1 F900 X94.994 Y67.841 E3.23773
+G0 F4800 X94.145 Y67.841
+G1 F900 X107.713 Y81.409 E3.45385
+G0 F4800 X107.713 Y82.257
+G1 F900 X93.297 Y67.841 E3.66971
+G0 F4800 X92.448 Y67.841
+G1 F900 X107.713 Y83.106 E3.88583
+G0 F4800 X107.713 Y83.954
+G1 F900 X91.6 Y67.841 E4.1017
+G0 F4800 X90.751 Y67.841
+G1 F900 X107.713 Y84.803 E4.31782
+G0 F4800 X107.713 Y85.651
+G1 F900 X89.902 Y67.841 E4.53381
+G0 F4800 X89.054 Y67.841
+G1 F900 X107.713 Y86.5 E4.74981
+G0 F4800 X107.713 Y87.348
+G1 F900 X88.205 Y67.841 E4.9658
+G0 F4800 X87.357 Y67.841
+G1 F900 X107.674 Y88.158 E5.17186
+G0 F4800 X106.826 Y88.158
+G1 F900 X86.508 Y67.841 E5.17199
+G0 F4800 X85.66 Y67.841
+G1 F900 X105.977 Y88.158 E5.17186
+G0 F4800 X105.129 Y88.158
+G1 F900 X84.811 Y67.841 E5.17199
+G0 F4800 X84.285 Y68.163
+G1 F900 X104.28 Y88.158 E5.0899
+G0 F4800 X103.432 Y88.158
+G1 F900 X84.285 Y69.012 E4.8739
+G0 F4800 X84.285 Y69.86
+G1 F900 X102.583 Y88.158 E4.65791
+G0 F4800 X101.734 Y88.158
+G1 F900 X84.285 Y70.709 E4.44179
+G0 F4800 X84.285 Y71.557
+G1 F900 X100.886 Y88.158 E4.22592
+G0 F4800 X100.037 Y88.158
+G1 F900 X84.285 Y72.406 E4.0098
+G0 F4800 X84.285 Y73.254
+G1 F900 X99.189 Y88.158 E3.79394
+G0 F4800 X98.34 Y88.158
+G1 F900 X84.285 Y74.103 E3.57782
+G0 F4800 X84.285 Y74.951
+G1 F900 X97.492 Y88.158 E3.36195
+G0 F4800 X96.643 Y88.158
+G1 F900 X84.285 Y75.8 E3.14583
+G0 F4800 X84.285 Y76.648
+G1 F900 X95.795 Y88.158 E2.92997
+G0 F4800 X94.946 Y88.158
+G1 F900 X84.285 Y77.497 E2.71385
+G0 F4800 X84.285 Y78.346
+G1 F900 X94.098 Y88.158 E2.49785
+G0 F4800 X93.249 Y88.158
+G1 F900 X84.285 Y79.194 E2.28186
+G0 F4800 X84.285 Y80.043
+G1 F900 X92.401 Y88.158 E2.06587
+G0 F4800 X91.552 Y88.158
+G1 F900 X84.285 Y80.891 E1.84988
+G0 F4800 X84.285 Y81.74
+G1 F900 X90.704 Y88.158 E1.63388
+G0 F4800 X89.855 Y88.158
+G1 F900 X84.285 Y82.588 E1.41789
+G0 F4800 X84.285 Y83.437
+G1 F900 X89.007 Y88.158 E1.2019
+G0 F4800 X88.158 Y88.158
+G1 F900 X84.285 Y84.285 E0.9859
+G0 F4800 X84.285 Y85.134
+G1 F900 X87.31 Y88.158 E0.76991
+G0 F4800 X86.461 Y88.158
+G1 F900 X84.285 Y85.982 E0.55392
+G0 F4800 X84.285 Y86.831
+G1 F900 X85.612 Y88.158 E0.3378
+G0 F4800 X84.764 Y88.158
+G1 F900 X84.285 Y87.679 E0.12193
+ ;MESH:NONMESH
+G0 F4800 X108.574 Y89.019
+ ;TIME_ELAPSED:1403.914365
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:41
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z12.6
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y87.447
+G1 F900 X107.002 Y88.159 E0.18112
+G0 F4800 X106.153 Y88.159
+G1 F900 X107.713 Y86.599 E0.39711
+G0 F4800 X107.713 Y85.75
+G1 F900 X105.305 Y88.159 E0.6131
+G0 F4800 X104.456 Y88.159
+G1 F900 X107.713 Y84.902 E0.8291
+G0 F4800 X107.713 Y84.053
+G1 F900 X103.608 Y88.159 E1.04509
+G0 F4800 X102.759 Y88.159
+G1 F900 X107.713 Y83.205 E1.26108
+G0 F4800 X107.713 Y82.356
+G1 F900 X101.911 Y88.159 E1.47708
+G0 F4800 X101.062 Y88.159
+G1 F900 X107.713 Y81.508 E1.69307
+G0 F4800 X107.713 Y80.659
+G1 F900 X100.214 Y88.159 E1.90906
+G0 F4800 X99.365 Y88.159
+G1 F900 X107.713 Y79.811 E2.12505
+G0 F4800 X107.713 Y78.962
+G1 F900 X98.516 Y88.159 E2.34117
+G0 F4800 X97.668 Y88.159
+G1 F900 X107.713 Y78.114 E2.55704
+G0 F4800 X107.713 Y77.265
+G1 F900 X96.819 Y88.159 E2.77316
+G0 F4800 X95.971 Y88.159
+G1 F900 X107.713 Y76.417 E2.98903
+G0 F4800 X107.713 Y75.568
+G1 F900 X95.122 Y88.159 E3.20515
+G0 F4800 X94.274 Y88.159
+G1 F900 X107.713 Y74.719 E3.42114
+G0 F4800 X107.713 Y73.871
+G1 F900 X93.425 Y88.159 E3.63713
+G0 F4800 X92.577 Y88.159
+G1 F900 X107.713 Y73.022 E3.85312
+G0 F4800 X107.713 Y72.174
+G1 F900 X91.728 Y88.159 E4.06912
+G0 F4800 X90.88 Y88.159
+G1 F900 X107.713 Y71.325 E4.28511
+G0 F4800 X107.713 Y70.477
+G1 F900 X90.031 Y88.159 E4.5011
+G0 F4800 X89.183 Y88.159
+G1 F900 X107.713 Y69.628 E4.7171
+G0 F4800 X107.713 Y68.78
+G1 F900 X88.334 Y88.159 E4.93309
+G0 F4800 X87.486 Y88.159
+G1 F900 X107.713 Y67.931 E5.14908
+G0 F4800 X106.955 Y67.841
+G1 F900 X86.637 Y88.159 E5.17212
+G0 F4800 X85.789 Y88.159
+G1 F900 X106.107 Y67.841 E5.17212
+G0 F4800 X105.258 Y67.841
+G1 F900 X84.94 Y88.159 E5.17212
+G0 F4800 X84.286 Y87.964
+G1 F900 X104.409 Y67.841 E5.12248
+G0 F4800 X103.561 Y67.841
+G1 F900 X84.286 Y87.116 E4.90661
+G0 F4800 X84.286 Y86.267
+G1 F900 X102.712 Y67.841 E4.69049
+G0 F4800 X101.864 Y67.841
+G1 F900 X84.286 Y85.419 E4.47463
+G0 F4800 X84.286 Y84.57
+G1 F900 X101.015 Y67.841 E4.25851
+G0 F4800 X100.167 Y67.841
+G1 F900 X84.286 Y83.722 E4.04264
+G0 F4800 X84.286 Y82.873
+G1 F900 X99.318 Y67.841 E3.82652
+G0 F4800 X98.47 Y67.841
+G1 F900 X84.286 Y82.025 E3.61066
+G0 F4800 X84.286 Y81.176
+G1 F900 X97.621 Y67.841 E3.39454
+G0 F4800 X96.773 Y67.841
+G1 F900 X84.286 Y80.328 E3.17867
+G0 F4800 X84.286 Y79.479
+G1 F900 X95.924 Y67.841 E2.96255
+G0 F4800 X95.076 Y67.841
+G1 F900 X84.286 Y78.63 E2.74656
+G0 F4800 X84.286 Y77.782
+G1 F900 X94.227 Y67.841 E2.53057
+G0 F4800 X93.379 Y67.841
+G1 F900 X84.286 Y76.933 E2.31457
+G0 F4800 X84.286 Y76.085
+G1 F900 X92.53 Y67.841 E2.09858
+G0 F4800 X91.682 Y67.841
+G1 F900 X84.286 Y75.236 E1.88259
+G0 F4800 X84.286 Y74.388
+G1 F900 X90.833 Y67.841 E1.66659
+G0 F4800 X89.984 Y67.841
+G1 F900 X84.286 Y73.539 E1.45047
+G0 F4800 X84.286 Y72.691
+G1 F900 X89.136 Y67.841 E1.23461
+G0 F4800 X88.287 Y67.841
+G1 F900 X84.286 Y71.842 E1.01849
+G0 F4800 X84.286 Y70.994
+G1 F900 X87.439 Y67.841 E0.80262
+G0 F4800 X86.59 Y67.841
+G1 F900 X84.286 Y70.145 E0.5865
+G0 F4800 X84.286 Y69.297
+G1 F900 X85.742 Y67.841 E0.37064
+G0 F4800 X84.893 Y67.841
+G1 F900 X84.286 Y68.448 E0.15452
+ ;MESH:NONMESH
+G0 F4800 X108.574 Y89.019
+ ;TIME_ELAPSED:1474.655700
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:42
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z12.9
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y68.681
+G1 F900 X106.873 Y67.841 E0.21383
+G0 F4800 X106.025 Y67.841
+G1 F900 X107.713 Y69.529 E0.42969
+G0 F4800 X107.713 Y70.378
+G1 F900 X105.176 Y67.841 E0.64581
+G0 F4800 X104.327 Y67.841
+G1 F900 X107.713 Y71.226 E0.86181
+G0 F4800 X107.713 Y72.075
+G1 F900 X103.479 Y67.841 E1.0778
+G0 F4800 X102.63 Y67.841
+G1 F900 X107.713 Y72.923 E1.29379
+G0 F4800 X107.713 Y73.772
+G1 F900 X101.782 Y67.841 E1.50979
+G0 F4800 X100.933 Y67.841
+G1 F900 X107.713 Y74.62 E1.72578
+G0 F4800 X107.713 Y75.469
+G1 F900 X100.085 Y67.841 E1.94177
+G0 F4800 X99.236 Y67.841
+G1 F900 X107.713 Y76.318 E2.15789
+G0 F4800 X107.713 Y77.166
+G1 F900 X98.388 Y67.841 E2.37376
+G0 F4800 X97.539 Y67.841
+G1 F900 X107.713 Y78.015 E2.58988
+G0 F4800 X107.713 Y78.863
+G1 F900 X96.691 Y67.841 E2.80574
+G0 F4800 X95.842 Y67.841
+G1 F900 X107.713 Y79.712 E3.02186
+G0 F4800 X107.713 Y80.56
+G1 F900 X94.994 Y67.841 E3.23773
+G0 F4800 X94.145 Y67.841
+G1 F900 X107.713 Y81.409 E3.45385
+G0 F4800 X107.713 Y82.257
+G1 F900 X93.297 Y67.841 E3.66971
+G0 F4800 X92.448 Y67.841
+G1 F900 X107.713 Y83.106 E3.88583
+G0 F4800 X107.713 Y83.954
+G1 F900 X91.6 Y67.841 E4.1017
+G0 F4800 X90.751 Y67.841
+G1 F900 X107.713 Y84.803 E4.31782
+G0 F4800 X107.713 Y85.651
+G1 F900 X89.902 Y67.841 E4.53381
+G0 F4800 X89.054 Y67.841
+G1 F900 X107.713 Y86.5 E4.74981
+G0 F4800 X107.713 Y87.348
+G1 F900 X88.205 Y67.841 E4.9658
+G0 F4800 X87.357 Y67.841
+G1 F900 X107.674 Y88.158 E5.17186
+G0 F4800 X106.826 Y88.158
+G1 F900 X86.508 Y67.841 E5.17199
+G0 F4800 X85.66 Y67.841
+G1 F900 X105.977 Y88.158 E5.17186
+G0 F4800 X105.129 Y88.158
+G1 F900 X84.811 Y67.841 E5.17199
+G0 F4800 X84.285 Y68.163
+G1 F900 X104.28 Y88.158 E5.0899
+G0 F4800 X103.432 Y88.158
+G1 F900 X84.285 Y69.012 E4.8739
+G0 F4800 X84.285 Y69.86
+G1 F900 X102.583 Y88.158 E4.65791
+G0 F4800 X101.734 Y88.158
+G1 F900 X84.285 Y70.709 E4.44179
+G0 F4800 X84.285 Y71.557
+G1 F900 X100.886 Y88.158 E4.22592
+G0 F4800 X100.037 Y88.158
+G1 F900 X84.285 Y72.406 E4.0098
+G0 F4800 X84.285 Y73.254
+G1 F900 X99.189 Y88.158 E3.79394
+G0 F4800 X98.34 Y88.158
+G1 F900 X84.285 Y74.103 E3.57782
+G0 F4800 X84.285 Y74.951
+G1 F900 X97.492 Y88.158 E3.36195
+G0 F4800 X96.643 Y88.158
+M104 S190 T0
+G1 F900 X84.285 Y75.8 E3.14583
+G0 F4800 X84.285 Y76.648
+G1 F900 X95.795 Y88.158 E2.92997
+G0 F4800 X94.946 Y88.158
+G1 F900 X84.285 Y77.497 E2.71385
+G0 F4800 X84.285 Y78.346
+M104 T235
+G1 F900 X94.098 Y88.158 E2.49785
+G0 F4800 X93.249 Y88.158
+G1 F900 X84.285 Y79.194 E2.28186
+G0 F4800 X84.285 Y80.043
+G1 F900 X92.401 Y88.158 E2.06587
+G0 F4800 X91.552 Y88.158
+G1 F900 X84.285 Y80.891 E1.84988
+G0 F4800 X84.285 Y81.74
+G1 F900 X90.704 Y88.158 E1.63388
+G0 F4800 X89.855 Y88.158
+G1 F900 X84.285 Y82.588 E1.41789
+G0 F4800 X84.285 Y83.437
+G1 F900 X89.007 Y88.158 E1.2019
+G0 F4800 X88.158 Y88.158
+G1 F900 X84.285 Y84.285 E0.9859
+G0 F4800 X84.285 Y85.134
+G1 F900 X87.31 Y88.158 E0.76991
+G0 F4800 X86.461 Y88.158
+G1 F900 X84.285 Y85.982 E0.55392
+G0 F4800 X84.285 Y86.831
+G1 F900 X85.612 Y88.158 E0.3378
+G0 F4800 X84.764 Y88.158
+G1 F900 X84.285 Y87.679 E0.12193
+ ;MESH:NONMESH
+G0 F4800 X109.104 Y89.549
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:1545.560567
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:43
+G10 S1
+T0
+M109 S190
+M104 S150 T1
+ ;MESH:2_color_box_b.STL
+G0 F7200 X109.774 Y90.219 Z13.2
+M104 S200
+ ;TYPE:WALL-OUTER
+G11
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y88.793
+G1 F1800 X108.347 Y89.359 E0.14408
+G0 F7200 X107.499 Y89.359
+G1 F1800 X108.913 Y87.944 E0.36007
+G0 F7200 X108.913 Y87.096
+G1 F1800 X106.65 Y89.359 E0.57607
+G0 F7200 X105.802 Y89.359
+G1 F1800 X108.913 Y86.247 E0.79206
+G0 F7200 X108.913 Y85.399
+G1 F1800 X104.953 Y89.359 E1.00805
+G0 F7200 X104.105 Y89.359
+G1 F1800 X108.913 Y84.55 E1.22404
+G0 F7200 X108.913 Y83.702
+G1 F1800 X103.256 Y89.359 E1.44004
+G0 F7200 X102.408 Y89.359
+G1 F1800 X108.913 Y82.853 E1.65603
+G0 F7200 X108.913 Y82.005
+G1 F1800 X101.559 Y89.359 E1.87202
+G0 F7200 X100.711 Y89.359
+G1 F1800 X108.913 Y81.156 E2.08802
+G0 F7200 X108.913 Y80.308
+G1 F1800 X99.862 Y89.359 E2.30401
+G0 F7200 X99.014 Y89.359
+G1 F1800 X108.913 Y79.459 E2.52
+G0 F7200 X108.913 Y78.611
+G1 F1800 X98.165 Y89.359 E2.73599
+G0 F7200 X97.316 Y89.359
+G1 F1800 X108.913 Y77.762 E2.95211
+G0 F7200 X108.913 Y76.914
+G1 F1800 X96.468 Y89.359 E3.16798
+G0 F7200 X95.619 Y89.359
+G1 F1800 X108.913 Y76.065 E3.3841
+G0 F7200 X108.913 Y75.217
+G1 F1800 X94.771 Y89.359 E3.59997
+G0 F7200 X93.922 Y89.359
+G1 F1800 X108.913 Y74.368 E3.81609
+G0 F7200 X108.913 Y73.52
+G1 F1800 X93.074 Y89.359 E4.03195
+G0 F7200 X92.225 Y89.359
+G1 F1800 X108.913 Y72.671 E4.24807
+G0 F7200 X108.913 Y71.822
+G1 F1800 X91.377 Y89.359 E4.46406
+G0 F7200 X90.528 Y89.359
+G1 F1800 X108.913 Y70.974 E4.68006
+G0 F7200 X108.913 Y70.125
+G1 F1800 X89.68 Y89.359 E4.89605
+G0 F7200 X88.831 Y89.359
+G1 F1800 X108.913 Y69.277 E5.11204
+G0 F7200 X108.913 Y68.428
+G1 F1800 X87.983 Y89.359 E5.32804
+G0 F7200 X87.134 Y89.359
+G1 F1800 X108.913 Y67.58 E5.54403
+G0 F7200 X108.913 Y66.731
+G1 F1800 X86.286 Y89.359 E5.76002
+G0 F7200 X85.437 Y89.359
+G1 F1800 X108.156 Y66.64 E5.78331
+G0 F7200 X107.307 Y66.64
+G1 F1800 X84.589 Y89.359 E5.78319
+G0 F7200 X83.74 Y89.359
+G1 F1800 X106.459 Y66.64 E5.78331
+G0 F7200 X105.61 Y66.64
+G1 F1800 X83.086 Y89.164 E5.73367
+G0 F7200 X83.086 Y88.316
+G1 F1800 X104.762 Y66.64 E5.51781
+G0 F7200 X103.913 Y66.64
+G1 F1800 X83.086 Y87.467 E5.30169
+G0 F7200 X83.086 Y86.619
+G1 F1800 X103.065 Y66.64 E5.08582
+G0 F7200 X102.216 Y66.64
+G1 F1800 X83.086 Y85.77 E4.8697
+G0 F7200 X83.086 Y84.922
+G1 F1800 X101.367 Y66.64 E4.65371
+G0 F7200 X100.519 Y66.64
+G1 F1800 X83.086 Y84.073 E4.43772
+G0 F7200 X83.086 Y83.225
+G1 F1800 X99.67 Y66.64 E4.22172
+G0 F7200 X98.822 Y66.64
+G1 F1800 X83.086 Y82.376 E4.00573
+G0 F7200 X83.086 Y81.527
+G1 F1800 X97.973 Y66.64 E3.78961
+G0 F7200 X97.125 Y66.64
+G1 F1800 X83.086 Y80.679 E3.57375
+G0 F7200 X83.086 Y79.83
+G1 F1800 X96.276 Y66.64 E3.35763
+G0 F7200 X95.428 Y66.64
+G1 F1800 X83.086 Y78.982 E3.14176
+G0 F7200 X83.086 Y78.133
+G1 F1800 X94.579 Y66.64 E2.92564
+G0 F7200 X93.731 Y66.64
+G1 F1800 X83.085 Y77.286 E2.71003
+G0 F7200 X83.085 Y76.437
+G1 F1800 X92.882 Y66.64 E2.49391
+G0 F7200 X92.034 Y66.64
+G1 F1800 X83.085 Y75.589 E2.27804
+G0 F7200 X83.085 Y74.74
+G1 F1800 X91.185 Y66.64 E2.06192
+G0 F7200 X90.337 Y66.64
+G1 F1800 X83.085 Y73.891 E1.84593
+G0 F7200 X83.085 Y73.043
+G1 F1800 X89.488 Y66.64 E1.62994
+G0 F7200 X88.64 Y66.64
+G1 F1800 X83.085 Y72.194 E1.41394
+G0 F7200 X83.085 Y71.346
+G1 F1800 X87.791 Y66.64 E1.19795
+G0 F7200 X86.943 Y66.64
+G1 F1800 X83.085 Y70.497 E0.98196
+G0 F7200 X83.085 Y69.649
+G1 F1800 X86.094 Y66.64 E0.76597
+G0 F7200 X85.245 Y66.64
+G1 F1800 X83.085 Y68.8 E0.54985
+G0 F7200 X83.085 Y67.952
+G1 F1800 X84.397 Y66.64 E0.33398
+G0 F7200 X83.548 Y66.64
+G1 F1800 X83.085 Y67.103 E0.11786
+ ;MESH:NONMESH
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:1587.541460
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:44
+ ;MESH:2_color_box_b.STL
+G0 X109.774 Y90.219 Z13.5
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y67.335
+G1 F1800 X108.219 Y66.641 E0.17666
+G0 F7200 X107.37 Y66.641
+G1 F1800 X108.913 Y68.184 E0.39278
+G0 F7200 X108.913 Y69.032
+G1 F1800 X106.522 Y66.641 E0.60865
+G0 F7200 X105.673 Y66.641
+G1 F1800 X108.913 Y69.881 E0.82477
+G0 F7200 X108.913 Y70.729
+G1 F1800 X104.825 Y66.641 E1.04063
+G0 F7200 X103.976 Y66.641
+G1 F1800 X108.913 Y71.578 E1.25676
+G0 F7200 X108.913 Y72.426
+G1 F1800 X103.127 Y66.641 E1.47275
+G0 F7200 X102.279 Y66.641
+G1 F1800 X108.913 Y73.275 E1.68874
+G0 F7200 X108.913 Y74.123
+G1 F1800 X101.43 Y66.641 E1.90473
+G0 F7200 X100.582 Y66.641
+G1 F1800 X108.913 Y74.972 E2.12073
+G0 F7200 X108.913 Y75.82
+G1 F1800 X99.733 Y66.641 E2.33672
+G0 F7200 X98.885 Y66.641
+G1 F1800 X108.913 Y76.669 E2.55271
+G0 F7200 X108.913 Y77.517
+G1 F1800 X98.036 Y66.641 E2.7687
+G0 F7200 X97.188 Y66.641
+G1 F1800 X108.913 Y78.366 E2.9847
+G0 F7200 X108.913 Y79.215
+G1 F1800 X96.339 Y66.641 E3.20082
+G0 F7200 X95.491 Y66.641
+G1 F1800 X108.913 Y80.063 E3.41668
+G0 F7200 X108.913 Y80.912
+G1 F1800 X94.642 Y66.641 E3.6328
+G0 F7200 X93.794 Y66.641
+G1 F1800 X108.913 Y81.76 E3.84867
+G0 F7200 X108.913 Y82.609
+G1 F1800 X92.945 Y66.641 E4.06479
+G0 F7200 X92.097 Y66.641
+G1 F1800 X108.913 Y83.457 E4.28065
+G0 F7200 X108.913 Y84.306
+G1 F1800 X91.248 Y66.641 E4.49677
+G0 F7200 X90.4 Y66.641
+G1 F1800 X108.913 Y85.154 E4.71264
+G0 F7200 X108.913 Y86.003
+G1 F1800 X89.551 Y66.641 E4.92876
+G0 F7200 X88.703 Y66.641
+G1 F1800 X108.913 Y86.851 E5.14463
+G0 F7200 X108.913 Y87.7
+G1 F1800 X87.854 Y66.641 E5.36075
+G0 F7200 X87.005 Y66.641
+G1 F1800 X108.913 Y88.548 E5.57674
+G0 F7200 X108.874 Y89.358
+G1 F1800 X86.157 Y66.641 E5.7828
+G0 F7200 X85.308 Y66.641
+G1 F1800 X108.026 Y89.358 E5.78293
+G0 F7200 X107.177 Y89.358
+G1 F1800 X84.46 Y66.641 E5.7828
+G0 F7200 X83.611 Y66.641
+G1 F1800 X106.329 Y89.358 E5.78293
+G0 F7200 X105.48 Y89.358
+G1 F1800 X83.085 Y66.963 E5.70084
+G0 F7200 X83.085 Y67.811
+G1 F1800 X104.632 Y89.358 E5.48497
+G0 F7200 X103.783 Y89.358
+G1 F1800 X83.085 Y68.66 E5.26885
+G0 F7200 X83.085 Y69.508
+G1 F1800 X102.934 Y89.358 E5.05286
+G0 F7200 X102.086 Y89.358
+G1 F1800 X83.085 Y70.357 E4.83686
+G0 F7200 X83.085 Y71.205
+G1 F1800 X101.237 Y89.358 E4.62087
+G0 F7200 X100.389 Y89.358
+G1 F1800 X83.085 Y72.054 E4.40488
+G0 F7200 X83.085 Y72.902
+G1 F1800 X99.54 Y89.358 E4.18889
+G0 F7200 X98.692 Y89.358
+G1 F1800 X83.085 Y73.751 E3.97289
+G0 F7200 X83.085 Y74.599
+G1 F1800 X97.843 Y89.358 E3.7569
+G0 F7200 X96.995 Y89.358
+G1 F1800 X83.085 Y75.448 E3.54091
+G0 F7200 X83.085 Y76.296
+G1 F1800 X96.146 Y89.358 E3.32492
+G0 F7200 X95.298 Y89.358
+G1 F1800 X83.085 Y77.145 E3.10892
+G0 F7200 X83.085 Y77.993
+G1 F1800 X94.449 Y89.358 E2.89293
+G0 F7200 X93.601 Y89.358
+G1 F1800 X83.085 Y78.843 E2.67681
+G0 F7200 X83.085 Y79.691
+G1 F1800 X92.752 Y89.358 E2.46082
+G0 F7200 X91.904 Y89.358
+G1 F1800 X83.085 Y80.54 E2.24482
+G0 F7200 X83.085 Y81.388
+G1 F1800 X91.055 Y89.358 E2.02883
+G0 F7200 X90.207 Y89.358
+G1 F1800 X83.085 Y82.237 E1.81284
+G0 F7200 X83.085 Y83.085
+G1 F1800 X89.358 Y89.358 E1.59685
+G0 F7200 X88.509 Y89.358
+G1 F1800 X83.085 Y83.934 E1.38072
+G0 F7200 X83.085 Y84.782
+G1 F1800 X87.661 Y89.358 E1.16486
+G0 F7200 X86.812 Y89.358
+G1 F1800 X83.085 Y85.631 E0.94874
+G0 F7200 X83.085 Y86.479
+G1 F1800 X85.964 Y89.358 E0.73287
+G0 F7200 X85.115 Y89.358
+G1 F1800 X83.085 Y87.328 E0.51675
+G0 F7200 X83.085 Y88.176
+G1 F1800 X84.267 Y89.358 E0.30089
+G0 F7200 X83.418 Y89.358
+G1 F1800 X83.085 Y89.025 E0.08477
+ ;MESH:NONMESH
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:1629.015962
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:45
+ ;MESH:2_color_box_b.STL
+G0 X109.774 Y90.219 Z13.8
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y88.793
+G1 F1800 X108.347 Y89.359 E0.14408
+G0 F7200 X107.499 Y89.359
+G1 F1800 X108.913 Y87.944 E0.36007
+G0 F7200 X108.913 Y87.096
+G1 F1800 X106.65 Y89.359 E0.57607
+G0 F7200 X105.802 Y89.359
+G1 F1800 X108.913 Y86.247 E0.79206
+G0 F7200 X108.913 Y85.399
+G1 F1800 X104.953 Y89.359 E1.00805
+G0 F7200 X104.105 Y89.359
+G1 F1800 X108.913 Y84.55 E1.22404
+G0 F7200 X108.913 Y83.702
+G1 F1800 X103.256 Y89.359 E1.44004
+G0 F7200 X102.408 Y89.359
+G1 F1800 X108.913 Y82.853 E1.65603
+G0 F7200 X108.913 Y82.005
+G1 F1800 X101.559 Y89.359 E1.87202
+G0 F7200 X100.711 Y89.359
+G1 F1800 X108.913 Y81.156 E2.08802
+G0 F7200 X108.913 Y80.308
+G1 F1800 X99.862 Y89.359 E2.30401
+G0 F7200 X99.014 Y89.359
+G1 F1800 X108.913 Y79.459 E2.52
+G0 F7200 X108.913 Y78.611
+G1 F1800 X98.165 Y89.359 E2.73599
+G0 F7200 X97.316 Y89.359
+G1 F1800 X108.913 Y77.762 E2.95211
+G0 F7200 X108.913 Y76.914
+G1 F1800 X96.468 Y89.359 E3.16798
+G0 F7200 X95.619 Y89.359
+G1 F1800 X108.913 Y76.065 E3.3841
+G0 F7200 X108.913 Y75.217
+G1 F1800 X94.771 Y89.359 E3.59997
+G0 F7200 X93.922 Y89.359
+G1 F1800 X108.913 Y74.368 E3.81609
+G0 F7200 X108.913 Y73.52
+G1 F1800 X93.074 Y89.359 E4.03195
+G0 F7200 X92.225 Y89.359
+G1 F1800 X108.913 Y72.671 E4.24807
+G0 F7200 X108.913 Y71.822
+G1 F1800 X91.377 Y89.359 E4.46406
+G0 F7200 X90.528 Y89.359
+G1 F1800 X108.913 Y70.974 E4.68006
+G0 F7200 X108.913 Y70.125
+G1 F1800 X89.68 Y89.359 E4.89605
+G0 F7200 X88.831 Y89.359
+G1 F1800 X108.913 Y69.277 E5.11204
+G0 F7200 X108.913 Y68.428
+G1 F1800 X87.983 Y89.359 E5.32804
+G0 F7200 X87.134 Y89.359
+G1 F1800 X108.913 Y67.58 E5.54403
+G0 F7200 X108.913 Y66.731
+G1 F1800 X86.286 Y89.359 E5.76002
+G0 F7200 X85.437 Y89.359
+G1 F1800 X108.156 Y66.64 E5.78331
+G0 F7200 X107.307 Y66.64
+G1 F1800 X84.589 Y89.359 E5.78319
+G0 F7200 X83.74 Y89.359
+G1 F1800 X106.459 Y66.64 E5.78331
+G0 F7200 X105.61 Y66.64
+G1 F1800 X83.086 Y89.164 E5.73367
+G0 F7200 X83.086 Y88.316
+G1 F1800 X104.762 Y66.64 E5.51781
+G0 F7200 X103.913 Y66.64
+G1 F1800 X83.086 Y87.467 E5.30169
+G0 F7200 X83.086 Y86.619
+G1 F1800 X103.065 Y66.64 E5.08582
+G0 F7200 X102.216 Y66.64
+G1 F1800 X83.086 Y85.77 E4.8697
+G0 F7200 X83.086 Y84.922
+G1 F1800 X101.367 Y66.64 E4.65371
+G0 F7200 X100.519 Y66.64
+G1 F1800 X83.086 Y84.073 E4.43772
+G0 F7200 X83.086 Y83.225
+G1 F1800 X99.67 Y66.64 E4.22172
+G0 F7200 X98.822 Y66.64
+G1 F1800 X83.086 Y82.376 E4.00573
+G0 F7200 X83.086 Y81.527
+G1 F1800 X97.973 Y66.64 E3.78961
+G0 F7200 X97.125 Y66.64
+G1 F1800 X83.086 Y80.679 E3.57375
+G0 F7200 X83.086 Y79.83
+G1 F1800 X96.276 Y66.64 E3.35763
+G0 F7200 X95.428 Y66.64
+G1 F1800 X83.086 Y78.982 E3.14176
+G0 F7200 X83.086 Y78.133
+G1 F1800 X94.579 Y66.64 E2.92564
+G0 F7200 X93.731 Y66.64
+G1 F1800 X83.085 Y77.286 E2.71003
+G0 F7200 X83.085 Y76.437
+G1 F1800 X92.882 Y66.64 E2.49391
+G0 F7200 X92.034 Y66.64
+G1 F1800 X83.085 Y75.589 E2.27804
+G0 F7200 X83.085 Y74.74
+G1 F1800 X91.185 Y66.64 E2.06192
+G0 F7200 X90.337 Y66.64
+G1 F1800 X83.085 Y73.891 E1.84593
+G0 F7200 X83.085 Y73.043
+G1 F1800 X89.488 Y66.64 E1.62994
+G0 F7200 X88.64 Y66.64
+G1 F1800 X83.085 Y72.194 E1.41394
+G0 F7200 X83.085 Y71.346
+G1 F1800 X87.791 Y66.64 E1.19795
+G0 F7200 X86.943 Y66.64
+G1 F1800 X83.085 Y70.497 E0.98196
+G0 F7200 X83.085 Y69.649
+G1 F1800 X86.094 Y66.64 E0.76597
+G0 F7200 X85.245 Y66.64
+G1 F1800 X83.085 Y68.8 E0.54985
+G0 F7200 X83.085 Y67.952
+G1 F1800 X84.397 Y66.64 E0.33398
+G0 F7200 X83.548 Y66.64
+G1 F1800 X83.085 Y67.103 E0.11786
+ ;MESH:NONMESH
+G0 F7200 X84.019 Y66.021
+ ;TIME_ELAPSED:1670.094630
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:46
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z14.1
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:1678.329143
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:47
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z14.4
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:1686.563657
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:48
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z14.7
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:1694.798171
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:49
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z15
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:1703.032684
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:50
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z15.3
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:1711.267198
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:51
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z15.6
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:1719.501712
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:52
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z15.9
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:1727.736226
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:53
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z16.2
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X84.019 Y66.021
+ ;TIME_ELAPSED:1735.970739
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:54
+ ;MESH:2_color_box_b.STL
+G0 X84.019 Y66.021 Z16.5
+ ;TYPE:FILL
+G1 F3600 X107.977 Y89.978 E6.09858
+G1 X108.083 Y90.084
+G0 F7200 X100.991 Y89.978
+G1 F3600 X109.532 Y81.436 E2.17431
+G1 X109.638 Y81.33
+G0 F7200 X109.533 Y83.049
+G1 F3600 X92.505 Y66.021 E4.33462
+G1 X92.399 Y65.915
+G0 F7200 X91.007 Y66.021
+G1 F3600 X82.466 Y74.562 E2.17418
+G1 X82.36 Y74.668
+G0 F7200 X82.465 Y72.952
+G1 F3600 X99.492 Y89.978 E4.33424
+G1 X99.598 Y90.084
+G0 F7200 X92.505 Y89.978
+G1 F3600 X109.532 Y72.951 E4.33437
+G1 X109.638 Y72.845
+G0 F7200 X109.533 Y74.564
+G1 F3600 X100.99 Y66.021 E2.17469
+G1 X100.884 Y65.915
+G0 F7200 X99.492 Y66.021
+G1 F3600 X82.466 Y83.047 E4.33411
+G1 X82.36 Y83.153
+G0 F7200 X82.465 Y81.437
+G1 F3600 X91.006 Y89.978 E2.17418
+G1 X91.112 Y90.084
+G0 F7200 X84.02 Y89.978
+G1 F3600 X107.978 Y66.021 E6.09858
+G1 X108.084 Y65.915
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.174 Y89.619
+ ;MESH:NONMESH
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:1743.930698
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:55
+ ;MESH:2_color_box_b.STL
+G0 X109.774 Y90.219 Z16.8
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y88.793
+G1 F1800 X108.347 Y89.359 E0.14408
+G0 F7200 X107.499 Y89.359
+G1 F1800 X108.913 Y87.944 E0.36007
+G0 F7200 X108.913 Y87.096
+G1 F1800 X106.65 Y89.359 E0.57607
+G0 F7200 X105.802 Y89.359
+G1 F1800 X108.913 Y86.247 E0.79206
+G0 F7200 X108.913 Y85.399
+G1 F1800 X104.953 Y89.359 E1.00805
+G0 F7200 X104.105 Y89.359
+G1 F1800 X108.913 Y84.55 E1.22404
+G0 F7200 X108.913 Y83.702
+G1 F1800 X103.256 Y89.359 E1.44004
+G0 F7200 X102.408 Y89.359
+G1 F1800 X108.913 Y82.853 E1.65603
+G0 F7200 X108.913 Y82.005
+G1 F1800 X101.559 Y89.359 E1.87202
+G0 F7200 X100.711 Y89.359
+G1 F1800 X108.913 Y81.156 E2.08802
+G0 F7200 X108.913 Y80.308
+G1 F1800 X99.862 Y89.359 E2.30401
+G0 F7200 X99.014 Y89.359
+G1 F1800 X108.913 Y79.459 E2.52
+G0 F7200 X108.913 Y78.611
+G1 F1800 X98.165 Y89.359 E2.73599
+G0 F7200 X97.316 Y89.359
+G1 F1800 X108.913 Y77.762 E2.95211
+G0 F7200 X108.913 Y76.914
+G1 F1800 X96.468 Y89.359 E3.16798
+G0 F7200 X95.619 Y89.359
+G1 F1800 X108.913 Y76.065 E3.3841
+G0 F7200 X108.913 Y75.217
+G1 F1800 X94.771 Y89.359 E3.59997
+G0 F7200 X93.922 Y89.359
+G1 F1800 X108.913 Y74.368 E3.81609
+G0 F7200 X108.913 Y73.52
+G1 F1800 X93.074 Y89.359 E4.03195
+G0 F7200 X92.225 Y89.359
+G1 F1800 X108.913 Y72.671 E4.24807
+G0 F7200 X108.913 Y71.822
+G1 F1800 X91.377 Y89.359 E4.46406
+G0 F7200 X90.528 Y89.359
+G1 F1800 X108.913 Y70.974 E4.68006
+G0 F7200 X108.913 Y70.125
+G1 F1800 X89.68 Y89.359 E4.89605
+G0 F7200 X88.831 Y89.359
+G1 F1800 X108.913 Y69.277 E5.11204
+G0 F7200 X108.913 Y68.428
+G1 F1800 X87.983 Y89.359 E5.32804
+G0 F7200 X87.134 Y89.359
+G1 F1800 X108.913 Y67.58 E5.54403
+G0 F7200 X108.913 Y66.731
+G1 F1800 X86.286 Y89.359 E5.76002
+G0 F7200 X85.437 Y89.359
+G1 F1800 X108.156 Y66.64 E5.78331
+G0 F7200 X107.307 Y66.64
+G1 F1800 X84.589 Y89.359 E5.78319
+G0 F7200 X83.74 Y89.359
+G1 F1800 X106.459 Y66.64 E5.78331
+G0 F7200 X105.61 Y66.64
+G1 F1800 X83.086 Y89.164 E5.73367
+G0 F7200 X83.086 Y88.316
+G1 F1800 X104.762 Y66.64 E5.51781
+G0 F7200 X103.913 Y66.64
+G1 F1800 X83.086 Y87.467 E5.30169
+G0 F7200 X83.086 Y86.619
+G1 F1800 X103.065 Y66.64 E5.08582
+G0 F7200 X102.216 Y66.64
+G1 F1800 X83.086 Y85.77 E4.8697
+G0 F7200 X83.086 Y84.922
+G1 F1800 X101.367 Y66.64 E4.65371
+G0 F7200 X100.519 Y66.64
+G1 F1800 X83.086 Y84.073 E4.43772
+G0 F7200 X83.086 Y83.225
+G1 F1800 X99.67 Y66.64 E4.22172
+G0 F7200 X98.822 Y66.64
+G1 F1800 X83.086 Y82.376 E4.00573
+G0 F7200 X83.086 Y81.527
+G1 F1800 X97.973 Y66.64 E3.78961
+G0 F7200 X97.125 Y66.64
+G1 F1800 X83.086 Y80.679 E3.57375
+G0 F7200 X83.086 Y79.83
+G1 F1800 X96.276 Y66.64 E3.35763
+G0 F7200 X95.428 Y66.64
+G1 F1800 X83.086 Y78.982 E3.14176
+G0 F7200 X83.086 Y78.133
+G1 F1800 X94.579 Y66.64 E2.92564
+G0 F7200 X93.731 Y66.64
+G1 F1800 X83.085 Y77.286 E2.71003
+G0 F7200 X83.085 Y76.437
+G1 F1800 X92.882 Y66.64 E2.49391
+G0 F7200 X92.034 Y66.64
+G1 F1800 X83.085 Y75.589 E2.27804
+G0 F7200 X83.085 Y74.74
+G1 F1800 X91.185 Y66.64 E2.06192
+G0 F7200 X90.337 Y66.64
+G1 F1800 X83.085 Y73.891 E1.84593
+G0 F7200 X83.085 Y73.043
+G1 F1800 X89.488 Y66.64 E1.62994
+G0 F7200 X88.64 Y66.64
+G1 F1800 X83.085 Y72.194 E1.41394
+G0 F7200 X83.085 Y71.346
+G1 F1800 X87.791 Y66.64 E1.19795
+G0 F7200 X86.943 Y66.64
+G1 F1800 X83.085 Y70.497 E0.98196
+G0 F7200 X83.085 Y69.649
+G1 F1800 X86.094 Y66.64 E0.76597
+G0 F7200 X85.245 Y66.64
+G1 F1800 X83.085 Y68.8 E0.54985
+G0 F7200 X83.085 Y67.952
+G1 F1800 X84.397 Y66.64 E0.33398
+G0 F7200 X83.548 Y66.64
+G1 F1800 X83.085 Y67.103 E0.11786
+ ;MESH:NONMESH
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:1785.294664
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:56
+ ;MESH:2_color_box_b.STL
+G0 X109.774 Y90.219 Z17.1
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y67.335
+G1 F1800 X108.219 Y66.641 E0.17666
+G0 F7200 X107.37 Y66.641
+G1 F1800 X108.913 Y68.184 E0.39278
+G0 F7200 X108.913 Y69.032
+G1 F1800 X106.522 Y66.641 E0.60865
+G0 F7200 X105.673 Y66.641
+G1 F1800 X108.913 Y69.881 E0.82477
+G0 F7200 X108.913 Y70.729
+G1 F1800 X104.825 Y66.641 E1.04063
+G0 F7200 X103.976 Y66.641
+G1 F1800 X108.913 Y71.578 E1.25676
+G0 F7200 X108.913 Y72.426
+G1 F1800 X103.127 Y66.641 E1.47275
+G0 F7200 X102.279 Y66.641
+G1 F1800 X108.913 Y73.275 E1.68874
+G0 F7200 X108.913 Y74.123
+G1 F1800 X101.43 Y66.641 E1.90473
+G0 F7200 X100.582 Y66.641
+G1 F1800 X108.913 Y74.972 E2.12073
+G0 F7200 X108.913 Y75.82
+G1 F1800 X99.733 Y66.641 E2.33672
+G0 F7200 X98.885 Y66.641
+G1 F1800 X108.913 Y76.669 E2.55271
+G0 F7200 X108.913 Y77.517
+G1 F1800 X98.036 Y66.641 E2.7687
+G0 F7200 X97.188 Y66.641
+G1 F1800 X108.913 Y78.366 E2.9847
+G0 F7200 X108.913 Y79.215
+G1 F1800 X96.339 Y66.641 E3.20082
+G0 F7200 X95.491 Y66.641
+G1 F1800 X108.913 Y80.063 E3.41668
+G0 F7200 X108.913 Y80.912
+G1 F1800 X94.642 Y66.641 E3.6328
+G0 F7200 X93.794 Y66.641
+G1 F1800 X108.913 Y81.76 E3.84867
+G0 F7200 X108.913 Y82.609
+G1 F1800 X92.945 Y66.641 E4.06479
+G0 F7200 X92.097 Y66.641
+G1 F1800 X108.913 Y83.457 E4.28065
+G0 F7200 X108.913 Y84.306
+G1 F1800 X91.248 Y66.641 E4.49677
+G0 F7200 X90.4 Y66.641
+G1 F1800 X108.913 Y85.154 E4.71264
+G0 F7200 X108.913 Y86.003
+G1 F1800 X89.551 Y66.641 E4.92876
+G0 F7200 X88.703 Y66.641
+G1 F1800 X108.913 Y86.851 E5.14463
+G0 F7200 X108.913 Y87.7
+G1 F1800 X87.854 Y66.641 E5.36075
+G0 F7200 X87.005 Y66.641
+G1 F1800 X108.913 Y88.548 E5.57674
+G0 F7200 X108.874 Y89.358
+G1 F1800 X86.157 Y66.641 E5.7828
+G0 F7200 X85.308 Y66.641
+G1 F1800 X108.026 Y89.358 E5.78293
+G0 F7200 X107.177 Y89.358
+G1 F1800 X84.46 Y66.641 E5.7828
+G0 F7200 X83.611 Y66.641
+G1 F1800 X106.329 Y89.358 E5.78293
+G0 F7200 X105.48 Y89.358
+G1 F1800 X83.085 Y66.963 E5.70084
+G0 F7200 X83.085 Y67.811
+G1 F1800 X104.632 Y89.358 E5.48497
+G0 F7200 X103.783 Y89.358
+G1 F1800 X83.085 Y68.66 E5.26885
+G0 F7200 X83.085 Y69.508
+G1 F1800 X102.934 Y89.358 E5.05286
+G0 F7200 X102.086 Y89.358
+G1 F1800 X83.085 Y70.357 E4.83686
+G0 F7200 X83.085 Y71.205
+G1 F1800 X101.237 Y89.358 E4.62087
+G0 F7200 X100.389 Y89.358
+G1 F1800 X83.085 Y72.054 E4.40488
+G0 F7200 X83.085 Y72.902
+G1 F1800 X99.54 Y89.358 E4.18889
+G0 F7200 X98.692 Y89.358
+G1 F1800 X83.085 Y73.751 E3.97289
+G0 F7200 X83.085 Y74.599
+M104 S240 T1
+G1 F1800 X97.843 Y89.358 E3.7569
+G0 F7200 X96.995 Y89.358
+G1 F1800 X83.085 Y75.448 E3.54091
+G0 F7200 X83.085 Y76.296
+G1 F1800 X96.146 Y89.358 E3.32492
+G0 F7200 X95.298 Y89.358
+G1 F1800 X83.085 Y77.145 E3.10892
+G0 F7200 X83.085 Y77.993
+G1 F1800 X94.449 Y89.358 E2.89293
+G0 F7200 X93.601 Y89.358
+G1 F1800 X83.085 Y78.843 E2.67681
+G0 F7200 X83.085 Y79.691
+G1 F1800 X92.752 Y89.358 E2.46082
+G0 F7200 X91.904 Y89.358
+G1 F1800 X83.085 Y80.54 E2.24482
+G0 F7200 X83.085 Y81.388
+G1 F1800 X91.055 Y89.358 E2.02883
+G0 F7200 X90.207 Y89.358
+G1 F1800 X83.085 Y82.237 E1.81284
+G0 F7200 X83.085 Y83.085
+G1 F1800 X89.358 Y89.358 E1.59685
+G0 F7200 X88.509 Y89.358
+G1 F1800 X83.085 Y83.934 E1.38072
+G0 F7200 X83.085 Y84.782
+G1 F1800 X87.661 Y89.358 E1.16486
+G0 F7200 X86.812 Y89.358
+G1 F1800 X83.085 Y85.631 E0.94874
+G0 F7200 X83.085 Y86.479
+G1 F1800 X85.964 Y89.358 E0.73287
+G0 F7200 X85.115 Y89.358
+G1 F1800 X83.085 Y87.328 E0.51675
+G0 F7200 X83.085 Y88.176
+G1 F1800 X84.267 Y89.358 E0.30089
+G0 F7200 X83.418 Y89.358
+G1 F1800 X83.085 Y89.025 E0.08477
+ ;MESH:NONMESH
+G0 F7200 X109.704 Y90.149
+G0 X109.774 Y90.219
+ ;TIME_ELAPSED:1826.769166
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:57
+ ;MESH:2_color_box_b.STL
+G0 X109.774 Y90.219 Z17.4
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F7200 X109.474 Y90.219
+G0 X109.184 Y89.629
+ ;TYPE:SKIN
+G1 F1800 X82.816 Y89.629 E4.74624
+G1 X82.816 Y66.371 E4.18644
+G1 X109.184 Y66.371 E4.74624
+G1 X109.184 Y89.629 E4.18644
+G0 F7200 X108.913 Y88.793
+G1 F1800 X108.347 Y89.359 E0.14408
+G0 F7200 X107.499 Y89.359
+G1 F1800 X108.913 Y87.944 E0.36007
+G0 F7200 X108.913 Y87.096
+G1 F1800 X106.65 Y89.359 E0.57607
+G0 F7200 X105.802 Y89.359
+G1 F1800 X108.913 Y86.247 E0.79206
+G0 F7200 X108.913 Y85.399
+G1 F1800 X104.953 Y89.359 E1.00805
+G0 F7200 X104.105 Y89.359
+G1 F1800 X108.913 Y84.55 E1.22404
+G0 F7200 X108.913 Y83.702
+G1 F1800 X103.256 Y89.359 E1.44004
+G0 F7200 X102.408 Y89.359
+G1 F1800 X108.913 Y82.853 E1.65603
+G0 F7200 X108.913 Y82.005
+G1 F1800 X101.559 Y89.359 E1.87202
+G0 F7200 X100.711 Y89.359
+G1 F1800 X108.913 Y81.156 E2.08802
+G0 F7200 X108.913 Y80.308
+G1 F1800 X99.862 Y89.359 E2.30401
+G0 F7200 X99.014 Y89.359
+G1 F1800 X108.913 Y79.459 E2.52
+G0 F7200 X108.913 Y78.611
+G1 F1800 X98.165 Y89.359 E2.73599
+G0 F7200 X97.316 Y89.359
+G1 F1800 X108.913 Y77.762 E2.95211
+G0 F7200 X108.913 Y76.914
+G1 F1800 X96.468 Y89.359 E3.16798
+G0 F7200 X95.619 Y89.359
+G1 F1800 X108.913 Y76.065 E3.3841
+G0 F7200 X108.913 Y75.217
+G1 F1800 X94.771 Y89.359 E3.59997
+G0 F7200 X93.922 Y89.359
+G1 F1800 X108.913 Y74.368 E3.81609
+G0 F7200 X108.913 Y73.52
+G1 F1800 X93.074 Y89.359 E4.03195
+G0 F7200 X92.225 Y89.359
+G1 F1800 X108.913 Y72.671 E4.24807
+G0 F7200 X108.913 Y71.822
+G1 F1800 X91.377 Y89.359 E4.46406
+G0 F7200 X90.528 Y89.359
+G1 F1800 X108.913 Y70.974 E4.68006
+G0 F7200 X108.913 Y70.125
+G1 F1800 X89.68 Y89.359 E4.89605
+G0 F7200 X88.831 Y89.359
+G1 F1800 X108.913 Y69.277 E5.11204
+G0 F7200 X108.913 Y68.428
+G1 F1800 X87.983 Y89.359 E5.32804
+G0 F7200 X87.134 Y89.359
+G1 F1800 X108.913 Y67.58 E5.54403
+G0 F7200 X108.913 Y66.731
+G1 F1800 X86.286 Y89.359 E5.76002
+G0 F7200 X85.437 Y89.359
+G1 F1800 X108.156 Y66.64 E5.78331
+G0 F7200 X107.307 Y66.64
+G1 F1800 X84.589 Y89.359 E5.78319
+G0 F7200 X83.74 Y89.359
+G1 F1800 X106.459 Y66.64 E5.78331
+G0 F7200 X105.61 Y66.64
+G1 F1800 X83.086 Y89.164 E5.73367
+G0 F7200 X83.086 Y88.316
+G1 F1800 X104.762 Y66.64 E5.51781
+G0 F7200 X103.913 Y66.64
+G1 F1800 X83.086 Y87.467 E5.30169
+G0 F7200 X83.086 Y86.619
+G1 F1800 X103.065 Y66.64 E5.08582
+G0 F7200 X102.216 Y66.64
+G1 F1800 X83.086 Y85.77 E4.8697
+G0 F7200 X83.086 Y84.922
+G1 F1800 X101.367 Y66.64 E4.65371
+G0 F7200 X100.519 Y66.64
+G1 F1800 X83.086 Y84.073 E4.43772
+G0 F7200 X83.086 Y83.225
+G1 F1800 X99.67 Y66.64 E4.22172
+G0 F7200 X98.822 Y66.64
+G1 F1800 X83.086 Y82.376 E4.00573
+G0 F7200 X83.086 Y81.527
+G1 F1800 X97.973 Y66.64 E3.78961
+G0 F7200 X97.125 Y66.64
+M104 S185
+G1 F1800 X83.086 Y80.679 E3.57375
+G0 F7200 X83.086 Y79.83
+G1 F1800 X96.276 Y66.64 E3.35763
+G0 F7200 X95.428 Y66.64
+G1 F1800 X83.086 Y78.982 E3.14176
+G0 F7200 X83.086 Y78.133
+G1 F1800 X94.579 Y66.64 E2.92564
+G0 F7200 X93.731 Y66.64
+G1 F1800 X83.085 Y77.286 E2.71003
+G0 F7200 X83.085 Y76.437
+G1 F1800 X92.882 Y66.64 E2.49391
+G0 F7200 X92.034 Y66.64
+G1 F1800 X83.085 Y75.589 E2.27804
+G0 F7200 X83.085 Y74.74
+G1 F1800 X91.185 Y66.64 E2.06192
+G0 F7200 X90.337 Y66.64
+G1 F1800 X83.085 Y73.891 E1.84593
+G0 F7200 X83.085 Y73.043
+G1 F1800 X89.488 Y66.64 E1.62994
+G0 F7200 X88.64 Y66.64
+G1 F1800 X83.085 Y72.194 E1.41394
+G0 F7200 X83.085 Y71.346
+G1 F1800 X87.791 Y66.64 E1.19795
+G0 F7200 X86.943 Y66.64
+G1 F1800 X83.085 Y70.497 E0.98196
+G0 F7200 X83.085 Y69.649
+G1 F1800 X86.094 Y66.64 E0.76597
+G0 F7200 X85.245 Y66.64
+G1 F1800 X83.085 Y68.8 E0.54985
+G0 F7200 X83.085 Y67.952
+G1 F1800 X84.397 Y66.64 E0.33398
+G0 F7200 X83.548 Y66.64
+G1 F1800 X83.085 Y67.103 E0.11786
+ ;MESH:NONMESH
+G0 F7200 X108.574 Y89.019
+ ;TIME_ELAPSED:1868.119029
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:58
+G10 S1
+T1
+M109 T240
+M104 S0 T0
+ ;MESH:2_color_box_a.STL
+G0 F4800 X108.574 Y89.019 Z17.7
+M104 T250
+ ;TYPE:WALL-INNER
+G11
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y68.681
+G1 F900 X106.873 Y67.841 E0.21383
+G0 F4800 X106.025 Y67.841
+G1 F900 X107.713 Y69.529 E0.42969
+G0 F4800 X107.713 Y70.378
+G1 F900 X105.176 Y67.841 E0.64581
+G0 F4800 X104.327 Y67.841
+G1 F900 X107.713 Y71.226 E0.86181
+G0 F4800 X107.713 Y72.075
+G1 F900 X103.479 Y67.841 E1.0778
+G0 F4800 X102.63 Y67.841
+G1 F900 X107.713 Y72.923 E1.29379
+G0 F4800 X107.713 Y73.772
+G1 F900 X101.782 Y67.841 E1.50979
+G0 F4800 X100.933 Y67.841
+G1 F900 X107.713 Y74.62 E1.72578
+G0 F4800 X107.713 Y75.469
+G1 F900 X100.085 Y67.841 E1.94177
+G0 F4800 X99.236 Y67.841
+G1 F900 X107.713 Y76.318 E2.15789
+G0 F4800 X107.713 Y77.166
+G1 F900 X98.388 Y67.841 E2.37376
+G0 F4800 X97.539 Y67.841
+G1 F900 X107.713 Y78.015 E2.58988
+G0 F4800 X107.713 Y78.863
+G1 F900 X96.691 Y67.841 E2.80574
+G0 F4800 X95.842 Y67.841
+G1 F900 X107.713 Y79.712 E3.02186
+G0 F4800 X107.713 Y80.56
+G1 F900 X94.994 Y67.841 E3.23773
+G0 F4800 X94.145 Y67.841
+G1 F900 X107.713 Y81.409 E3.45385
+G0 F4800 X107.713 Y82.257
+G1 F900 X93.297 Y67.841 E3.66971
+G0 F4800 X92.448 Y67.841
+G1 F900 X107.713 Y83.106 E3.88583
+G0 F4800 X107.713 Y83.954
+G1 F900 X91.6 Y67.841 E4.1017
+G0 F4800 X90.751 Y67.841
+G1 F900 X107.713 Y84.803 E4.31782
+G0 F4800 X107.713 Y85.651
+G1 F900 X89.902 Y67.841 E4.53381
+G0 F4800 X89.054 Y67.841
+G1 F900 X107.713 Y86.5 E4.74981
+G0 F4800 X107.713 Y87.348
+G1 F900 X88.205 Y67.841 E4.9658
+G0 F4800 X87.357 Y67.841
+G1 F900 X107.674 Y88.158 E5.17186
+G0 F4800 X106.826 Y88.158
+G1 F900 X86.508 Y67.841 E5.17199
+G0 F4800 X85.66 Y67.841
+G1 F900 X105.977 Y88.158 E5.17186
+G0 F4800 X105.129 Y88.158
+G1 F900 X84.811 Y67.841 E5.17199
+G0 F4800 X84.285 Y68.163
+G1 F900 X104.28 Y88.158 E5.0899
+G0 F4800 X103.432 Y88.158
+G1 F900 X84.285 Y69.012 E4.8739
+G0 F4800 X84.285 Y69.86
+G1 F900 X102.583 Y88.158 E4.65791
+G0 F4800 X101.734 Y88.158
+G1 F900 X84.285 Y70.709 E4.44179
+G0 F4800 X84.285 Y71.557
+G1 F900 X100.886 Y88.158 E4.22592
+G0 F4800 X100.037 Y88.158
+G1 F900 X84.285 Y72.406 E4.0098
+G0 F4800 X84.285 Y73.254
+G1 F900 X99.189 Y88.158 E3.79394
+G0 F4800 X98.34 Y88.158
+G1 F900 X84.285 Y74.103 E3.57782
+G0 F4800 X84.285 Y74.951
+G1 F900 X97.492 Y88.158 E3.36195
+G0 F4800 X96.643 Y88.158
+G1 F900 X84.285 Y75.8 E3.14583
+G0 F4800 X84.285 Y76.648
+G1 F900 X95.795 Y88.158 E2.92997
+G0 F4800 X94.946 Y88.158
+G1 F900 X84.285 Y77.497 E2.71385
+G0 F4800 X84.285 Y78.346
+G1 F900 X94.098 Y88.158 E2.49785
+G0 F4800 X93.249 Y88.158
+G1 F900 X84.285 Y79.194 E2.28186
+G0 F4800 X84.285 Y80.043
+G1 F900 X92.401 Y88.158 E2.06587
+G0 F4800 X91.552 Y88.158
+G1 F900 X84.285 Y80.891 E1.84988
+G0 F4800 X84.285 Y81.74
+G1 F900 X90.704 Y88.158 E1.63388
+G0 F4800 X89.855 Y88.158
+G1 F900 X84.285 Y82.588 E1.41789
+G0 F4800 X84.285 Y83.437
+G1 F900 X89.007 Y88.158 E1.2019
+G0 F4800 X88.158 Y88.158
+G1 F900 X84.285 Y84.285 E0.9859
+G0 F4800 X84.285 Y85.134
+G1 F900 X87.31 Y88.158 E0.76991
+G0 F4800 X86.461 Y88.158
+G1 F900 X84.285 Y85.982 E0.55392
+G0 F4800 X84.285 Y86.831
+G1 F900 X85.612 Y88.158 E0.3378
+G0 F4800 X84.764 Y88.158
+G1 F900 X84.285 Y87.679 E0.12193
+ ;MESH:NONMESH
+G0 F4800 X108.574 Y89.019
+ ;TIME_ELAPSED:1939.614451
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:59
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z18
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y87.447
+G1 F900 X107.002 Y88.159 E0.18112
+G0 F4800 X106.153 Y88.159
+G1 F900 X107.713 Y86.599 E0.39711
+G0 F4800 X107.713 Y85.75
+G1 F900 X105.305 Y88.159 E0.6131
+G0 F4800 X104.456 Y88.159
+G1 F900 X107.713 Y84.902 E0.8291
+G0 F4800 X107.713 Y84.053
+G1 F900 X103.608 Y88.159 E1.04509
+G0 F4800 X102.759 Y88.159
+G1 F900 X107.713 Y83.205 E1.26108
+G0 F4800 X107.713 Y82.356
+G1 F900 X101.911 Y88.159 E1.47708
+G0 F4800 X101.062 Y88.159
+G1 F900 X107.713 Y81.508 E1.69307
+G0 F4800 X107.713 Y80.659
+G1 F900 X100.214 Y88.159 E1.90906
+G0 F4800 X99.365 Y88.159
+G1 F900 X107.713 Y79.811 E2.12505
+G0 F4800 X107.713 Y78.962
+G1 F900 X98.516 Y88.159 E2.34117
+G0 F4800 X97.668 Y88.159
+G1 F900 X107.713 Y78.114 E2.55704
+G0 F4800 X107.713 Y77.265
+G1 F900 X96.819 Y88.159 E2.77316
+G0 F4800 X95.971 Y88.159
+G1 F900 X107.713 Y76.417 E2.98903
+G0 F4800 X107.713 Y75.568
+G1 F900 X95.122 Y88.159 E3.20515
+G0 F4800 X94.274 Y88.159
+G1 F900 X107.713 Y74.719 E3.42114
+G0 F4800 X107.713 Y73.871
+G1 F900 X93.425 Y88.159 E3.63713
+G0 F4800 X92.577 Y88.159
+G1 F900 X107.713 Y73.022 E3.85312
+G0 F4800 X107.713 Y72.174
+G1 F900 X91.728 Y88.159 E4.06912
+G0 F4800 X90.88 Y88.159
+G1 F900 X107.713 Y71.325 E4.28511
+G0 F4800 X107.713 Y70.477
+G1 F900 X90.031 Y88.159 E4.5011
+G0 F4800 X89.183 Y88.159
+G1 F900 X107.713 Y69.628 E4.7171
+G0 F4800 X107.713 Y68.78
+G1 F900 X88.334 Y88.159 E4.93309
+G0 F4800 X87.486 Y88.159
+G1 F900 X107.713 Y67.931 E5.14908
+G0 F4800 X106.955 Y67.841
+G1 F900 X86.637 Y88.159 E5.17212
+G0 F4800 X85.789 Y88.159
+G1 F900 X106.107 Y67.841 E5.17212
+G0 F4800 X105.258 Y67.841
+G1 F900 X84.94 Y88.159 E5.17212
+G0 F4800 X84.286 Y87.964
+G1 F900 X104.409 Y67.841 E5.12248
+G0 F4800 X103.561 Y67.841
+G1 F900 X84.286 Y87.116 E4.90661
+G0 F4800 X84.286 Y86.267
+G1 F900 X102.712 Y67.841 E4.69049
+G0 F4800 X101.864 Y67.841
+G1 F900 X84.286 Y85.419 E4.47463
+G0 F4800 X84.286 Y84.57
+G1 F900 X101.015 Y67.841 E4.25851
+G0 F4800 X100.167 Y67.841
+G1 F900 X84.286 Y83.722 E4.04264
+G0 F4800 X84.286 Y82.873
+G1 F900 X99.318 Y67.841 E3.82652
+G0 F4800 X98.47 Y67.841
+G1 F900 X84.286 Y82.025 E3.61066
+G0 F4800 X84.286 Y81.176
+G1 F900 X97.621 Y67.841 E3.39454
+G0 F4800 X96.773 Y67.841
+G1 F900 X84.286 Y80.328 E3.17867
+G0 F4800 X84.286 Y79.479
+G1 F900 X95.924 Y67.841 E2.96255
+G0 F4800 X95.076 Y67.841
+G1 F900 X84.286 Y78.63 E2.74656
+G0 F4800 X84.286 Y77.782
+G1 F900 X94.227 Y67.841 E2.53057
+G0 F4800 X93.379 Y67.841
+G1 F900 X84.286 Y76.933 E2.31457
+G0 F4800 X84.286 Y76.085
+G1 F900 X92.53 Y67.841 E2.09858
+G0 F4800 X91.682 Y67.841
+G1 F900 X84.286 Y75.236 E1.88259
+G0 F4800 X84.286 Y74.388
+G1 F900 X90.833 Y67.841 E1.66659
+G0 F4800 X89.984 Y67.841
+G1 F900 X84.286 Y73.539 E1.45047
+G0 F4800 X84.286 Y72.691
+G1 F900 X89.136 Y67.841 E1.23461
+G0 F4800 X88.287 Y67.841
+G1 F900 X84.286 Y71.842 E1.01849
+G0 F4800 X84.286 Y70.994
+G1 F900 X87.439 Y67.841 E0.80262
+G0 F4800 X86.59 Y67.841
+G1 F900 X84.286 Y70.145 E0.5865
+G0 F4800 X84.286 Y69.297
+G1 F900 X85.742 Y67.841 E0.37064
+G0 F4800 X84.893 Y67.841
+G1 F900 X84.286 Y68.448 E0.15452
+ ;MESH:NONMESH
+G0 F4800 X108.574 Y89.019
+ ;TIME_ELAPSED:2010.355787
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:60
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z18.3
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y68.681
+G1 F900 X106.873 Y67.841 E0.21383
+G0 F4800 X106.025 Y67.841
+G1 F900 X107.713 Y69.529 E0.42969
+G0 F4800 X107.713 Y70.378
+G1 F900 X105.176 Y67.841 E0.64581
+G0 F4800 X104.327 Y67.841
+G1 F900 X107.713 Y71.226 E0.86181
+G0 F4800 X107.713 Y72.075
+G1 F900 X103.479 Y67.841 E1.0778
+G0 F4800 X102.63 Y67.841
+G1 F900 X107.713 Y72.923 E1.29379
+G0 F4800 X107.713 Y73.772
+G1 F900 X101.782 Y67.841 E1.50979
+G0 F4800 X100.933 Y67.841
+G1 F900 X107.713 Y74.62 E1.72578
+G0 F4800 X107.713 Y75.469
+G1 F900 X100.085 Y67.841 E1.94177
+G0 F4800 X99.236 Y67.841
+G1 F900 X107.713 Y76.318 E2.15789
+G0 F4800 X107.713 Y77.166
+G1 F900 X98.388 Y67.841 E2.37376
+G0 F4800 X97.539 Y67.841
+G1 F900 X107.713 Y78.015 E2.58988
+G0 F4800 X107.713 Y78.863
+G1 F900 X96.691 Y67.841 E2.80574
+G0 F4800 X95.842 Y67.841
+G1 F900 X107.713 Y79.712 E3.02186
+G0 F4800 X107.713 Y80.56
+G1 F900 X94.994 Y67.841 E3.23773
+G0 F4800 X94.145 Y67.841
+G1 F900 X107.713 Y81.409 E3.45385
+G0 F4800 X107.713 Y82.257
+G1 F900 X93.297 Y67.841 E3.66971
+G0 F4800 X92.448 Y67.841
+G1 F900 X107.713 Y83.106 E3.88583
+G0 F4800 X107.713 Y83.954
+G1 F900 X91.6 Y67.841 E4.1017
+G0 F4800 X90.751 Y67.841
+G1 F900 X107.713 Y84.803 E4.31782
+G0 F4800 X107.713 Y85.651
+G1 F900 X89.902 Y67.841 E4.53381
+G0 F4800 X89.054 Y67.841
+G1 F900 X107.713 Y86.5 E4.74981
+G0 F4800 X107.713 Y87.348
+G1 F900 X88.205 Y67.841 E4.9658
+G0 F4800 X87.357 Y67.841
+G1 F900 X107.674 Y88.158 E5.17186
+G0 F4800 X106.826 Y88.158
+G1 F900 X86.508 Y67.841 E5.17199
+G0 F4800 X85.66 Y67.841
+G1 F900 X105.977 Y88.158 E5.17186
+G0 F4800 X105.129 Y88.158
+G1 F900 X84.811 Y67.841 E5.17199
+G0 F4800 X84.285 Y68.163
+G1 F900 X104.28 Y88.158 E5.0899
+G0 F4800 X103.432 Y88.158
+G1 F900 X84.285 Y69.012 E4.8739
+G0 F4800 X84.285 Y69.86
+G1 F900 X102.583 Y88.158 E4.65791
+G0 F4800 X101.734 Y88.158
+G1 F900 X84.285 Y70.709 E4.44179
+G0 F4800 X84.285 Y71.557
+G1 F900 X100.886 Y88.158 E4.22592
+G0 F4800 X100.037 Y88.158
+G1 F900 X84.285 Y72.406 E4.0098
+G0 F4800 X84.285 Y73.254
+G1 F900 X99.189 Y88.158 E3.79394
+G0 F4800 X98.34 Y88.158
+G1 F900 X84.285 Y74.103 E3.57782
+G0 F4800 X84.285 Y74.951
+G1 F900 X97.492 Y88.158 E3.36195
+G0 F4800 X96.643 Y88.158
+G1 F900 X84.285 Y75.8 E3.14583
+G0 F4800 X84.285 Y76.648
+G1 F900 X95.795 Y88.158 E2.92997
+G0 F4800 X94.946 Y88.158
+G1 F900 X84.285 Y77.497 E2.71385
+G0 F4800 X84.285 Y78.346
+G1 F900 X94.098 Y88.158 E2.49785
+G0 F4800 X93.249 Y88.158
+G1 F900 X84.285 Y79.194 E2.28186
+G0 F4800 X84.285 Y80.043
+G1 F900 X92.401 Y88.158 E2.06587
+G0 F4800 X91.552 Y88.158
+G1 F900 X84.285 Y80.891 E1.84988
+G0 F4800 X84.285 Y81.74
+G1 F900 X90.704 Y88.158 E1.63388
+G0 F4800 X89.855 Y88.158
+G1 F900 X84.285 Y82.588 E1.41789
+G0 F4800 X84.285 Y83.437
+G1 F900 X89.007 Y88.158 E1.2019
+G0 F4800 X88.158 Y88.158
+G1 F900 X84.285 Y84.285 E0.9859
+G0 F4800 X84.285 Y85.134
+G1 F900 X87.31 Y88.158 E0.76991
+G0 F4800 X86.461 Y88.158
+G1 F900 X84.285 Y85.982 E0.55392
+G0 F4800 X84.285 Y86.831
+G1 F900 X85.612 Y88.158 E0.3378
+G0 F4800 X84.764 Y88.158
+G1 F900 X84.285 Y87.679 E0.12193
+ ;MESH:NONMESH
+G0 F4800 X85.219 Y67.221
+ ;TIME_ELAPSED:2081.186198
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:61
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z18.6
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:2098.425218
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:62
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z18.9
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:2115.664237
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:63
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z19.2
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:2132.903257
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:64
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z19.5
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:2150.142277
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:65
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z19.8
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:2167.381296
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:66
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z20.1
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:2184.620316
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:67
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z20.4
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X85.219 Y67.221
+ ;TIME_ELAPSED:2201.859335
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:68
+ ;MESH:2_color_box_a.STL
+G0 X85.219 Y67.221 Z20.7
+ ;TYPE:FILL
+G1 F1800 X106.777 Y88.778 E5.48764
+G1 X106.883 Y88.884
+G0 F4800 X102.191 Y88.778
+G1 F1800 X108.333 Y82.636 E1.5635
+G0 F4800 X108.333 Y81.849
+G1 F1800 X93.705 Y67.221 E3.72368
+G1 X93.599 Y67.115
+G0 F4800 X89.807 Y67.221
+G1 F1800 X83.666 Y73.362 E1.56324
+G0 F4800 X83.665 Y74.152
+G1 F1800 X98.292 Y88.778 E3.7233
+G1 X98.398 Y88.884
+G0 F4800 X93.705 Y88.778
+G1 F1800 X108.333 Y74.151 E3.72355
+G0 F4800 X108.333 Y73.364
+G1 F1800 X102.19 Y67.221 E1.56375
+G1 X102.084 Y67.115
+G0 F4800 X98.292 Y67.221
+G1 F1800 X83.666 Y81.847 E3.72317
+G0 F4800 X83.665 Y82.637
+G1 F1800 X89.806 Y88.778 E1.56324
+G1 X89.912 Y88.884
+G0 F4800 X85.22 Y88.778
+G1 F1800 X106.778 Y67.221 E5.48764
+G1 X106.884 Y67.115
+G0 F4800 X108.574 Y89.019
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X108.574 Y89.195
+ ;MESH:NONMESH
+G0 X108.574 Y89.019
+ ;TIME_ELAPSED:2218.701214
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:69
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z21
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y87.447
+G1 F900 X107.002 Y88.159 E0.18112
+G0 F4800 X106.153 Y88.159
+G1 F900 X107.713 Y86.599 E0.39711
+G0 F4800 X107.713 Y85.75
+G1 F900 X105.305 Y88.159 E0.6131
+G0 F4800 X104.456 Y88.159
+G1 F900 X107.713 Y84.902 E0.8291
+G0 F4800 X107.713 Y84.053
+G1 F900 X103.608 Y88.159 E1.04509
+G0 F4800 X102.759 Y88.159
+G1 F900 X107.713 Y83.205 E1.26108
+G0 F4800 X107.713 Y82.356
+G1 F900 X101.911 Y88.159 E1.47708
+G0 F4800 X101.062 Y88.159
+G1 F900 X107.713 Y81.508 E1.69307
+G0 F4800 X107.713 Y80.659
+G1 F900 X100.214 Y88.159 E1.90906
+G0 F4800 X99.365 Y88.159
+G1 F900 X107.713 Y79.811 E2.12505
+G0 F4800 X107.713 Y78.962
+G1 F900 X98.516 Y88.159 E2.34117
+G0 F4800 X97.668 Y88.159
+G1 F900 X107.713 Y78.114 E2.55704
+G0 F4800 X107.713 Y77.265
+G1 F900 X96.819 Y88.159 E2.77316
+G0 F4800 X95.971 Y88.159
+G1 F900 X107.713 Y76.417 E2.98903
+G0 F4800 X107.713 Y75.568
+G1 F900 X95.122 Y88.159 E3.20515
+G0 F4800 X94.274 Y88.159
+G1 F900 X107.713 Y74.719 E3.42114
+G0 F4800 X107.713 Y73.871
+G1 F900 X93.425 Y88.159 E3.63713
+G0 F4800 X92.577 Y88.159
+G1 F900 X107.713 Y73.022 E3.85312
+G0 F4800 X107.713 Y72.174
+G1 F900 X91.728 Y88.159 E4.06912
+G0 F4800 X90.88 Y88.159
+G1 F900 X107.713 Y71.325 E4.28511
+G0 F4800 X107.713 Y70.477
+G1 F900 X90.031 Y88.159 E4.5011
+G0 F4800 X89.183 Y88.159
+G1 F900 X107.713 Y69.628 E4.7171
+G0 F4800 X107.713 Y68.78
+G1 F900 X88.334 Y88.159 E4.93309
+G0 F4800 X87.486 Y88.159
+G1 F900 X107.713 Y67.931 E5.14908
+G0 F4800 X106.955 Y67.841
+G1 F900 X86.637 Y88.159 E5.17212
+G0 F4800 X85.789 Y88.159
+G1 F900 X106.107 Y67.841 E5.17212
+G0 F4800 X105.258 Y67.841
+G1 F900 X84.94 Y88.159 E5.17212
+G0 F4800 X84.286 Y87.964
+G1 F900 X104.409 Y67.841 E5.12248
+G0 F4800 X103.561 Y67.841
+G1 F900 X84.286 Y87.116 E4.90661
+G0 F4800 X84.286 Y86.267
+G1 F900 X102.712 Y67.841 E4.69049
+G0 F4800 X101.864 Y67.841
+G1 F900 X84.286 Y85.419 E4.47463
+G0 F4800 X84.286 Y84.57
+G1 F900 X101.015 Y67.841 E4.25851
+G0 F4800 X100.167 Y67.841
+G1 F900 X84.286 Y83.722 E4.04264
+G0 F4800 X84.286 Y82.873
+G1 F900 X99.318 Y67.841 E3.82652
+G0 F4800 X98.47 Y67.841
+G1 F900 X84.286 Y82.025 E3.61066
+G0 F4800 X84.286 Y81.176
+G1 F900 X97.621 Y67.841 E3.39454
+G0 F4800 X96.773 Y67.841
+G1 F900 X84.286 Y80.328 E3.17867
+G0 F4800 X84.286 Y79.479
+G1 F900 X95.924 Y67.841 E2.96255
+G0 F4800 X95.076 Y67.841
+G1 F900 X84.286 Y78.63 E2.74656
+G0 F4800 X84.286 Y77.782
+G1 F900 X94.227 Y67.841 E2.53057
+G0 F4800 X93.379 Y67.841
+G1 F900 X84.286 Y76.933 E2.31457
+G0 F4800 X84.286 Y76.085
+G1 F900 X92.53 Y67.841 E2.09858
+G0 F4800 X91.682 Y67.841
+G1 F900 X84.286 Y75.236 E1.88259
+G0 F4800 X84.286 Y74.388
+G1 F900 X90.833 Y67.841 E1.66659
+G0 F4800 X89.984 Y67.841
+G1 F900 X84.286 Y73.539 E1.45047
+G0 F4800 X84.286 Y72.691
+G1 F900 X89.136 Y67.841 E1.23461
+G0 F4800 X88.287 Y67.841
+G1 F900 X84.286 Y71.842 E1.01849
+G0 F4800 X84.286 Y70.994
+G1 F900 X87.439 Y67.841 E0.80262
+G0 F4800 X86.59 Y67.841
+G1 F900 X84.286 Y70.145 E0.5865
+G0 F4800 X84.286 Y69.297
+G1 F900 X85.742 Y67.841 E0.37064
+G0 F4800 X84.893 Y67.841
+G1 F900 X84.286 Y68.448 E0.15452
+ ;MESH:NONMESH
+G0 F4800 X108.574 Y89.019
+ ;TIME_ELAPSED:2289.442549
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:70
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z21.3
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y68.681
+G1 F900 X106.873 Y67.841 E0.21383
+G0 F4800 X106.025 Y67.841
+G1 F900 X107.713 Y69.529 E0.42969
+G0 F4800 X107.713 Y70.378
+G1 F900 X105.176 Y67.841 E0.64581
+G0 F4800 X104.327 Y67.841
+G1 F900 X107.713 Y71.226 E0.86181
+G0 F4800 X107.713 Y72.075
+G1 F900 X103.479 Y67.841 E1.0778
+G0 F4800 X102.63 Y67.841
+G1 F900 X107.713 Y72.923 E1.29379
+G0 F4800 X107.713 Y73.772
+G1 F900 X101.782 Y67.841 E1.50979
+G0 F4800 X100.933 Y67.841
+G1 F900 X107.713 Y74.62 E1.72578
+G0 F4800 X107.713 Y75.469
+G1 F900 X100.085 Y67.841 E1.94177
+G0 F4800 X99.236 Y67.841
+G1 F900 X107.713 Y76.318 E2.15789
+G0 F4800 X107.713 Y77.166
+G1 F900 X98.388 Y67.841 E2.37376
+G0 F4800 X97.539 Y67.841
+G1 F900 X107.713 Y78.015 E2.58988
+G0 F4800 X107.713 Y78.863
+G1 F900 X96.691 Y67.841 E2.80574
+G0 F4800 X95.842 Y67.841
+G1 F900 X107.713 Y79.712 E3.02186
+G0 F4800 X107.713 Y80.56
+G1 F900 X94.994 Y67.841 E3.23773
+G0 F4800 X94.145 Y67.841
+G1 F900 X107.713 Y81.409 E3.45385
+G0 F4800 X107.713 Y82.257
+G1 F900 X93.297 Y67.841 E3.66971
+G0 F4800 X92.448 Y67.841
+G1 F900 X107.713 Y83.106 E3.88583
+G0 F4800 X107.713 Y83.954
+G1 F900 X91.6 Y67.841 E4.1017
+G0 F4800 X90.751 Y67.841
+G1 F900 X107.713 Y84.803 E4.31782
+G0 F4800 X107.713 Y85.651
+G1 F900 X89.902 Y67.841 E4.53381
+G0 F4800 X89.054 Y67.841
+G1 F900 X107.713 Y86.5 E4.74981
+G0 F4800 X107.713 Y87.348
+G1 F900 X88.205 Y67.841 E4.9658
+G0 F4800 X87.357 Y67.841
+G1 F900 X107.674 Y88.158 E5.17186
+G0 F4800 X106.826 Y88.158
+G1 F900 X86.508 Y67.841 E5.17199
+G0 F4800 X85.66 Y67.841
+G1 F900 X105.977 Y88.158 E5.17186
+G0 F4800 X105.129 Y88.158
+G1 F900 X84.811 Y67.841 E5.17199
+G0 F4800 X84.285 Y68.163
+G1 F900 X104.28 Y88.158 E5.0899
+G0 F4800 X103.432 Y88.158
+G1 F900 X84.285 Y69.012 E4.8739
+G0 F4800 X84.285 Y69.86
+G1 F900 X102.583 Y88.158 E4.65791
+G0 F4800 X101.734 Y88.158
+G1 F900 X84.285 Y70.709 E4.44179
+G0 F4800 X84.285 Y71.557
+G1 F900 X100.886 Y88.158 E4.22592
+G0 F4800 X100.037 Y88.158
+G1 F900 X84.285 Y72.406 E4.0098
+G0 F4800 X84.285 Y73.254
+G1 F900 X99.189 Y88.158 E3.79394
+G0 F4800 X98.34 Y88.158
+G1 F900 X84.285 Y74.103 E3.57782
+G0 F4800 X84.285 Y74.951
+G1 F900 X97.492 Y88.158 E3.36195
+G0 F4800 X96.643 Y88.158
+G1 F900 X84.285 Y75.8 E3.14583
+G0 F4800 X84.285 Y76.648
+G1 F900 X95.795 Y88.158 E2.92997
+G0 F4800 X94.946 Y88.158
+G1 F900 X84.285 Y77.497 E2.71385
+G0 F4800 X84.285 Y78.346
+G1 F900 X94.098 Y88.158 E2.49785
+G0 F4800 X93.249 Y88.158
+G1 F900 X84.285 Y79.194 E2.28186
+G0 F4800 X84.285 Y80.043
+G1 F900 X92.401 Y88.158 E2.06587
+G0 F4800 X91.552 Y88.158
+G1 F900 X84.285 Y80.891 E1.84988
+G0 F4800 X84.285 Y81.74
+G1 F900 X90.704 Y88.158 E1.63388
+G0 F4800 X89.855 Y88.158
+G1 F900 X84.285 Y82.588 E1.41789
+G0 F4800 X84.285 Y83.437
+G1 F900 X89.007 Y88.158 E1.2019
+G0 F4800 X88.158 Y88.158
+G1 F900 X84.285 Y84.285 E0.9859
+G0 F4800 X84.285 Y85.134
+G1 F900 X87.31 Y88.158 E0.76991
+G0 F4800 X86.461 Y88.158
+G1 F900 X84.285 Y85.982 E0.55392
+G0 F4800 X84.285 Y86.831
+G1 F900 X85.612 Y88.158 E0.3378
+G0 F4800 X84.764 Y88.158
+G1 F900 X84.285 Y87.679 E0.12193
+ ;MESH:NONMESH
+G0 F4800 X108.574 Y89.019
+ ;TIME_ELAPSED:2360.321044
+ M104 s200 T235  ;Robox Temp Nozzle fix 
+  M140 S85 ; Robox Bed heat Fix 
+;LAYER:71
+ ;MESH:2_color_box_a.STL
+G0 X108.574 Y89.019 Z21.6
+ ;TYPE:WALL-INNER
+G1 F1800 X83.426 Y89.019 E4.52664
+G1 X83.426 Y66.981 E3.96684
+G1 X108.574 Y66.981 E4.52664
+G1 X108.574 Y89.019 E3.96684
+G0 F4800 X109.174 Y89.619
+G1 F1800 X82.826 Y89.619 E4.74264
+G1 X82.826 Y66.381 E4.18284
+G1 X109.174 Y66.381 E4.74264
+G1 X109.174 Y89.619 E4.18284
+G0 F4800 X109.774 Y90.219
+ ;TYPE:WALL-OUTER
+G1 F1800 X82.226 Y90.219 E4.95864
+G1 X82.226 Y65.781 E4.39884
+G1 X109.774 Y65.781 E4.95864
+G1 X109.774 Y90.219 E4.39884
+G0 F4800 X109.474 Y90.219
+G0 X109.104 Y89.549
+G0 X107.984 Y88.429
+ ;TYPE:SKIN
+G1 F900 X84.016 Y88.429 E4.31424
+G1 X84.016 Y67.571 E3.75444
+G1 X107.984 Y67.571 E4.31424
+G1 X107.984 Y88.429 E3.75444
+G0 F4800 X107.713 Y87.447
+G1 F900 X107.002 Y88.159 E0.18112
+G0 F4800 X106.153 Y88.159
+G1 F900 X107.713 Y86.599 E0.39711
+G0 F4800 X107.713 Y85.75
+G1 F900 X105.305 Y88.159 E0.6131
+G0 F4800 X104.456 Y88.159
+G1 F900 X107.713 Y84.902 E0.8291
+G0 F4800 X107.713 Y84.053
+G1 F900 X103.608 Y88.159 E1.04509
+G0 F4800 X102.759 Y88.159
+G1 F900 X107.713 Y83.205 E1.26108
+G0 F4800 X107.713 Y82.356
+G1 F900 X101.911 Y88.159 E1.47708
+G0 F4800 X101.062 Y88.159
+G1 F900 X107.713 Y81.508 E1.69307
+G0 F4800 X107.713 Y80.659
+G1 F900 X100.214 Y88.159 E1.90906
+G0 F4800 X99.365 Y88.159
+G1 F900 X107.713 Y79.811 E2.12505
+G0 F4800 X107.713 Y78.962
+G1 F900 X98.516 Y88.159 E2.34117
+G0 F4800 X97.668 Y88.159
+G1 F900 X107.713 Y78.114 E2.55704
+G0 F4800 X107.713 Y77.265
+G1 F900 X96.819 Y88.159 E2.77316
+G0 F4800 X95.971 Y88.159
+G1 F900 X107.713 Y76.417 E2.98903
+G0 F4800 X107.713 Y75.568
+G1 F900 X95.122 Y88.159 E3.20515
+G0 F4800 X94.274 Y88.159
+G1 F900 X107.713 Y74.719 E3.42114
+G0 F4800 X107.713 Y73.871
+G1 F900 X93.425 Y88.159 E3.63713
+G0 F4800 X92.577 Y88.159
+G1 F900 X107.713 Y73.022 E3.85312
+G0 F4800 X107.713 Y72.174
+G1 F900 X91.728 Y88.159 E4.06912
+G0 F4800 X90.88 Y88.159
+G1 F900 X107.713 Y71.325 E4.28511
+G0 F4800 X107.713 Y70.477
+G1 F900 X90.031 Y88.159 E4.5011
+G0 F4800 X89.183 Y88.159
+G1 F900 X107.713 Y69.628 E4.7171
+G0 F4800 X107.713 Y68.78
+G1 F900 X88.334 Y88.159 E4.93309
+G0 F4800 X87.486 Y88.159
+G1 F900 X107.713 Y67.931 E5.14908
+G0 F4800 X106.955 Y67.841
+G1 F900 X86.637 Y88.159 E5.17212
+G0 F4800 X85.789 Y88.159
+G1 F900 X106.107 Y67.841 E5.17212
+G0 F4800 X105.258 Y67.841
+G1 F900 X84.94 Y88.159 E5.17212
+G0 F4800 X84.286 Y87.964
+G1 F900 X104.409 Y67.841 E5.12248
+G0 F4800 X103.561 Y67.841
+G1 F900 X84.286 Y87.116 E4.90661
+G0 F4800 X84.286 Y86.267
+G1 F900 X102.712 Y67.841 E4.69049
+G0 F4800 X101.864 Y67.841
+G1 F900 X84.286 Y85.419 E4.47463
+G0 F4800 X84.286 Y84.57
+G1 F900 X101.015 Y67.841 E4.25851
+G0 F4800 X100.167 Y67.841
+G1 F900 X84.286 Y83.722 E4.04264
+G0 F4800 X84.286 Y82.873
+G1 F900 X99.318 Y67.841 E3.82652
+G0 F4800 X98.47 Y67.841
+G1 F900 X84.286 Y82.025 E3.61066
+G0 F4800 X84.286 Y81.176
+G1 F900 X97.621 Y67.841 E3.39454
+G0 F4800 X96.773 Y67.841
+G1 F900 X84.286 Y80.328 E3.17867
+G0 F4800 X84.286 Y79.479
+G1 F900 X95.924 Y67.841 E2.96255
+G0 F4800 X95.076 Y67.841
+G1 F900 X84.286 Y78.63 E2.74656
+G0 F4800 X84.286 Y77.782
+G1 F900 X94.227 Y67.841 E2.53057
+G0 F4800 X93.379 Y67.841
+G1 F900 X84.286 Y76.933 E2.31457
+G0 F4800 X84.286 Y76.085
+G1 F900 X92.53 Y67.841 E2.09858
+G0 F4800 X91.682 Y67.841
+G1 F900 X84.286 Y75.236 E1.88259
+G0 F4800 X84.286 Y74.388
+G1 F900 X90.833 Y67.841 E1.66659
+G0 F4800 X89.984 Y67.841
+G1 F900 X84.286 Y73.539 E1.45047
+G0 F4800 X84.286 Y72.691
+G1 F900 X89.136 Y67.841 E1.23461
+G0 F4800 X88.287 Y67.841
+G1 F900 X84.286 Y71.842 E1.01849
+G0 F4800 X84.286 Y70.994
+G1 F900 X87.439 Y67.841 E0.80262
+G0 F4800 X86.59 Y67.841
+G1 F900 X84.286 Y70.145 E0.5865
+G0 F4800 X84.286 Y69.297
+G1 F900 X85.742 Y67.841 E0.37064
+G0 F4800 X84.893 Y67.841
+G1 F900 X84.286 Y68.448 E0.15452
+ ;TIME_ELAPSED:2430.649793
+G10
+M140 S0
+M82  ;absolute extrusion mode
+M107
+M104 T0  ;extruder heater off
+M140 S0  ;heated bed heater off (if you have it)
+G91  ;relative positioning
+G1 E-1 F300   ;retract the filament a bit before lifting the nozzle, to release some of the pressure
+G1 Z+0.5 E-5 X-20 Y-20 F9000  ;move Z up a bit and retract filament even more
+G28 X0 Y0  ;move X/Y to min endstops, so the head is out of the way
+M84  ;steppers off
+G90  ;absolute positioning
+M82  ;absolute extrusion mode
+M104 T0
+ ;End of Gcode
+;SETTING_3 {"global_quality": "[general]\\nversion = 4\\nname = AR_Grip_Test\\nd
+;SETTING_3 efinition = fdmprinter\\n\\n[metadata]\\ntype = quality_changes\\nqua
+;SETTING_3 lity_type = draft\\nsetting_version = 5\\n\\n[values]\\nlayer_height 
+;SETTING_3 = 0.3\\nrelative_extrusion = True\\nsupport_enable = True\\nsupport_e
+;SETTING_3 xtruder_nr = 1\\nsupport_interface_extruder_nr = 0\\n\\n", "extruder_
+;SETTING_3 quality": ["[general]\\nversion = 4\\nname = AR_Grip_Test\\ndefinitio
+;SETTING_3 n = fdmprinter\\n\\n[metadata]\\ntype = quality_changes\\nquality_typ
+;SETTING_3 e = draft\\nsetting_version = 5\\nposition = 0\\n\\n[values]\\nbrim_l
+;SETTING_3 ine_count = 3\\nbrim_width = 4\\nskirt_brim_speed = 20\\nspeed_suppor
+;SETTING_3 t_interface = 15\\nsupport_interface_enable = True\\n\\n", "[general]
+;SETTING_3 \\nversion = 4\\nname = AR_Grip_Test\\ndefinition = fdmprinter\\n\\n[
+;SETTING_3 metadata]\\ntype = quality_changes\\nquality_type = draft\\nsetting_v
+;SETTING_3 ersion = 5\\nposition = 1\\n\\n[values]\\ninitial_layer_line_width_fa
+;SETTING_3 ctor = 120\\nspeed_layer_0 = 10\\nspeed_print = 30\\nspeed_travel = 8
+;SETTING_3 0\\nspeed_wall = 30\\nspeed_wall_x = 30\\nwall_line_count = 3\\nz_sea
+;SETTING_3 m_type = back\\n\\n"]}
@@ -0,0 +1,31 @@
+;FLAVOR:RepRap
+;Generated with Cura_SteamEngine 4.8.0
+M83
+G90
+T0
+G0 F3600 X10 Y10 Z0.3
+G1 F1500 E-6.5
+;LAYER:0
+G0 F3600 X20 Y20 Z0.3
+G1 F1500 E6.5
+G1 F1200 X30 Y20 E0.5
+G1 F1500 E-6.5
+E T100 T1 G1 X20 Y30
+;LAYER:1
+G1 F1500 E-6.5
+G0 F3600 X20 Y20 Z0.5
+G1 F1500 E6.5
+G1 F1200 X30 Y20 E0.5
+G1 F1500 E-6.5 E-1 T0
+;LAYER:2
+G1 F1500 E6.5
+G1 F1200 X30 Y30 E0.5
+G1 F1500 E-6.5
+E T000 T0 G1 X40 Y30
+;LAYER:3
+G1 F1500 E-6.5
+G0 F3600 X20 Y20 Z0.9
+G1 F1500 E6.5
+G1 F1200 X30 Y20 E0.5 T1
+;END
+M104 S0
@@ -0,0 +1,18 @@
+####################################################################
+# Loads modules of the Robox plugin outside of Cura
+#
+# The benchmarks import the plugin's modules the way its scripts do
+# when they run on their own, see _plugin_loader.py in the plugin
+# directory.
+####################################################################
+
+import os
+import sys
+
+plugin_path = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "files", "plugins",
+                                            "RoboxPrinterPlugin"))
+sys.path.insert(0, plugin_path)
+
+from _plugin_loader import load_plugin_module  # after the plugin directory is on the path
+
+__all__ = ["load_plugin_module"]
@@ -0,0 +1,258 @@
+####################################################################
+# Headless batch post-processing for already sliced g-code files
+#
+# Converts .gcode files written by Cura (or any other slicer) into
+# .rb.gcode files for the Robox printers without starting Cura:
+#
+#   python RoboxBatchProcessing.py --model cel_robox_dual --close-valve part1.gcode part2.gcode
+#
+# Only RoboxPostProcessing is imported, not the Cura plugin itself,
+# so neither Cura nor Qt has to be installed. With --jobs the files
+# are spread over a pool of processes, each file gets its own
+# RoboxPostProcessing instance as the tool and valve state is per file.
+# With --segment-jobs the segments of each file are rewritten in
+# parallel instead, seeded with the tool and valve state found by
+# RoboxPostProcessing.scan_state.
+# With --print-statistics print time, filament per extruder and tool
+# changes are gathered while writing and appended as a comment block,
+# RoboxPrintStatistics.py reads them back.
+# With --mmap the input is memory-mapped and decoded and processed one
+# segment at a time, so resident memory stays flat however big the
+# file is; the output always goes through a --write-buffer-mb sized
+# buffer.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+####################################################################
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import mmap
+import os
+import sys
+import time
+
+if __package__:
+    from . import RoboxPostProcessing
+else:  # run as a script
+    from _plugin_loader import load_plugin_module
+    RoboxPostProcessing = load_plugin_module("RoboxPostProcessing")
+
+output_extension = ".rb.gcode"
+default_write_buffer = 8 << 20
+
+ConversionResult = collections.namedtuple("ConversionResult",
+                                          ["input_path", "output_path", "error", "seconds", "input_bytes",
+                                           "output_bytes"])
+
+
+# output_path_for - returns the .rb.gcode path for an input file, next to it or in output_dir
+def output_path_for(input_path: str, output_dir: str = None) -> str:
+    name = os.path.basename(input_path)
+    if name.lower().endswith(".gcode"):
+        name = name[:-len(".gcode")]
+    return os.path.join(output_dir or os.path.dirname(input_path), name + output_extension)
+
+
+# read_segments - reads a text file in blocks and yields it cut at line ends,
+# so that processing the segments one after another gives the same output as processing the whole file
+def read_segments(source, segment_chars: int = 1 << 20):
+    remainder = ""
+    while True:
+        block = source.read(segment_chars)
+        if not block:
+            yield remainder
+            return
+        block = remainder + block
+        end = block.rfind("\n")
+        if end < 0:
+            remainder = block
+            continue
+        yield block[:end]
+        remainder = block[end + 1:]
+
+
+# mmap_segments - like read_segments, but the file is memory-mapped and each segment is bytes copied straight
+# from the mapped pages, RoboxPostProcessing decodes them as it processes them. The pages of processed segments
+# are released again where the platform allows it, so neither the file nor its mapping adds up in memory.
+# Newlines are translated like text mode reads them.
+def mmap_segments(path: str, segment_bytes: int = 1 << 20):
+    with open(path, "rb") as source:
+        size = os.fstat(source.fileno()).st_size
+        if size == 0:
+            yield b""
+            return
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            release = hasattr(mapped, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+            if release and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            start = released = 0
+            while start < size:
+                end = min(start + segment_bytes, size)
+                cut = mapped.rfind(b"\n", start, end)
+                if cut < 0:  # a line longer than a segment
+                    cut = mapped.find(b"\n", end)
+                    if cut < 0:
+                        break
+                yield _translate_newlines(mapped[start:cut], True)
+                start = cut + 1
+                if release and start - released >= segment_bytes:
+                    page_end = start - start % mmap.PAGESIZE
+                    mapped.madvise(mmap.MADV_DONTNEED, released, page_end - released)
+                    released = page_end
+            yield _translate_newlines(mapped[start:size], False)
+
+
+def _translate_newlines(data: bytes, cut_at_newline: bool) -> bytes:
+    if b"\r" in data:
+        if cut_at_newline and data.endswith(b"\r"):
+            data = data[:-1]  # the \r of the \r\n the segment was cut at
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data
+
+
+# convert_file - post-processes one g-code file, returns the number of bytes written
+def convert_file(input_path: str, output_path: str, model_name: str, close_valve: bool,
+                 engine=RoboxPostProcessing.Engine.tokenized, executor=None, print_statistics: bool = False,
+                 use_mmap: bool = False, write_buffer: int = default_write_buffer) -> int:
+    processor = RoboxPostProcessing.RoboxPostProcessing(model_name, close_valve, engine)
+    statistics = RoboxPostProcessing.PrintStatistics() if print_statistics else None
+    with contextlib.ExitStack() as stack:
+        if use_mmap:
+            segments = mmap_segments(input_path)
+            if executor is not None:  # scan_state and the worker processes take str
+                segments = (segment.decode("utf-8") for segment in segments)
+        else:
+            segments = read_segments(stack.enter_context(open(input_path, "r", encoding="utf-8")))
+        try:
+            with open(output_path, "wb", buffering=write_buffer) as output:
+                header = processor.get_header().encode()
+                output.write(header)
+                written = len(header)
+                target = statistics.wrap(output) if statistics is not None else output
+                if executor is None:
+                    for data in segments:
+                        written += processor.process_into(target, data)
+                else:
+                    for block in processor.iter_parallel(segments, executor):
+                        encoded = block.encode()
+                        target.write(encoded)
+                        written += len(encoded)
+                if statistics is not None:
+                    trailer = statistics.trailer()
+                    output.write(trailer)
+                    written += len(trailer)
+        except BaseException:  # don't leave a half written file behind
+            if os.path.isfile(output_path):
+                os.remove(output_path)
+            raise
+    return written
+
+
+# convert_job - converts one file and reports the outcome instead of raising, so it can run in a worker process
+def convert_job(input_path: str, output_path: str, model_name: str, close_valve: bool,
+                engine=RoboxPostProcessing.Engine.tokenized, executor=None, print_statistics: bool = False,
+                use_mmap: bool = False, write_buffer: int = default_write_buffer) -> ConversionResult:
+    start = time.perf_counter()
+    error = None
+    input_bytes = output_bytes = 0
+    try:
+        input_bytes = os.path.getsize(input_path)
+        output_bytes = convert_file(input_path, output_path, model_name, close_valve, engine, executor,
+                                    print_statistics, use_mmap, write_buffer)
+    except Exception as e:  # one broken file should not stop the rest of the batch
+        error = str(e) or type(e).__name__
+    return ConversionResult(input_path, output_path, error, time.perf_counter() - start, input_bytes, output_bytes)
+
+
+# convert_files - converts (input_path, output_path) pairs with the given number of worker processes,
+# yields a ConversionResult per file in the order of the pairs.
+# With segment_workers the files are converted one by one, each spread over that many processes.
+def convert_files(paths, model_name: str, close_valve: bool, engine=RoboxPostProcessing.Engine.tokenized,
+                  workers: int = 1, segment_workers: int = 1, print_statistics: bool = False, use_mmap: bool = False,
+                  write_buffer: int = default_write_buffer):
+    paths = list(paths)
+    if segment_workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=segment_workers) as executor:
+            for input_path, output_path in paths:
+                yield convert_job(input_path, output_path, model_name, close_valve, engine, executor,
+                                  print_statistics, use_mmap, write_buffer)
+        return
+    if workers <= 1 or len(paths) <= 1:
+        for input_path, output_path in paths:
+            yield convert_job(input_path, output_path, model_name, close_valve, engine, None, print_statistics,
+                              use_mmap, write_buffer)
+        return
+
+    count = len(paths)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, count)) as executor:
+        yield from executor.map(convert_job, [input_path for input_path, _ in paths],
+                                [output_path for _, output_path in paths], [model_name] * count,
+                                [close_valve] * count, [engine] * count, [None] * count,
+                                [print_statistics] * count, [use_mmap] * count, [write_buffer] * count)
+
+
+def format_result(result: ConversionResult) -> str:
+    if result.error is not None:
+        return "FAILED " + result.input_path + ": " + result.error
+    rate = result.input_bytes / 1e6 / result.seconds if result.seconds > 0 else 0.0
+    return "ok     %s -> %s (%.1f MB in %.2fs, %.1f MB/s)" % (result.input_path, result.output_path,
+                                                              result.input_bytes / 1e6, result.seconds, rate)
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Convert sliced .gcode files into .rb.gcode files for Robox printers")
+    parser.add_argument("files", nargs="+", help="g-code files to convert")
+    parser.add_argument("--model", required=True, choices=[model.value for model in RoboxPostProcessing.Model],
+                        help="printer head the files were sliced for")
+    parser.add_argument("--close-valve", action="store_true", help="close the nozzle valves on retraction")
+    parser.add_argument("--output-dir", default=None, help="directory for the .rb.gcode files (default: next to the input)")
+    parser.add_argument("--engine", default=RoboxPostProcessing.Engine.tokenized.value,
+                        choices=[engine.value for engine in RoboxPostProcessing.Engine],
+                        help="post-processing engine")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="number of files converted in parallel, 0 uses one process per CPU (default: 1)")
+    parser.add_argument("--segment-jobs", type=int, default=1,
+                        help="number of processes rewriting the segments of one file in parallel, "
+                             "0 uses one process per CPU (default: 1, can't be combined with --jobs)")
+    parser.add_argument("--print-statistics", action="store_true",
+                        help="append print time, filament per extruder and tool changes as a comment block")
+    parser.add_argument("--mmap", action="store_true",
+                        help="memory-map the input files, keeps memory use flat for multi-gigabyte files")
+    parser.add_argument("--write-buffer-mb", type=int, default=default_write_buffer >> 20,
+                        help="size of the output buffer in MB (default: %d)" % (default_write_buffer >> 20))
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    arguments = parse_arguments(argv)
+    if arguments.output_dir:
+        os.makedirs(arguments.output_dir, exist_ok=True)
+    workers = arguments.jobs if arguments.jobs > 0 else (os.cpu_count() or 1)
+    segment_workers = arguments.segment_jobs if arguments.segment_jobs > 0 else (os.cpu_count() or 1)
+    if segment_workers > 1:
+        workers = 1
+    paths = [(input_path, output_path_for(input_path, arguments.output_dir)) for input_path in arguments.files]
+
+    start = time.perf_counter()
+    failed = converted_bytes = 0
+    for result in convert_files(paths, arguments.model, arguments.close_valve,
+                                RoboxPostProcessing.Engine(arguments.engine), workers, segment_workers,
+                                arguments.print_statistics, arguments.mmap,
+                                max(arguments.write_buffer_mb, 1) << 20):
+        if result.error is not None:
+            failed += 1
+            print(format_result(result), file=sys.stderr)
+        else:
+            converted_bytes += result.input_bytes
+            print(format_result(result))
+    seconds = time.perf_counter() - start
+    print("%d of %d files converted in %.2fs (%.1f MB/s) with %d worker(s)" % (
+        len(paths) - failed, len(paths), seconds, converted_bytes / 1e6 / seconds if seconds > 0 else 0.0,
+        segment_workers if segment_workers > 1 else min(workers, len(paths))))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,11 @@
 import re
 from . import _version
+import collections
 import enum
+import hashlib
+import json
+import threading
+import time
 
 
 class Model(enum.Enum):
@@ -19,22 +24,1154 @@ class ValveState(enum.Enum):
     Undefined = "undefined"
 
 
+class Engine(enum.Enum):
+    regex = "regex"  # original per-line regex dispatch, kept for comparison
+    tokenized = "tokenized"  # each line is split once into command + parameter words
+
+
+class ExportStatistics:
+    """Optional timers and counters of one export.
+
+    Set it as RoboxPostProcessing.statistics to have process_into time its stages, time other stages
+    with add_time and read everything back with as_dict. Without it the processor only keeps its plain
+    counters, so disabled instrumentation costs next to nothing.
+    """
+
+    def __init__(self):
+        self.seconds = collections.defaultdict(float)  # stage name -> seconds
+        self.counters = {}  # extra counters of the caller, added to as_dict as they are
+        self.layers = 0
+        self.bytes = 0
+        self.processor = None
+
+    def add_time(self, stage: str, seconds: float):
+        self.seconds[stage] += seconds
+
+    # write - writes encoded data to the stream, counting its time and bytes
+    def write(self, stream, data: bytes):
+        start = time.perf_counter()
+        stream.write(data)
+        self.seconds["write"] += time.perf_counter() - start
+        self.bytes += len(data)
+
+    # process_into - the timed version of RoboxPostProcessing.process_into
+    def process_into(self, processor, stream, data) -> int:
+        self.processor = processor
+        self.layers += 1
+        clock = time.perf_counter
+        written = 0
+        blocks = processor.iter_blocks(data)
+        start = clock()
+        for block in blocks:
+            encode_start = clock()
+            encoded = block.encode()
+            write_start = clock()
+            stream.write(encoded)
+            end = clock()
+            self.seconds["execute"] += encode_start - start
+            self.seconds["encode"] += write_start - encode_start
+            self.seconds["write"] += end - write_start
+            written += len(encoded)
+            start = clock()
+        self.seconds["execute"] += clock() - start
+        self.bytes += written
+        return written
+
+    def as_dict(self) -> dict:
+        result = {
+            "seconds": dict(self.seconds),
+            "layers": self.layers,
+            "bytes": self.bytes,
+        }
+        result.update(self.counters)
+        if self.processor is not None:
+            result.update({
+                "model": self.processor.model.value,
+                "close_valve": self.processor.roboxCloseValve,
+                "engine": self.processor.engine.value,
+                "lines": self.processor.lines,
+                "tool_changes": self.processor.tool_changes,
+                "valve_opens": self.processor.valve_opens,
+                "valve_closes": self.processor.valve_closes,
+            })
+        return result
+
+
+
+class LayerCache:
+    """Bounded LRU cache of processed layers for repeated exports of the same slice.
+
+    A layer is looked up by the hash of its g-code, the printer model, the close valve option and the
+    tool and valve state the processor is in when the layer starts. An entry holds the encoded output
+    and the state and counters the layer leaves behind, so a hit moves the processor on exactly as
+    processing the layer would. The engines give identical output, so the engine is not part of the key.
+    One cache is shared by exports that run at the same time, lookups, inserts and evictions hold a lock;
+    the layer itself is processed and written outside of it.
+    Only layers whose output is at most max_bytes // 8 are kept. The output blocks are kept as written,
+    so capturing a layer costs no more than one copy of its output, and a large layer (vase mode) is
+    streamed without being held in memory at all.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_bytes // 8
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    # layer_hash - the hash of the layer, str is hashed as its UTF-8 encoding so both give the same key
+    @staticmethod
+    def layer_hash(data, segment_chars: int = 1 << 20) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        if not isinstance(data, str):
+            digest.update(data)
+            return digest.digest()
+        for start in range(0, len(data), segment_chars):
+            digest.update(data[start:start + segment_chars].encode())
+        return digest.digest()
+
+    # process_into - writes the processed layer to the stream, from the cache if possible
+    def process_into(self, processor, stream, data) -> int:
+        if self.max_bytes <= 0:
+            return processor.process_into(stream, data)
+        key = (self.layer_hash(data), processor.model, processor.roboxCloseValve, processor.selectedTool,
+               processor.valve_state)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            else:
+                self.misses += 1
+        if entry is not None:
+            blocks, size, selected_tool, valve_state, lines, tool_changes, valve_opens, valve_closes = entry
+            if processor.statistics is not None:
+                processor.statistics.layers += 1
+                for block in blocks:
+                    processor.statistics.write(stream, block)
+            else:
+                for block in blocks:
+                    stream.write(block)
+            processor.selectedTool = selected_tool
+            processor.valve_state = valve_state
+            processor.lines += lines
+            processor.tool_changes += tool_changes
+            processor.valve_opens += valve_opens
+            processor.valve_closes += valve_closes
+            return size
+
+        counters = (processor.lines, processor.tool_changes, processor.valve_opens, processor.valve_closes)
+        capture = _CaptureStream(stream, self.max_entry_bytes)
+        written = processor.process_into(capture, data)
+        if capture.blocks is not None:
+            entry = (tuple(capture.blocks), capture.size, processor.selectedTool, processor.valve_state,
+                     processor.lines - counters[0], processor.tool_changes - counters[1],
+                     processor.valve_opens - counters[2], processor.valve_closes - counters[3])
+            with self._lock:
+                previous = self._entries.pop(key, None)  # another export may have cached the same layer meanwhile
+                if previous is not None:
+                    self.size -= previous[1]
+                self._entries[key] = entry
+                self.size += capture.size
+                while self.size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self.size -= evicted[1]
+        return written
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self.size,
+                    "max_bytes": self.max_bytes}
+
+
+# _CaptureStream - passes writes on to a stream and keeps the written blocks, until they add up to more than
+# max_bytes
+class _CaptureStream:
+    def __init__(self, stream, max_bytes: int):
+        self.stream = stream
+        self.max_bytes = max_bytes
+        self.blocks = []
+        self.size = 0
+
+    def write(self, data):
+        self.stream.write(data)
+        if self.blocks is not None:
+            self.size += len(data)
+            if self.size > self.max_bytes:
+                self.blocks = None  # too big to ever be cached
+            else:
+                self.blocks.append(data)
+        return len(data)
+
+
+class _LineStage:
+    """Base of the stages fed with the g-code as it is written, through the stream wrap returns.
+
+    add takes the blocks as they come, joins a line cut by the end of a block with the rest of it in the
+    next one and hands the whole lines to lines(); finish hands over the last line of the g-code, the one
+    without line end. lines() passes every line to the line() hook and returns what the stage writes on;
+    stages that scan the blocks with regexes override lines() and return None, the stream then writes
+    the g-code on as it came.
+    """
+
+    def __init__(self):
+        self._remainder = b""
+
+    # add - handles the whole lines of a block, a line cut by the end of the block is kept for the next one
+    def add(self, data: bytes):
+        if self._remainder:
+            data = self._remainder + data
+        end = data.rfind(b"\n") + 1
+        self._remainder = bytes(data[end:])
+        return self.lines(data, end)
+
+    # finish - handles the line without line end and what is held back, at the end of the g-code
+    def finish(self):
+        data = self._remainder + b"\n" if self._remainder else b""
+        self._remainder = b""
+        return self.lines(data, len(data), True)
+
+    # lines - handles data[:end], which ends with a line end; last is set for the end of the g-code
+    def lines(self, data: bytes, end: int, last: bool = False):
+        output = []
+        if end:
+            handle = self.line
+            for line in bytes(data[:end - 1]).split(b"\n"):
+                handle(line, output)
+        if last:
+            self._release(output)
+        return self._output(output)
+
+    # line - handles one line without its line end, appending what is written on to output
+    def line(self, line: bytes, output):
+        output.append(line + b"\n")
+
+    # _release - appends the lines held back to output
+    def _release(self, output):
+        pass
+
+    def _output(self, output) -> bytes:
+        return b"".join(output)
+
+    # wrap - a stream that passes everything written to it through the stage on to stream
+    def wrap(self, stream):
+        return _StageStream(stream, self)
+
+
+# _StageStream - passes writes on to a stream through a stage, finish() writes what the stage holds back and
+# finishes the stages after it
+class _StageStream:
+    def __init__(self, stream, stage: _LineStage):
+        self.stream = stream
+        self.stage = stage
+
+    def write(self, data):
+        output = self.stage.add(data)
+        if output is None:  # the stage only looks at the g-code
+            return self.stream.write(data)
+        if output:
+            self.stream.write(output)
+        return len(data)
+
+    def finish(self):
+        output = self.stage.finish()
+        if output:
+            self.stream.write(output)
+        if hasattr(self.stream, "finish"):
+            self.stream.finish()
+
+    def __getattr__(self, name):  # seek, truncate, flush... of the wrapped stream
+        return getattr(self.stream, name)
+
+
+class _MoveStage(_LineStage):
+    """Base of the line stages that follow the head through the G0/G1 moves, absolute or relative (G91).
+
+    The X, Y and Z position is None while unknown. _value reads the number of a word, None if it has none.
+    """
+
+    axes = (b"X", b"Y", b"Z")
+    moves = (b"G0", b"G1")
+    tool_codes = (b"T0", b"T1")
+    # G codes that neither move nor use the feedrate
+    passive_codes = (b"G4", b"G90", b"G91", b"G92")
+
+    def __init__(self):
+        super().__init__()
+        self.position = dict.fromkeys(self.axes)
+        self.relative = False  # G91
+
+    # _goes_somewhere_unknown - whether the command leaves the head where the g-code doesn't say: a bare G0
+    # or G1 sends the Robox head to its zero position, a tool select moves it to switch the nozzles, homing,
+    # probing, arcs... go where the firmware takes it
+    def _goes_somewhere_unknown(self, code: bytes, words) -> bool:
+        if code in self.moves:
+            return len(words) == 1
+        if code in self.tool_codes:
+            return True
+        return code[:1] == b"G" and code not in self.passive_codes
+
+    # _set_positioning - follows G90/G91 and the position G92 sets
+    def _set_positioning(self, code: bytes, words):
+        if code == b"G90" or code == b"G91":
+            self.relative = code == b"G91"
+        elif code == b"G92":
+            for word in words[1:]:
+                if word[:1] in self.axes:
+                    self.position[word[:1]] = self._value(word)
+
+    @staticmethod
+    def _value(word: bytes):
+        try:
+            return float(word[1:])
+        except ValueError:
+            return None
+
+
+class PrintStatistics(_LineStage):
+    """Print time, filament length per extruder and tool changes of Robox g-code.
+
+    A _LineStage that only reads, so the statistics come from the same single pass that converts the file
+    and also cover cached layers. Only the rare lines (M82/M83, G92, T, ;TIME:, ;TIME_ELAPSED:, ;LAYER:)
+    are looked at one by one. Between them, in relative extrusion mode, all " E<value>" and " D<value>"
+    words are summed with one regex scan per axis, and the words found in comments are subtracted again;
+    in absolute mode only the last word of the span is looked up.
+    E is the filament of the first extruder, D of the second.
+    trailer() gives the comment block written at the end of the file, from_trailer reads it back.
+    """
+
+    axes = (b"E", b"D")
+    event = rb"[ \t]*(?:(M8[23])\b|G92\b([^;\n]*)|;TIME:(\d+)|;TIME_ELAPSED:(\d+(?:\.\d*)?)|;LAYER:-?\d+|T(\d+)\b)[^\n]*"
+    # events after a newline (a literal first character keeps the scan fast) and on the first line of a block
+    event_pattern = re.compile(rb"\n" + event)
+    first_event_pattern = re.compile(event)
+    # every E (or D) word, starting with a literal so the scan is fast
+    word_patterns = {axis: re.compile(rb" " + axis + rb"(-?\d*\.?\d+)") for axis in axes}
+    comment_pattern = re.compile(rb";[^\n]*")
+    trailer_begin = b"; Robox print statistics"
+    trailer_end = b"; end of Robox print statistics"
+
+    def __init__(self):
+        super().__init__()
+        self.estimated_time = None  # Cura's ;TIME: estimate in seconds
+        self.elapsed_time = None  # the last ;TIME_ELAPSED:
+        self.filament = {axis: 0.0 for axis in self.axes}  # mm per axis
+        self.positions = {axis: 0.0 for axis in self.axes}
+        self.relative = False  # absolute extrusion until M83, like the firmware
+        self.tool = None
+        self.tool_changes = 0
+        self.layers = 0
+
+    # lines - counts the whole lines of a block
+    def lines(self, data: bytes, end: int, last: bool = False):
+        start = 0
+        event = self.first_event_pattern.match(data, 0, end)
+        if event is not None:
+            self._add_event(event)
+            start = event.end()
+        for event in self.event_pattern.finditer(data, start, end):
+            self._add_extrusion(data, start, event.start())
+            self._add_event(event)
+            start = event.end()
+        self._add_extrusion(data, start, end)
+
+    def _add_event(self, event):
+        mode, position, estimated, elapsed, tool = event.groups()
+        if mode is not None:
+            # the position the firmware counted before is unknown here, absolute values start again from zero
+            self.relative = mode == b"M83"
+            self.positions = {axis: 0.0 for axis in self.axes}
+        elif position is not None:
+            for axis, value in re.findall(rb"\b([ED])(-?\d*\.?\d+)", position):
+                self.positions[axis] = float(value)
+        elif estimated is not None:
+            self.estimated_time = int(estimated)
+        elif elapsed is not None:
+            self.elapsed_time = float(elapsed)
+        elif tool is not None:
+            if self.tool is not None and tool != self.tool:
+                self.tool_changes += 1
+            self.tool = tool
+        else:
+            self.layers += 1
+
+    def _add_extrusion(self, data: bytes, start: int, end: int):
+        if start >= end:
+            return
+        comments = None
+        for axis in self.axes:
+            if self.relative:
+                values = self.word_patterns[axis].findall(data, start, end)
+                if not values:
+                    continue
+                if comments is None:
+                    comments = b"\n".join(self.comment_pattern.findall(data, start, end))
+                moved = sum(map(float, values)) - sum(map(float, self.word_patterns[axis].findall(comments)))
+                self.positions[axis] += moved
+            else:
+                last = self._last_value(axis, data, start, end)
+                if last is None:
+                    continue
+                moved = last - self.positions[axis]
+                self.positions[axis] = last
+            self.filament[axis] += moved
+
+    # _last_value - the value of the last axis word between start and end that is not in a comment
+    def _last_value(self, axis: bytes, data: bytes, start: int, end: int):
+        needle = b" " + axis
+        while True:
+            found = data.rfind(needle, start, end)
+            if found < 0:
+                return None
+            match = self.word_patterns[axis].match(data, found, end)
+            if match is not None and data.find(b";", max(data.rfind(b"\n", start, found) + 1, start), found) < 0:
+                return float(match.group(1))
+            end = found
+
+    @property
+    def print_time(self):
+        return self.estimated_time if self.estimated_time is not None else self.elapsed_time
+
+    def as_dict(self) -> dict:
+        return {"print_time_s": self.print_time, "filament_E_mm": round(self.filament[b"E"], 5),
+                "filament_D_mm": round(self.filament[b"D"], 5), "tool_changes": self.tool_changes,
+                "layers": self.layers}
+
+    # trailer - the statistics as a comment block, one "; key: value" line each
+    def trailer(self) -> bytes:
+        lines = [self.trailer_begin]
+        for key, value in self.as_dict().items():
+            lines.append(b"; %s: %s" % (key.encode(), str(value).encode()))
+        lines.append(self.trailer_end)
+        return b"\n".join(lines) + b"\n"
+
+    # from_trailer - the values of the last statistics block in data, None if there is none
+    @classmethod
+    def from_trailer(cls, data: bytes):
+        begin = data.rfind(cls.trailer_begin + b"\n")
+        if begin < 0:
+            return None
+        end = data.find(cls.trailer_end, begin)
+        if end < 0:
+            return None
+        values = {}
+        for line in data[begin + len(cls.trailer_begin) + 1:end].splitlines():
+            key, _, value = line[2:].decode().partition(": ")
+            try:
+                values[key] = int(value)
+            except ValueError:
+                try:
+                    values[key] = float(value)
+                except ValueError:
+                    values[key] = None
+        return values
+
+
+class LayerIndex(_LineStage):
+    """Byte offset, Z, tool and valve state of every layer of written Robox g-code.
+
+    A _LineStage that only reads, like PrintStatistics. A layer starts at its ;LAYER: line; x, y, feedrate,
+    tool and valve are the ones in effect there, as a layer may rely on them after the command optimizer,
+    and z is the first Z the layer moves to (the Z before it if the layer has none).
+    Only tool selects, ;LAYER: lines and G90/G91 are looked at one by one, the X, Y, Z, F and B words
+    between them are searched for from the ends of the span. Values not known are None.
+    to_json gives the sidecar written next to the file, from_json reads it back.
+    """
+
+    extension = ".layers.json"  # added to the name of the g-code file
+    fields = ["layer", "offset", "z", "x", "y", "feedrate", "tool", "valve"]
+    event = rb"[ \t]*(?:(T[01])\b|;LAYER:(-?\d+)|(G9[01])\b)[^\n]*"
+    event_pattern = re.compile(rb"\n" + event)
+    first_event_pattern = re.compile(event)
+    axis_patterns = {axis: re.compile(rb" " + axis + rb"(-?\d*\.?\d+)") for axis in (b"X", b"Y", b"Z", b"F")}
+    valve_pattern = re.compile(rb" B([01])\b")
+
+    def __init__(self):
+        super().__init__()
+        self.layers = []  # a list of the fields per layer
+        self.tool = None
+        self.valve_state = ValveState.Undefined
+        self.position = dict.fromkeys(self.axis_patterns)  # X, Y, Z and F, None while unknown
+        self.relative = False  # G91
+        self.size = 0  # bytes written so far
+        self._offset = 0  # the offset of the first line not indexed yet
+        self._pending = None  # the last layer while its z is not known yet
+
+    def add(self, data: bytes):
+        self.size += len(data)
+        return super().add(data)
+
+    # lines - indexes the whole lines of a block
+    def lines(self, data: bytes, end: int, last: bool = False):
+        base = self._offset  # the offset of data in the file
+        self._offset += end
+        start = 0
+        event = self.first_event_pattern.match(data, 0, end)
+        if event is not None:
+            self._add_event(event, base)
+            start = event.end()
+        for event in self.event_pattern.finditer(data, start, end):
+            self._add_span(data, start, event.start())
+            self._add_event(event, base + event.start() + 1)
+            start = event.end()
+        self._add_span(data, start, end)
+
+    def _add_event(self, event, offset: int):
+        tool, layer, mode = event.groups()
+        if tool is not None:
+            self.tool = tool.decode()
+        elif mode is not None:
+            self.relative = mode == b"G91"
+            if self.relative:
+                self.position.update(dict.fromkeys((b"X", b"Y", b"Z")))
+        else:
+            position = self.position
+            self._pending = [int(layer), offset, position[b"Z"], position[b"X"], position[b"Y"], position[b"F"],
+                             self.tool, self.valve_state.value]
+            self.layers.append(self._pending)
+
+    def _add_span(self, data: bytes, start: int, end: int):
+        if start >= end:
+            return
+        if self._pending is not None and not self.relative:
+            first = self._move_word(self.axis_patterns[b"Z"], data, start, end, False)
+            if first is not None:
+                self._pending[2] = float(first)
+                self._pending = None
+        for axis, pattern in self.axis_patterns.items():
+            if axis == b"F" or not self.relative:
+                last = self._move_word(pattern, data, start, end, True)
+                if last is not None:
+                    self.position[axis] = float(last)
+        valve = self._move_word(self.valve_pattern, data, start, end, True)
+        if valve is not None:
+            self.valve_state = ValveState.Opened if valve == b"1" else ValveState.Closed
+
+    # _move_word - the value of the first or last word of a G0/G1 line between start and end, not in a comment
+    @staticmethod
+    def _move_word(pattern, data: bytes, start: int, end: int, last: bool):
+        needle = pattern.pattern[:2]
+        position = data.rfind(needle, start, end) if last else data.find(needle, start, end)
+        while position >= 0:
+            match = pattern.match(data, position, end)
+            if match is not None:
+                line = data[data.rfind(b"\n", start, position) + 1:position].lstrip()
+                if b";" not in line and line[:2] in (b"G0", b"G1"):
+                    return match.group(1)
+            position = data.rfind(needle, start, position) if last else data.find(needle, position + 1, end)
+        return None
+
+    def to_json(self) -> bytes:
+        return json.dumps({"size": self.size, "fields": self.fields, "layers": self.layers},
+                          separators=(",", ":")).encode()
+
+    # from_json - the file size and the layers of a sidecar as {layer number: {field: value}}
+    @classmethod
+    def from_json(cls, data: bytes):
+        index = json.loads(data.decode())
+        fields = index["fields"]
+        return index["size"], {record[0]: dict(zip(fields, record)) for record in index["layers"]}
+
+
+class CommandOptimizer(_MoveStage):
+    """Optional stage that drops or compacts commands that don't change what the printer does.
+
+    A _MoveStage on the processed g-code: it follows the state the written commands leave the printer in -
+    the selected tool, the valve, the feedrate, absolute or relative positioning and the X, Y and Z
+    position, kept like selectedTool and valve_state of the processor - and removes:
+
+    - tool selects of the tool that is already selected
+    - X, Y and Z words of absolute moves that repeat the current position, and moves left without words
+    - F words that repeat the current feedrate; a feedrate set on a line of its own is given to the next move
+    - retract/unretract pairs of the same length with only comments between them that leave the valve as
+      it was
+
+    Every move still goes to the same position at the same feedrate with the same extrusion, and nothing
+    is dropped that depends on an unknown state.
+    """
+
+    tools = {b"T0": "T0", b"T1": "T1"}
+
+    def __init__(self):
+        super().__init__()
+        self.selectedTool = ""
+        self.valve_state = ValveState.Undefined
+        self.relative_extrusion = True  # retractions are recognised by negative E words, as the handlers do
+        self.feedrate = None  # the feedrate of the written moves
+        self.target_feedrate = None  # the feedrate of the g-code as it came in
+        self._feedrate_word = None  # the F word that set target_feedrate
+        self._held = None  # a retraction line waiting for the next command
+        self._held_comments = []
+        # counters
+        self.lines_in = self.lines_out = 0
+        self.bytes_in = self.bytes_out = 0
+        self.tool_selects = 0
+        self.position_words = 0
+        self.feedrate_words = 0  # F words that repeated the feedrate
+        self.moved_feedrates = 0  # lines that only set the feedrate, it is given to the next move instead
+        self.empty_moves = 0
+        self.retractions = 0
+
+    def lines(self, data: bytes, end: int, last: bool = False):
+        self.lines_in += data.count(b"\n", 0, end)
+        self.bytes_in += end
+        return super().lines(data, end, last)
+
+    def _output(self, output) -> bytes:
+        self.lines_out += len(output)
+        data = b"".join(output)
+        self.bytes_out += len(data)
+        return data
+
+    # line - optimizes a line, a retraction is held until the next command shows whether it is undone right away
+    def line(self, line: bytes, output):
+        comment_index = line.find(b";")
+        words = (line if comment_index < 0 else line[:comment_index]).split()
+        if not words:  # comments and empty lines
+            if self._held is not None:
+                self._held_comments.append(line)
+            else:
+                output.append(line + b"\n")
+            return
+
+        if self._held is not None:
+            if self._undoes_retraction(words):
+                self._drop_retraction(line, words, comment_index, output)
+                return
+            self._release(output)
+
+        code = words[0]
+        if code in self.moves:
+            if self.relative_extrusion and self._is_retraction(words):
+                self._held = (line, words, comment_index)
+                return
+            self._move(line, words, comment_index, output)
+        elif code in self.tools and len(words) == 1:
+            tool = self.tools[code]
+            if tool == self.selectedTool:
+                self.tool_selects += 1  # the comment is the processor's "Duplicate" note
+                return
+            self.selectedTool = tool
+            self._sync_feedrate(output)  # see _goes_somewhere_unknown
+            self.position = dict.fromkeys(self.axes)
+            output.append(line + b"\n")
+        else:
+            self._set_positioning(code, words)
+            if code == b"M82" or code == b"M83":
+                self.relative_extrusion = code == b"M83"
+            elif self._goes_somewhere_unknown(code, words):  # it may use the current feedrate too
+                self._sync_feedrate(output)
+                self.position = dict.fromkeys(self.axes)
+                if any(word[:1] == b"F" for word in words):
+                    self.feedrate = self.target_feedrate = self._feedrate_word = None
+            output.append(line + b"\n")
+
+    # _move - writes a G0/G1 line without the words that repeat the current state, or drops it
+    def _move(self, line: bytes, words, comment_index: int, output):
+        if len(words) == 1:  # see _goes_somewhere_unknown
+            self._sync_feedrate(output)
+            self.position = dict.fromkeys(self.axes)
+            output.append(line + b"\n")
+            return
+        kept = [words[0]]
+        dropped = 0
+        feedrate_word = None
+        for word in words[1:]:
+            letter = word[:1]
+            if letter == b"F":
+                feedrate_word = word
+                self.target_feedrate = self._value(word)
+                self._feedrate_word = word if self.target_feedrate is not None else None
+                continue
+            if letter in self.axes:
+                value = self._value(word)
+                if self.relative or value is None:
+                    self.position[letter] = None
+                elif value == self.position[letter]:
+                    dropped += 1
+                    continue
+                else:
+                    self.position[letter] = value
+            elif letter == b"B":
+                self.valve_state = ValveState.Closed if word == b"B0" else ValveState.Opened
+            kept.append(word)
+
+        if len(kept) == 1:  # nothing left to do, a feedrate goes to the next move
+            if feedrate_word is not None and self.target_feedrate is None:
+                self.feedrate = None  # a feedrate that can't be read stays where it is
+                output.append(line + b"\n")
+                return
+            self.position_words += dropped
+            if feedrate_word is None:
+                self.empty_moves += 1
+            elif self.target_feedrate == self.feedrate:
+                self.feedrate_words += 1
+            else:
+                self.moved_feedrates += 1
+            if comment_index >= 0:
+                output.append(line[comment_index:] + b"\n")
+            return
+
+        changed = dropped > 0
+        if feedrate_word is not None and self.target_feedrate is None:
+            kept.insert(1, feedrate_word)  # a feedrate that can't be read is written as it is
+            self.feedrate = None
+        elif self.target_feedrate is not None and self.target_feedrate != self.feedrate:
+            kept.insert(1, feedrate_word or self._feedrate_word)
+            changed = changed or feedrate_word is None
+            self.feedrate = self.target_feedrate
+        elif feedrate_word is not None:
+            self.feedrate_words += 1
+            changed = True
+        if not changed:
+            output.append(line + b"\n")
+            return
+        self.position_words += dropped
+        rebuilt = b" ".join(kept)
+        if comment_index >= 0:
+            rebuilt += b" " + line[comment_index:]
+        output.append(rebuilt + b"\n")
+
+    # _is_retraction - a move that only retracts one extruder (and sets the feedrate or the valve)
+    def _is_retraction(self, words) -> bool:
+        extrusion = None
+        for word in words[1:]:
+            letter = word[:1]
+            if letter == b"E" or letter == b"D":
+                if extrusion is not None or word[1:2] != b"-" or self._value(word) is None:
+                    return False
+                extrusion = word
+            elif letter != b"F" and letter != b"B":
+                return False
+        return extrusion is not None
+
+    # _undoes_retraction - whether the move pushes back exactly what the held line retracted and leaves the
+    # valve as it was before the retraction
+    def _undoes_retraction(self, words) -> bool:
+        if words[0] not in self.moves:
+            return False
+        held_words = self._held[1]
+        retraction = [word for word in held_words[1:] if word[:1] in (b"E", b"D")][0]
+        extrusion = None
+        valve = self.valve_state
+        for word in held_words[1:]:
+            if word[:1] == b"B":
+                valve = ValveState.Closed if word == b"B0" else ValveState.Opened
+        for word in words[1:]:
+            letter = word[:1]
+            if letter == b"E" or letter == b"D":
+                if extrusion is not None:
+                    return False
+                extrusion = word
+            elif letter == b"B":
+                valve = ValveState.Closed if word == b"B0" else ValveState.Opened
+            elif letter != b"F":
+                return False
+        if extrusion is None or extrusion[:1] != retraction[:1] or valve != self.valve_state:
+            return False
+        value = self._value(extrusion)
+        return value is not None and value > 0 and value == -self._value(retraction)
+
+    # _drop_retraction - drops the held retraction and the move undoing it, keeping their comments
+    def _drop_retraction(self, line: bytes, words, comment_index: int, output):
+        held_line, held_words, held_comment_index = self._held
+        if held_comment_index >= 0:
+            output.append(held_line[held_comment_index:] + b"\n")
+        for comment in self._held_comments:
+            output.append(comment + b"\n")
+        if comment_index >= 0:
+            output.append(line[comment_index:] + b"\n")
+        for word in held_words[1:] + words[1:]:
+            if word[:1] == b"F":
+                self.target_feedrate = self._value(word)
+                self._feedrate_word = word if self.target_feedrate is not None else None
+        self._held = None
+        self._held_comments = []
+        self.retractions += 1
+
+    # _release - writes the held retraction and the comments after it as they are
+    def _release(self, output):
+        if self._held is None:
+            return
+        line, words, comment_index = self._held
+        self._held = None
+        self._move(line, words, comment_index, output)
+        for comment in self._held_comments:
+            output.append(comment + b"\n")
+        self._held_comments = []
+
+    # _sync_feedrate - sets the feedrate a dropped line would have set before a command that may use it
+    def _sync_feedrate(self, output):
+        if self.target_feedrate is not None and self.target_feedrate != self.feedrate:
+            output.append(b"G1 " + self._feedrate_word + b"\n")
+            self.feedrate = self.target_feedrate
+
+    def as_dict(self) -> dict:
+        return {"lines_saved": self.lines_in - self.lines_out, "bytes_saved": self.bytes_in - self.bytes_out,
+                "tool_selects": self.tool_selects, "position_words": self.position_words,
+                "feedrate_words": self.feedrate_words, "moved_feedrates": self.moved_feedrates,
+                "empty_moves": self.empty_moves,
+                "retractions": self.retractions}
+
+
+class ValvePlanner(_MoveStage):
+    """Look-ahead planner that keeps the nozzle valve open over short travels in close valve mode.
+
+    With close_valve the handlers close the valve (B0) on every retraction and open it again (B1) on the
+    next unretraction, on both printer models. As a _MoveStage on the processed g-code, the planner holds
+    the lines from a move closing an open valve back until the valve is opened again.
+    When only travel moves and comments are in between and the travel is at most max_distance mm long or
+    takes at most max_seconds, the B0 and B1 words are dropped and the valve stays open; the retraction
+    itself is kept. Anything else in between, or a longer travel, writes the held lines as they are, so no
+    more than one travel is ever held back.
+    """
+
+    def __init__(self, max_distance: float = 2.0, max_seconds: float = 0.0):
+        super().__init__()
+        self.max_distance = max_distance
+        self.max_seconds = max_seconds
+        self.valve_state = ValveState.Undefined
+        self.feedrate = None
+        self._held = None  # the lines from the valve close on
+        self._distance = 0.0  # travel since the valve close, None if unknown
+        self._seconds = 0.0
+        # counters, a B1 on every extrusion as QuickFill writes it only counts when it opens a closed valve
+        self.closes = 0  # valve actuations that came in
+        self.opens = 0
+        self.kept_open = 0  # close/open pairs dropped
+
+    # line - plans the valve of a line, the lines from an open valve closing on are held
+    def line(self, line: bytes, output):
+        comment_index = line.find(b";")
+        words = (line if comment_index < 0 else line[:comment_index]).split()
+        if not words:  # comments and empty lines
+            if self._held is not None:
+                self._held.append(line)
+            else:
+                output.append(line + b"\n")
+            return
+
+        code = words[0]
+        valve = None
+        if code in self.moves:
+            if b"B0" in words:
+                valve = ValveState.Closed
+            elif b"B1" in words:
+                valve = ValveState.Opened
+
+        if self._held is not None:
+            if code in self.moves and len(words) > 1 and valve is None and not self._extrudes(words):
+                self._held.append(line)
+                self._travel(words)
+                if not self._short_travel():
+                    self._release(output)
+                return
+            if valve == ValveState.Opened and self._short_travel():
+                self._held[0] = self._without_word(self._held[0], b"B0")
+                output.extend(held + b"\n" for held in self._held if held is not None)
+                self._held = None
+                self.opens += 1
+                self.kept_open += 1
+                self._travel(words)
+                self.valve_state = ValveState.Opened
+                opened = self._without_word(line, b"B1")
+                if opened is not None:
+                    output.append(opened + b"\n")
+                return
+            self._release(output)
+
+        if code in self.moves:
+            if len(words) == 1:  # see _goes_somewhere_unknown
+                self.position = dict.fromkeys(self.axes)
+            else:
+                self._travel(words)
+            if valve is not None and valve != self.valve_state:
+                if valve == ValveState.Closed:
+                    self.closes += 1
+                else:
+                    self.opens += 1
+                if valve == ValveState.Closed and self.valve_state == ValveState.Opened:
+                    self.valve_state = valve
+                    self._held = [line]
+                    self._distance = self._seconds = 0.0
+                    return
+                self.valve_state = valve
+        elif self._goes_somewhere_unknown(code, words):
+            self.position = dict.fromkeys(self.axes)
+        else:
+            self._set_positioning(code, words)
+        output.append(line + b"\n")
+
+    # _travel - follows a move to its end, adding its length and time to the travel of the held lines
+    def _travel(self, words):
+        start = dict(self.position)
+        for word in words[1:]:
+            letter = word[:1]
+            if letter == b"F":
+                self.feedrate = self._value(word)
+            elif letter in self.axes:
+                value = self._value(word)
+                if value is None:
+                    self.position[letter] = None
+                elif self.relative:
+                    if self.position[letter] is not None:
+                        self.position[letter] += value
+                else:
+                    self.position[letter] = value
+        if self._held is None or self._distance is None:
+            return
+        if None in start.values() or None in self.position.values():
+            self._distance = None
+            return
+        length = sum((self.position[axis] - start[axis]) ** 2 for axis in self.axes) ** 0.5
+        self._distance += length
+        if self._seconds is not None:
+            self._seconds = self._seconds + length * 60 / self.feedrate if self.feedrate else None
+
+    # _short_travel - whether the valve can stay open over the travel since the valve close
+    def _short_travel(self) -> bool:
+        if self._distance is None:
+            return False
+        return self._distance <= self.max_distance or (self._seconds is not None and
+                                                       self._seconds <= self.max_seconds)
+
+    # _release - writes the held lines as they are, the valve stays closed
+    def _release(self, output):
+        if self._held is not None:
+            output.extend(held + b"\n" for held in self._held)
+            self._held = None
+
+    @staticmethod
+    def _extrudes(words) -> bool:
+        return any(word[:1] == b"E" or word[:1] == b"D" for word in words[1:])
+
+    # _without_word - the line without the valve word, None if nothing but a bare move would be left
+    @staticmethod
+    def _without_word(line: bytes, valve_word: bytes):
+        comment_index = line.find(b";")
+        words = (line if comment_index < 0 else line[:comment_index]).split()
+        words.remove(valve_word)
+        if len(words) == 1:  # "G0 B0" on its own, a bare G0 would move the head
+            return line[comment_index:] if comment_index >= 0 else None
+        if comment_index >= 0:
+            return b" ".join(words) + b" " + line[comment_index:]
+        return b" ".join(words)
+
+    def as_dict(self) -> dict:
+        return {"closes_before": self.closes, "opens_before": self.opens,
+                "closes_after": self.closes - self.kept_open, "opens_after": self.opens - self.kept_open,
+                "kept_open": self.kept_open}
+
+
+class ToolChangePlanner:
+    """Reorders the tool islands of a dual extrusion layer so the layer switches nozzles at most once.
+
+    Works on Cura's layer chunks (gcode_list) before they are post-processed. A chunk is cut at its tool
+    selects into islands: the lines before the first select, printed with the tool the previous layer
+    ended with, and one island per select. The islands of that tool go first and those of the other tool
+    after them, each in their original order, so the layer starts with the nozzle that is selected
+    already. The end of the layer from the last ;TIME_ELAPSED: on stays at the end.
+    A layer is left as it is when moving its islands could change what is printed:
+    - extrusion is absolute (M82), positioning relative (G91), or the layer has a line other than moves,
+      firmware retractions, temperature, fan and acceleration commands and comments (G28, G92, M83...)
+    - an island would start retracted where it didn't before, or from another X, Y, Z or feedrate for
+      an axis its first move doesn't set
+    - the layer would end with the other tool while its end has lines that depend on the tool
+    Switches are counted from the selected tool like count_tool_change of the processor does, the ones
+    before from the tool the layers in Cura's order would have left selected. The time saved is estimated
+    with switch_seconds per nozzle switch.
+    """
+
+    commands = frozenset(("G0", "G1", "G10", "G11", "G90", "M104", "M106", "M107", "M109", "M140", "M204", "M205",
+                          "T0", "T1"))
+    tool_free_commands = frozenset(("G0", "G1", "G90", "M106", "M107", "M140", "M204", "M205"))
+    axes = ("X", "Y", "Z", "F")
+
+    def __init__(self, switch_seconds: float = 10.0):
+        self.switch_seconds = switch_seconds
+        # the state at the end of the layers seen so far, the axes are None while unknown
+        self.state = dict.fromkeys(self.axes)
+        self.state.update(retracted=False, relative=False, relative_extrusion=False)
+        self._unordered_tool = None  # the tool the layers as Cura wrote them would leave selected
+        # counters
+        self.layers = 0
+        self.reordered = 0  # layers with fewer switches
+        self.constrained = 0  # layers that could have fewer switches but are left as they are
+        self.switches_before = 0
+        self.switches_after = 0
+
+    # reorder - the layer with its islands grouped by tool, selected_tool is the processor's selectedTool
+    def reorder(self, data: str, selected_tool: str) -> str:
+        self.layers += 1
+        lines = data.split("\n")
+        selects = [index for index, line in enumerate(lines) if self._tool_select(line) is not None]
+        tools = [self._tool_select(lines[index]) for index in selects]
+        if self._unordered_tool is None:
+            self._unordered_tool = selected_tool
+        self.switches_before += self._switches(tools, self._unordered_tool)
+        if tools:
+            self._unordered_tool = tools[-1]
+        switches = self._switches(tools, selected_tool)
+        first_tool = selected_tool or (tools[0] if tools else "")
+        order = [tool for tool in tools if tool == first_tool] + [tool for tool in tools if tool != first_tool]
+        if self._switches(order, selected_tool) >= switches:
+            self.switches_after += switches
+            self._run(lines, self.state)
+            return data
+
+        end = len(lines) - 1 if lines[-1] == "" else len(lines)
+        for index in range(end - 1, selects[-1], -1):
+            if lines[index].lstrip().startswith(";TIME_ELAPSED:"):
+                end = index
+                break
+        islands = [lines[start:stop] for start, stop in zip(selects, selects[1:] + [end])]
+        state = dict(self.state)
+        fits = state["relative_extrusion"] and not state["relative"]
+        fits = self._run(lines[:selects[0]], state) and fits
+        entries = []
+        for island in islands + [lines[end:]]:
+            entries.append(dict(state))
+            fits = self._run(island, state) and fits
+        if fits:
+            reordered = dict(entries[0])
+            moved = sorted(range(len(islands)), key=lambda index: tools[index] != first_tool)
+            for index in moved + [len(islands)]:
+                island = islands[index] if index < len(islands) else lines[end:]
+                if not self._fits(island, reordered, entries[index]):
+                    fits = False
+                    break
+                self._run(island, reordered)
+            if tools[moved[-1]] != tools[-1] and not self._tool_free(lines[end:]):
+                fits = False  # the end of the layer would run with the other tool
+        if not fits:
+            self.constrained += 1
+            self.switches_after += switches
+            self.state = state
+            return data
+
+        self.reordered += 1
+        self.switches_after += self._switches(order, selected_tool)
+        self.state = reordered
+        return "\n".join(lines[:selects[0]] + [line for index in moved for line in islands[index]] + lines[end:])
+
+    @staticmethod
+    def _tool_select(line: str):
+        if line[:1] == "T":
+            words = line.split(";", 1)[0].split()
+            if words[0] == "T0" or words[0] == "T1":
+                return words[0]
+        return None
+
+    # _switches - the nozzle switches of the tool selects, the first select is not a switch
+    @staticmethod
+    def _switches(tools, tool: str) -> int:
+        switches = 0
+        for select in tools:
+            if select != tool:
+                if tool != "":
+                    switches += 1
+                tool = select
+        return switches
+
+    # _run - moves state over the lines, returns False if one of them keeps the islands in their order
+    def _run(self, lines, state) -> bool:
+        movable = True
+        for line in lines:
+            words = line.split(";", 1)[0].split()
+            if not words:
+                continue
+            code = words[0]
+            if code not in self.commands or len(words) == 1 and (code == "G0" or code == "G1"):
+                movable = False
+                if code == "M82" or code == "M83":
+                    state["relative_extrusion"] = code == "M83"
+                elif code == "G91":
+                    state["relative"] = True
+                elif code == "G92":
+                    for word in words[1:]:
+                        if word[:1] in self.axes:
+                            state[word[:1]] = word[1:]
+                elif code[:1] == "G":  # homing, a bare G0, arcs... end somewhere unknown
+                    state.update(dict.fromkeys(self.axes))
+            elif code == "G0" or code == "G1":
+                moves = False
+                extrusion = None
+                for word in words[1:]:
+                    letter = word[:1]
+                    if letter in self.axes:
+                        state[letter] = word[1:]
+                        moves = moves or letter != "F"
+                    elif letter == "E":
+                        try:
+                            extrusion = float(word[1:])
+                        except ValueError:
+                            movable = False
+                if not moves and extrusion:  # a retraction or the extrusion that undoes it
+                    state["retracted"] = extrusion < 0
+            elif code == "G10" or code == "G11":
+                state["retracted"] = code == "G10"
+            elif code == "G90":
+                state["relative"] = False
+        return movable
+
+    # _tool_free - whether the lines do the same whichever tool is selected
+    @staticmethod
+    def _tool_free(lines) -> bool:
+        for line in lines:
+            words = line.split(";", 1)[0].split()
+            if words and (words[0] not in ToolChangePlanner.tool_free_commands or
+                          any(word[:1] == "E" for word in words[1:])):
+                return False
+        return True
+
+    # _fits - whether the island prints the same when it starts in state instead of in entry
+    def _fits(self, lines, state, entry) -> bool:
+        if state["retracted"] != entry["retracted"]:
+            return False
+        for line in lines:
+            words = line.split(";", 1)[0].split()
+            if words and (words[0] == "G0" or words[0] == "G1"):
+                given = {word[:1] for word in words[1:]}
+                return all(axis in given or state[axis] is not None and state[axis] == entry[axis]
+                           for axis in self.axes)
+        return True
+
+    def as_dict(self) -> dict:
+        return {"layers": self.layers, "reordered_layers": self.reordered, "constrained_layers": self.constrained,
+                "switches_before": self.switches_before, "switches_after": self.switches_after,
+                "seconds_saved": round((self.switches_before - self.switches_after) * self.switch_seconds, 1)}
+
+
 class RoboxPostProcessing:
-    def __init__(self, model_name: str, close_valve: bool):
+    def __init__(self, model_name: str, close_valve: bool, engine: Engine = Engine.tokenized):
         super().__init__()
         try:
             Model(model_name)
         except ValueError:
-            raise "printer is not supported by robox plugin"
+            raise ValueError("printer " + str(model_name) + " is not supported by robox plugin")
 
         self.roboxCloseValve = close_valve
         self.model = Model(model_name)
+        self.engine = Engine(engine)
 
         # set executor function
         if self.model == Model.dual:
-            self.executor_func = self.dualRobox
+            if self.engine == Engine.tokenized:
+                self.executor_func = self.dualRoboxTokenized
+            else:
+                self.executor_func = self.dualRobox
         if self.model == Model.quick_fill:
-            self.executor_func = self.QuickFillRobox
+            if self.engine == Engine.tokenized:
+                self.executor_func = self.QuickFillRoboxTokenized
+            else:
+                self.executor_func = self.QuickFillRobox
 
         self.t0Pattern = re.compile("T0(\s|$)")
         self.t1Pattern = re.compile("T1(\s|$)")
@@ -42,8 +1179,19 @@ class RoboxPostProcessing:
         self.tTemperaturePattern = re.compile("T\d+")
         self.retractPattern = re.compile("E-\d+")
         self.forwardPattern = re.compile("E\d+")
+        # Lines made only of space separated "<letter><number>" words can be handled by the tokenized engine,
+        # anything else (text, tabs, lower case, letters inside values) goes through the regex handlers.
+        self.plainLinePattern = re.compile("(?:[A-Z][-.0-9]*)?(?: (?:[A-Z][-.0-9]*)?)*")
         self.selectedTool = ""
         self.valve_state = ValveState.Undefined
+        self.block_lines = 4096  # processed lines are joined into blocks of this many lines
+        self.segment_chars = 262144  # input is split into lines this many characters at a time
+        # counters of everything this processor did, see ExportStatistics
+        self.lines = 0
+        self.tool_changes = 0
+        self.valve_opens = 0
+        self.valve_closes = 0
+        self.statistics = None  # set to an ExportStatistics to time execute, encode and write in process_into
 
     def get_header(self) -> str:
         output = ""
@@ -53,18 +1201,169 @@ class RoboxPostProcessing:
         output += "; version " + _version.__version__ + "\n"
         return output
 
-    def execute(self, data: str) -> str:
-        lines = data.split("\n")
-        result = ""
-        for line in lines:
-            comment_index = line.find(";")
-            if comment_index >= 0:
-                comment = line[comment_index + 1:]
-                line = line[0:comment_index]
+    # execute - processes data, str gives str output and bytes-like data gives bytes
+    def execute(self, data):
+        if not isinstance(data, str):
+            return "".join(self.iter_blocks(data)).encode()
+        return "".join(self.iter_blocks(data))
+
+    # iter_blocks - processes data and yields the output in blocks of at most block_lines lines,
+    # bytes-like data is decoded a segment at a time and gives the same str blocks
+    def iter_blocks(self, data):
+        pending = []  # output pieces of the lines since the last block
+        segments = self.iter_segments(data) if isinstance(data, str) else self.iter_bytes_segments(data)
+        for lines in segments:
+            self.lines += len(lines)
+            for line in lines:
+                comment_index = line.find(";")
+                if comment_index >= 0:
+                    comment = line[comment_index + 1:]
+                    line = line[0:comment_index]
+                else:
+                    comment = ""
+                self.executor_func(line, comment, pending)
+                if len(pending) >= self.block_lines:
+                    yield "".join(pending)
+                    pending.clear()
+        if pending:
+            yield "".join(pending)
+
+    # iter_segments - yields the lines of data a segment of about segment_chars characters at a time,
+    # the lines are the same as data.split("\n") without holding all of them at once
+    def iter_segments(self, data: str):
+        start = 0
+        while True:
+            end = data.find("\n", start + self.segment_chars)
+            if end < 0:
+                yield data[start:].split("\n")
+                return
+            yield data[start:end].split("\n")
+            start = end + 1
+
+    # iter_bytes_segments - iter_segments for bytes, bytearray, memoryview or mmap data, each segment is
+    # decoded on its own so the whole input is never held as str. A memoryview (which can't be searched)
+    # is copied one segment at a time.
+    def iter_bytes_segments(self, data):
+        if isinstance(data, memoryview):
+            view = data.cast("B") if data.format != "B" else data
+            tail = b""
+            for start in range(0, len(view), self.segment_chars):
+                piece = tail + view[start:start + self.segment_chars].tobytes()
+                end = piece.rfind(b"\n")
+                if end < 0:
+                    tail = piece
+                    continue
+                yield piece[:end].decode().split("\n")
+                tail = piece[end + 1:]
+            yield tail.decode().split("\n")
+            return
+        start = 0
+        while True:
+            end = data.find(b"\n", start + self.segment_chars)
+            if end < 0:
+                yield bytes(data[start:]).decode().split("\n")
+                return
+            yield bytes(data[start:end]).decode().split("\n")
+            start = end + 1
+
+    # process_into - processes data and writes the encoded output block by block to the stream
+    def process_into(self, stream, data) -> int:
+        if self.statistics is not None:
+            return self.statistics.process_into(self, stream, data)
+        written = 0
+        for block in self.iter_blocks(data):
+            encoded = block.encode()
+            stream.write(encoded)
+            written += len(encoded)
+        return written
+
+    # count_tool_change - counts a switch of selectedTool, the first tool select is not a switch
+    def count_tool_change(self):
+        if self.selectedTool != "":
+            self.tool_changes += 1
+
+    # iter_parallel - processes the chunks in worker processes and yields their output in order.
+    # Each chunk is seeded with the tool and valve state it starts with, which scan_state finds without
+    # rewriting the previous chunks. At most window chunks are in flight at once.
+    def iter_parallel(self, chunks, executor, window: int = 8):
+        in_flight = collections.deque()
+        for data in chunks:
+            in_flight.append(executor.submit(process_chunk, self.model.value, self.roboxCloseValve, self.engine.value,
+                                             self.selectedTool, self.valve_state.value, data))
+            self.scan_state(data)
+            if len(in_flight) >= window:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+    # scan_state - moves selectedTool and valve_state to where processing data would leave them.
+    # Only the last tool select and the lines with an E word from the end up to the last retract or
+    # forward move are looked at. Lines that the cheap rules can't decide make the whole chunk go
+    # through the handlers of a throwaway processor: lines with a T word, whose rewrite removes the tool
+    # and may join an E word with the digits after it ("E T100 T1" becomes "E00"), and retract or
+    # forward moves with more than one E.
+    def scan_state(self, data: str):
+        tool = self.scan_tool(data)
+        if self.model == Model.dual:
+            if not self.roboxCloseValve:
+                self.valve_state = ValveState.Opened  # every processed line opens the valve
             else:
-                comment = ""
-            result += self.executor_func(line, comment)
-        return result
+                end = len(data)
+                while True:
+                    position = data.rfind("E", 0, end)
+                    if position < 0:
+                        break
+                    start = data.rfind("\n", 0, position) + 1
+                    line = data[start:end].split("\n", 1)[0].split(";", 1)[0]
+                    if "E" in line and "T" in line:
+                        self._scan_processed(data)
+                        return
+                    retract = self.retractPattern.search(line)
+                    if retract or self.forwardPattern.search(line):
+                        if line.count("E") > 1:
+                            self._scan_processed(data)
+                            return
+                        self.valve_state = ValveState.Closed if retract else ValveState.Opened
+                        break
+                    end = start
+        if tool is not None:
+            self.selectedTool = tool
+
+    # _scan_processed - scan_state for data whose state depends on how its lines are rewritten, the data is
+    # processed by a throwaway processor so the counters only count the real output
+    def _scan_processed(self, data: str):
+        scanner = RoboxPostProcessing(self.model.value, self.roboxCloseValve, self.engine)
+        scanner.selectedTool = self.selectedTool
+        scanner.valve_state = self.valve_state
+        scanner.execute(data)
+        self.selectedTool = scanner.selectedTool
+        self.valve_state = scanner.valve_state
+
+    # scan_tool - returns the tool selected by the last tool select line of data, or None if there is none
+    def scan_tool(self, data: str):
+        end = len(data)
+        while end > 0:
+            start = data.rfind("\nT", 0, end) + 1
+            if start == 0 and not data.startswith("T"):
+                return None
+            line = data[start:end].split("\n", 1)[0].split(";", 1)[0]
+            if re.search(self.t0Pattern, line):
+                if line.startswith("T0"):
+                    return "T0"
+            elif re.search(self.t1Pattern, line) and line.startswith("T1"):
+                return "T1"
+            end = start - 1
+        return None
+
+    # output_line - appends one processed line to the output pieces
+    @staticmethod
+    def output_line(result, line, duplicate_m109, comment):
+        if duplicate_m109:
+            line = line + "\n" + "M109 \n"
+        if comment != "":
+            result.append(line + " ;" + comment + "\n")
+        else:
+            result.append(line + "\n")
 
     # valve_close_routine - adds the B0 to B1 command to gcode if valve should be opened or closed
     def valve_close_routine(self, line, tool_for_line) -> str:
@@ -73,15 +1372,19 @@ class RoboxPostProcessing:
                     self.valve_state == ValveState.Undefined or self.valve_state == ValveState.Opened):  # There is 'E-xxx" in the line - add closing valve
                 if tool_for_line == "T1":
                     line = line.replace("E", "B0 E")  # Close valve and use second extruder
+                    self.valve_closes += 1
                 elif tool_for_line == "T0":
                     line = line.replace("E", "B0 D")  # Close valve
+                    self.valve_closes += 1
                 self.valve_state = ValveState.Closed
             if re.search(self.forwardPattern, line) and (
                     self.valve_state == ValveState.Undefined or self.valve_state == ValveState.Closed):  # There is 'Exxx' in the line - add opening valve
                 if tool_for_line == "T1":
                     line = line.replace("E", "B1 E")  # Open valve and use second extruder
+                    self.valve_opens += 1
                 elif tool_for_line == "T0":
                     line = line.replace("E", "B1 D")  # Open valve
+                    self.valve_opens += 1
                 self.valve_state = ValveState.Opened
 
         # elif self.valve_state == ValveState.Undefined or self.valve_state == ValveState.Closed:
@@ -89,14 +1392,15 @@ class RoboxPostProcessing:
             if tool_for_line == "T0":  # We are using second tool - so we need second extruder as well
                 if re.search(self.forwardPattern, line) or re.search(self.retractPattern, line):
                     line = line.replace("E", "B1 D")
+                    self.valve_opens += 1
             else:
                 if re.search(self.forwardPattern, line) or re.search(self.retractPattern, line):
                     line = line.replace("E", "B1 E")
+                    self.valve_opens += 1
             self.valve_state = ValveState.Opened
         return line
 
-    def dualRobox(self, line, comment):
-        result = ""
+    def dualRobox(self, line, comment, result):
         toolForLine = self.selectedTool
         if re.search(self.t0Pattern, line):
             if toolForLine != "T0":  # Tool change
@@ -104,6 +1408,7 @@ class RoboxPostProcessing:
                     line = line.replace(" T0", "") + " ; removed T0 from the middle"  # Remove tool change
                     toolForLine = "T0"
                 else:
+                    self.count_tool_change()
                     self.selectedTool = "T0"
                     toolForLine = self.selectedTool
             else:  # No tool changes
@@ -123,6 +1428,7 @@ class RoboxPostProcessing:
                     comment = comment + " removed T1 from the middle"  # Remove tool change
                     toolForLine = "T1"
                 else:
+                    self.count_tool_change()
                     self.selectedTool = "T1"
                     toolForLine = self.selectedTool
             else:  # No tool changes
@@ -142,19 +1448,13 @@ class RoboxPostProcessing:
             if hasS and not hasT:
                 line = line.replace("S", "T")  # Replace "Sxxx" with "Txxx"
 
-        if line.startswith("M109 "):
-            line = line + "\n" + "M109 \n"
+        duplicate_m109 = line.startswith("M109 ")  # the second M109 has no E so it is added after the valve handling
 
         line = self.valve_close_routine(line, toolForLine)
 
-        if comment != "":
-            result += line + " ;" + comment + "\n"
-        else:
-            result += line + "\n"
-        return result
+        self.output_line(result, line, duplicate_m109, comment)
 
-    def QuickFillRobox(self, line, comment) -> str:
-        result = ""
+    def QuickFillRobox(self, line, comment, result):
         toolForLine = self.selectedTool
         if re.search(self.t0Pattern, line):
             if toolForLine != "T0":  # Tool change
@@ -162,6 +1462,7 @@ class RoboxPostProcessing:
                     line = line.replace(" T0", "") + " ; removed T0 from the middle"  # Remove tool change
                     toolForLine = "T0"
                 else:
+                    self.count_tool_change()
                     self.selectedTool = "T0"
                     toolForLine = self.selectedTool
             else:  # No tool changes
@@ -181,6 +1482,7 @@ class RoboxPostProcessing:
                     comment = comment + " removed T1 from the middle"  # Remove tool change
                     toolForLine = "T1"
                 else:
+                    self.count_tool_change()
                     self.selectedTool = "T1"
                     toolForLine = self.selectedTool
             else:  # No tool changes
@@ -192,31 +1494,184 @@ class RoboxPostProcessing:
                     line = line.replace("T1 ", "")
                     comment = comment + " removed T1 from the middle (no tool change)"  # Remove T1 in the middle of the command as no tool change
 
-        if line.startswith("M109 "):
-            line = line + "\n" + "M109 \n"
+        duplicate_m109 = line.startswith("M109 ")  # the second M109 has no E so it is added after the valve handling
 
         if self.roboxCloseValve:
             if re.search(self.retractPattern, line):  # There is 'E-xxx" in the line - add closing valve
                 if toolForLine == "T1":
                     line = line.replace("E", "B0 E")  # Close valve and use second extruder
+                    self.valve_closes += 1
                 elif toolForLine == "T0":
                     line = line.replace("E", "B0 E")  # Close valve
+                    self.valve_closes += 1
             if re.search(self.forwardPattern, line):  # There is 'Exxx' in the line - add opening valve
                 if toolForLine == "T1":
                     line = line.replace("E", "B1 E")  # Open valve and use second extruder
+                    self.valve_opens += 1
                 elif toolForLine == "T0":
                     line = line.replace("E", "B1 E")  # Open valve
+                    self.valve_opens += 1
 
         else:  # No close valve handling needed
             if toolForLine == "T0":  # We are using second tool - so we need second extruder as well
                 if re.search(self.forwardPattern, line) or re.search(self.retractPattern, line):
                     line = line.replace("E", "B1 E")
+                    self.valve_opens += 1
             else:
                 if re.search(self.forwardPattern, line) or re.search(self.retractPattern, line):
                     line = line.replace("E", "B1 E")
+                    self.valve_opens += 1
 
-        if comment != "":
-            result += line + " ;" + comment + "\n"
-        else:
-            result += line + "\n"
-        return result
+        self.output_line(result, line, duplicate_m109, comment)
+
+    # tokenize_line - splits a plain g-code line into its words, returns None if the line is not plain
+    def tokenize_line(self, line):
+        if self.plainLinePattern.fullmatch(line) is None:
+            return None
+        return line.split(" ")
+
+    # tokenized_tool_routine - applies the T0/T1 rules of the regex handlers to the parsed words.
+    # Returns (tool_for_line, suffix, comment), or None when the words need the regex handler.
+    def tokenized_tool_routine(self, words, line, comment, duplicate_comment):
+        toolForLine = self.selectedTool
+        suffix = ""
+        if "T" not in line:
+            return toolForLine, suffix, comment
+        for tool in ("T0", "T1"):
+            if tool not in words:
+                continue
+            if toolForLine != tool:  # Tool change
+                if not line.startswith(tool):
+                    for word in words[1:]:
+                        if word.startswith(tool) and word != tool:
+                            return None  # " T1" would be cut out of a longer word like "T100"
+                    words[1:] = [word for word in words[1:] if word != tool]
+                    if tool == "T0":
+                        suffix = " ; removed T0 from the middle"
+                    else:
+                        comment = comment + " removed T1 from the middle"
+                    toolForLine = tool
+                else:
+                    self.count_tool_change()
+                    self.selectedTool = tool
+                    toolForLine = tool
+            else:  # No tool changes
+                if line.startswith(tool):  # This is solitary tool select - so remove it
+                    comment = comment + duplicate_comment + tool
+                    self.selectedTool = tool
+                else:
+                    words[:-1] = [word for word in words[:-1] if word != tool]
+                    comment = comment + " removed " + tool + " from the middle (no tool change)"
+            break
+        return toolForLine, suffix, comment
+
+    # tokenized_extrusion_word - returns the index of the E word of a line holding at most one, -1 if there is none
+    @staticmethod
+    def tokenized_extrusion_word(words, line):
+        if "E" in line:
+            if words[-1][:1] == "E":  # the usual "G1 X.. Y.. E.." layout
+                return len(words) - 1
+            for index, word in enumerate(words):
+                if word[:1] == "E":
+                    return index
+        return -1
+
+    def tokenized_output(self, result, words, suffix, comment):
+        duplicate_m109 = words[0] == "M109" and (len(words) > 1 or suffix != "")
+        self.output_line(result, " ".join(words) + suffix, duplicate_m109, comment)
+
+    def dualRoboxTokenized(self, line, comment, result):
+        words = self.tokenize_line(line)
+        if words is None or line.count("E") > 1:
+            self.dualRobox(line, comment, result)
+            return
+        tool_routine = self.tokenized_tool_routine(words, line, comment, " Duplicate ")
+        if tool_routine is None:
+            self.dualRobox(line, comment, result)
+            return
+        toolForLine, suffix, comment = tool_routine
+        extrusion = self.tokenized_extrusion_word(words, line)
+
+        if toolForLine == "T1" and ("M103" in line or "M104" in line or "M109" in line):
+            hasS = hasT = False
+            for word in words:
+                if word[1:2].isdigit():
+                    hasS = hasS or word[0] == "S"
+                    hasT = hasT or word[0] == "T"
+            # There is 'Sxxx' in the line and second tool is selected and line doesn't contain both
+            if hasS and not hasT:
+                words = ["T" + word[1:] if word[:1] == "S" else word for word in words]
+
+        if extrusion >= 0:
+            self.tokenized_valve_routine(words, extrusion, toolForLine)
+        elif not self.roboxCloseValve:
+            self.valve_state = ValveState.Opened
+        self.tokenized_output(result, words, suffix, comment)
+
+    # tokenized_valve_routine - same decisions as valve_close_routine, taken from the E word of the line
+    def tokenized_valve_routine(self, words, extrusion, tool_for_line):
+        word = words[extrusion]
+        retract = word[1:2] == "-" and word[2:3].isdigit()
+        forward = word[1:2].isdigit()
+        if self.roboxCloseValve:
+            if retract and self.valve_state != ValveState.Closed:  # There is 'E-xxx" in the line - add closing valve
+                if tool_for_line == "T1":
+                    words[extrusion] = "B0 " + word  # Close valve and use second extruder
+                    self.valve_closes += 1
+                elif tool_for_line == "T0":
+                    words[extrusion] = "B0 D" + word[1:]  # Close valve
+                    self.valve_closes += 1
+                self.valve_state = ValveState.Closed
+            elif forward and self.valve_state != ValveState.Opened:  # There is 'Exxx' in the line - add opening valve
+                if tool_for_line == "T1":
+                    words[extrusion] = "B1 " + word  # Open valve and use second extruder
+                    self.valve_opens += 1
+                elif tool_for_line == "T0":
+                    words[extrusion] = "B1 D" + word[1:]  # Open valve
+                    self.valve_opens += 1
+                self.valve_state = ValveState.Opened
+        else:  # No close valve handling needed
+            if forward or retract:
+                if tool_for_line == "T0":  # We are using second tool - so we need second extruder as well
+                    words[extrusion] = "B1 D" + word[1:]
+                else:
+                    words[extrusion] = "B1 " + word
+                self.valve_opens += 1
+            self.valve_state = ValveState.Opened
+
+    def QuickFillRoboxTokenized(self, line, comment, result):
+        words = self.tokenize_line(line)
+        if words is None or line.count("E") > 1:
+            self.QuickFillRobox(line, comment, result)
+            return
+        tool_routine = self.tokenized_tool_routine(words, line, comment, "")
+        if tool_routine is None:
+            self.QuickFillRobox(line, comment, result)
+            return
+        toolForLine, suffix, comment = tool_routine
+        extrusion = self.tokenized_extrusion_word(words, line)
+
+        if extrusion >= 0:
+            word = words[extrusion]
+            retract = word[1:2] == "-" and word[2:3].isdigit()
+            forward = word[1:2].isdigit()
+            if self.roboxCloseValve:
+                if retract and toolForLine in ("T0", "T1"):  # There is 'E-xxx" in the line - add closing valve
+                    words[extrusion] = "B0 " + word
+                    self.valve_closes += 1
+                elif forward and toolForLine in ("T0", "T1"):  # There is 'Exxx' in the line - add opening valve
+                    words[extrusion] = "B1 " + word
+                    self.valve_opens += 1
+            elif forward or retract:  # No close valve handling needed
+                words[extrusion] = "B1 " + word
+                self.valve_opens += 1
+        self.tokenized_output(result, words, suffix, comment)
+
+
+# process_chunk - processes one chunk from the given tool and valve state, run by the iter_parallel workers
+def process_chunk(model_name: str, close_valve: bool, engine: str, selected_tool: str, valve_state: str,
+                  data: str) -> str:
+    processor = RoboxPostProcessing(model_name, close_valve, Engine(engine))
+    processor.selectedTool = selected_tool
+    processor.valve_state = ValveState(valve_state)
+    return processor.execute(data)
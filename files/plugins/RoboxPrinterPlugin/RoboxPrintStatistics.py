@@ -0,0 +1,78 @@
+####################################################################
+# Print statistics of existing Robox g-code files
+#
+# Prints one JSON record per file with the print time, the filament
+# length per extruder (E and D) and the number of tool changes:
+#
+#   python RoboxPrintStatistics.py part1.rb.gcode part2.rb.gcode
+#
+# Files written with print statistics enabled (the plugin's
+# print_statistics preference or RoboxBatchProcessing.py
+# --print-statistics) end with a comment block that holds them, only
+# the end of those files is read. Other files are scanned once in
+# blocks with RoboxPostProcessing.PrintStatistics, --rescan forces
+# that for every file.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+####################################################################
+
+import argparse
+import json
+import os
+import sys
+
+if __package__:
+    from . import RoboxPostProcessing
+else:  # run as a script
+    from _plugin_loader import load_plugin_module
+    RoboxPostProcessing = load_plugin_module("RoboxPostProcessing")
+
+# the statistics block is a few hundred bytes at the very end of the file
+trailer_bytes = 4096
+
+
+# read_trailer - the statistics block at the end of the file, None if the file has none
+def read_trailer(path: str):
+    with open(path, "rb") as source:
+        source.seek(max(os.path.getsize(path) - trailer_bytes, 0))
+        return RoboxPostProcessing.PrintStatistics.from_trailer(source.read())
+
+
+# scan_file - gathers the statistics from the whole file
+def scan_file(path: str, block_bytes: int = 1 << 20) -> dict:
+    statistics = RoboxPostProcessing.PrintStatistics()
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(block_bytes), b""):
+            statistics.add(block)
+    statistics.finish()
+    return statistics.as_dict()
+
+
+# file_statistics - the statistics of one file and where they came from
+def file_statistics(path: str, rescan: bool = False) -> dict:
+    values = None if rescan else read_trailer(path)
+    source = "trailer"
+    if values is None:
+        values = scan_file(path)
+        source = "scan"
+    return dict(values, path=path, source=source)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Print time, filament and tool changes of Robox g-code files")
+    parser.add_argument("files", nargs="+", help="g-code files to read")
+    parser.add_argument("--rescan", action="store_true", help="scan the whole file even if it has statistics")
+    arguments = parser.parse_args(argv)
+
+    failed = 0
+    for path in arguments.files:
+        try:
+            print(json.dumps(file_statistics(path, arguments.rescan)))
+        except OSError as e:
+            failed += 1
+            print("FAILED " + path + ": " + str(e), file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,41 +17,38 @@
 import os  # for listdir
 import os.path  # for isfile and join and path
 import sys
-import zipfile  # For unzipping the printer files
+import base64  # For the thumbnail comments
+import gzip  # For the .rb.gcode.gz output
+import zlib  # For the CRC of installed files
 import stat  # For setting file permissions correctly
-import re  # For escaping characters in the settings.
+import re  # for upgrade installations
 import json
 import copy
 import shutil
+import threading
+import time
+import weakref
 
 from . import _version
 from . import RoboxPostProcessing
 
-from distutils.version import StrictVersion  # for upgrade installations
-
+# Only what is needed to register the plugin is imported here, zipfile, the snapshot and
+# QtGui are imported by the functions that use them so they don't add to Cura's start time.
 from UM.i18n import i18nCatalog
 from UM.Extension import Extension
 from UM.Message import Message
 from UM.Resources import Resources
 from UM.Logger import Logger
-from UM.Preferences import Preferences
 from UM.Mesh.MeshWriter import MeshWriter
 from UM.Settings.InstanceContainer import InstanceContainer
-from UM.Qt.Duration import DurationFormat
-from UM.Qt.Bindings.Theme import Theme
 from UM.PluginRegistry import PluginRegistry
 
 from UM.Application import Application
-from UM.Settings.InstanceContainer import InstanceContainer
 from cura.Machines.ContainerTree import ContainerTree
 from cura.Utils.Threading import call_on_qt_thread
-from cura.Snapshot import Snapshot
 
-from PyQt5.QtWidgets import QApplication, QFileDialog
-from PyQt5.QtGui import QPixmap, QScreen, QColor, qRgb, QImageReader, QImage, QDesktopServices
-from PyQt5.QtCore import QByteArray, QBuffer, QIODevice, QRect, Qt, QSize, pyqtSlot, QObject, QUrl, pyqtSlot
-
-from . import G3DremHeader
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import pyqtSlot, QObject, QUrl
 
 catalog = i18nCatalog("cura")
 
@@ -69,6 +66,14 @@ dirs = [
     ["materials", "roboxmat"],
 ]
 
+# written to the resources folder at install time: the plugin version and the size and CRC of every installed file
+manifest_name = "RoboxPrinterPlugin.manifest.json"
+
+
+class ExportCancelled(Exception):
+    pass
+
+
 class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
     ######################################################################
     ##  The version number of this plugin
@@ -81,26 +86,81 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
     version = _version.__version__
 
     ######################################################################
-    ##  Dictionary that defines how characters are escaped when embedded in
-    #   g-code.
-    #
-    #   Note that the keys of this dictionary are regex strings. The values are
-    #   not.
+    ##  Translation table that defines how characters are escaped when
+    #   embedded in g-code.
     ######################################################################
-    escape_characters = {
-        re.escape("\\"): "\\\\",  # The escape character.
-        re.escape("\n"): "\\n",  # Newlines. They break off the comment.
-        re.escape("\r"): "\\r"  # Carriage return. Windows users may need this for visualisation in their editors.
-    }
+    escape_characters = str.maketrans({
+        "\\": "\\\\",  # The escape character.
+        "\n": "\\n",  # Newlines. They break off the comment.
+        "\r": "\\r"  # Carriage return. Windows users may need this for visualisation in their editors.
+    })
 
     _setting_keyword = ";SETTING_"
 
     def __init__(self):
         super().__init__(add_to_recent_files=False)
         self._application = Application.getInstance()
-
-        if self.getPreferenceValue("curr_version") is None:
-            self.setPreferenceValue("curr_version", "0.0.0")
+        self._preferences_changed = False
+
+        # every preference is registered once with its default, cura.cfg keeps only the values that differ from it
+        self._addPreference("curr_version", "0.0.0")
+        # the stat of the install manifest when its files were last found complete, see isUpToDate
+        self._addPreference("install_stamp", "")
+
+        # when enabled every export logs one record of timers and counters, see RoboxPostProcessing.ExportStatistics
+        self._addPreference("export_statistics", False)
+        self.last_export_statistics = None
+
+        # when enabled print time, filament per extruder and tool changes are gathered while writing and
+        # appended to the file as a comment block, see RoboxPostProcessing.PrintStatistics
+        self._addPreference("print_statistics", False)
+        self.last_print_statistics = None
+
+        # when enabled repeated feedrates and positions, duplicate tool selects and retractions that are undone
+        # right away are dropped while writing, see RoboxPostProcessing.CommandOptimizer
+        self._addPreference("optimize_commands", False)
+        self.last_optimizer_statistics = None
+
+        # when enabled the nozzle valve stays open over travels of at most valve_max_travel_mm, or that take at
+        # most valve_max_travel_s, in close valve mode, see RoboxPostProcessing.ValvePlanner
+        self._addPreference("valve_planner", False)
+        self._addPreference("valve_max_travel_mm", 2.0)
+        self._addPreference("valve_max_travel_s", 0.0)
+        self.last_valve_planner_statistics = None
+
+        # when enabled the islands of each layer are grouped by tool on Robox Dual heads, so a layer switches
+        # nozzles at most once, see RoboxPostProcessing.ToolChangePlanner. tool_change_seconds is the time one
+        # switch is reckoned to take in the logged summary
+        self._addPreference("reorder_tool_changes", False)
+        self._addPreference("tool_change_seconds", 10.0)
+        self.last_tool_planner_statistics = None
+
+        # when enabled a .layers.json index with the byte offset, Z, tool and valve state of every layer is
+        # written next to uncompressed files, RoboxResumeJob.py cuts resumable jobs with it
+        self._addPreference("layer_index", False)
+
+        # processed layers are kept between exports so unchanged layers are not post-processed again
+        self._addPreference("layer_cache_size_mb", 64)
+        self._layer_cache = RoboxPostProcessing.LayerCache(0)
+
+        # optional preview image written after the header as base64 comments, rendered once per scene revision
+        self._addPreference("thumbnail_enabled", False)
+        self._addPreference("thumbnail_width", 160)
+        self._addPreference("thumbnail_height", 120)
+        self._addPreference("thumbnail_format", "PNG")
+        self._snapshot = None
+        self._scene_revision = 0
+        self._thumbnail_key = None
+        self._thumbnail = None
+
+        # compression level of the .rb.gcode.gz output, 1 is fastest and 9 smallest
+        self._addPreference("gzip_level", 6)
+        self._application.getController().getScene().sceneChanged.connect(self._onSceneChanged)
+        # the flattened profiles of the last export, reused while none of their containers changed
+        self._settings_generation = 0
+        self._settings_cache_key = None
+        self._settings_cache_data = None
+        self._watched_settings_containers = weakref.WeakValueDictionary()
 
         self.this_plugin_path = os.path.join(Resources.getStoragePath(Resources.Resources), "plugins",
                                              "RoboxPrinterPlugin", "RoboxPrinterPlugin")
@@ -112,13 +172,19 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
 
         needs_to_be_installed = False
 
-        if self.isInstalled():
+        if self.isUpToDate():
+            Logger.log("i", "Robox Plugin files of version " + RoboxPrinterPlugin.version + " are installed")
+
+        elif self.isInstalled():
             Logger.log("i", "All Robox files are installed")
 
             # if the version isn't the same, then force installation
             if not self.versionsMatch():
                 Logger.log("i", "Robox Plugin detected that plugin needs to be upgraded")
                 needs_to_be_installed = True
+            else:
+                # installed by a version without a manifest, record it so the next start takes the fast path
+                self.writeInstallManifest()
 
         else:
             Logger.log("i", "Some Robox Plugin files are NOT installed")
@@ -134,11 +200,13 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Robox Printer Plugin Version " + RoboxPrinterPlugin.version),
                          self.openPluginWebsite)
 
-        # finally save the cura.cfg file
-        Logger.log("i", "Robox Plugin - Writing to " + str(
-            Resources.getStoragePath(Resources.Preferences, self._application.getApplicationName() + ".cfg")))
-        self._application.getPreferences().writeToFile(
-            Resources.getStoragePath(Resources.Preferences, self._application.getApplicationName() + ".cfg"))
+        # finally save the cura.cfg file, if one of our preferences changed
+        if self._preferences_changed:
+            Logger.log("i", "Robox Plugin - Writing to " + str(
+                Resources.getStoragePath(Resources.Preferences, self._application.getApplicationName() + ".cfg")))
+            self._application.getPreferences().writeToFile(
+                Resources.getStoragePath(Resources.Preferences, self._application.getApplicationName() + ".cfg"))
+            self._preferences_changed = False
 
     ######################################################################
     ## Taking snapshot needs to be called on QT thread
@@ -148,10 +216,110 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
     @call_on_qt_thread
     def _createSnapshot(self, w=80, h=60):
         # must be called from the main thread because of OpenGL
-        Logger.log("d", "Creating thumbnail image with size (", w, ",", h, ")")
-        self._snapshot = Snapshot.snapshot(width=w, height=h)
+        from cura.Snapshot import Snapshot
+        Logger.log("d", "Creating thumbnail image with size (%d, %d)" % (w, h))
+        try:
+            self._snapshot = Snapshot.snapshot(width=w, height=h)
+        except Exception:
+            Logger.logException("w", "Robox Plugin could not create the thumbnail")
+            self._snapshot = None
+            return
         Logger.log("d", "Thumbnail taken")
 
+    def _onSceneChanged(self, *args):
+        self._scene_revision += 1
+
+    ######################################################################
+    ## The thumbnail preferences as (width, height, format), None when the
+    ## thumbnail is disabled. Sizes are kept between 16 and 800 pixels.
+    ######################################################################
+    def _thumbnailSettings(self):
+        if not self._preferenceEnabled("thumbnail_enabled"):
+            return None
+        try:
+            width = min(max(int(self.getPreferenceValue("thumbnail_width")), 16), 800)
+            height = min(max(int(self.getPreferenceValue("thumbnail_height")), 16), 800)
+        except (TypeError, ValueError):
+            width, height = 160, 120
+        image_format = str(self.getPreferenceValue("thumbnail_format")).upper()
+        if image_format not in ("PNG", "JPG"):
+            image_format = "PNG"
+        return width, height, image_format
+
+    ######################################################################
+    ## A number preference that is at least minimum, default if the value
+    ## is not a finite number (a hand edited cura.cfg)
+    ######################################################################
+    def _numberPreference(self, name, default, minimum=0.0):
+        try:
+            value = float(self.getPreferenceValue(name))
+        except (TypeError, ValueError):
+            return default
+        if value != value or value in (float("inf"), float("-inf")):
+            return default
+        return max(value, minimum)
+
+    ######################################################################
+    ## The gzip compression level when the export goes to a .gz file (the
+    ## .rb.gcode.gz output), None for an uncompressed export. The level is
+    ## kept between 1 and 9.
+    ######################################################################
+    def _compressionLevel(self, stream):
+        name = getattr(stream, "name", None)
+        if not isinstance(name, str) or not name.lower().endswith(".gz"):
+            return None
+        try:
+            return min(max(int(self.getPreferenceValue("gzip_level")), 1), 9)
+        except (TypeError, ValueError):
+            return 6
+
+    ######################################################################
+    ## The path of the layer index next to the file the stream writes to,
+    ## None for compressed files and streams that are not files
+    ######################################################################
+    def _layerIndexPath(self, stream):
+        name = getattr(stream, "name", None)
+        if not isinstance(name, str) or name.lower().endswith(".gz"):
+            return None
+        return name + RoboxPostProcessing.LayerIndex.extension
+
+    ######################################################################
+    ## Writes the layer index, a failure only costs the index
+    ######################################################################
+    def _writeLayerIndex(self, layer_index, index_path):
+        try:
+            with open(index_path, "wb") as output:
+                output.write(layer_index.to_json())
+            Logger.log("d", "Robox Plugin layer index of %d layers written to %s" % (len(layer_index.layers),
+                                                                                   index_path))
+        except OSError:
+            Logger.logException("w", "Robox Plugin could not write the layer index")
+
+    ######################################################################
+    ## The thumbnail as (encoded image, width, height, format), None if there is
+    ## nothing to render. The image is rendered once per scene revision and
+    ## setting, later exports of the same scene reuse it.
+    ######################################################################
+    def _thumbnailImage(self, width, height, image_format):
+        key = (self._scene_revision, width, height, image_format)
+        if key == self._thumbnail_key:
+            return self._thumbnail
+        self._snapshot = None
+        self._createSnapshot(width, height)
+        thumbnail = None
+        if self._snapshot is not None:
+            from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QIODevice.WriteOnly)
+            if self._snapshot.save(buffer, image_format):
+                thumbnail = (bytes(data), self._snapshot.width(), self._snapshot.height(), image_format)
+            buffer.close()
+        self._snapshot = None
+        self._thumbnail_key = key
+        self._thumbnail = thumbnail
+        return thumbnail
+
     def createPreferencesWindow(self):
         path = os.path.join(PluginRegistry.getInstance().getPluginPath(self.getPluginId()), "RoboxPluginprefs.qml")
         Logger.log("i", "Creating RoboxPrinterPlugin preferences UI " + path)
@@ -171,6 +339,7 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
     ######################################################################
     @pyqtSlot()
     def openPluginWebsite(self):
+        from PyQt5.QtGui import QDesktopServices
         url = QUrl('https://github.com/Automaker-Unofficial/Cura-Robox-Printer-Plugin/releases', QUrl.TolerantMode)
         if not QDesktopServices.openUrl(url):
             message = Message(catalog.i18nc("@info:status",
@@ -183,6 +352,7 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
     ######################################################################
     @pyqtSlot()
     def showHelp(self):
+        from PyQt5.QtGui import QDesktopServices
         url = os.path.join(PluginRegistry.getInstance().getPluginPath(self.getPluginId()), "README.pdf")
         Logger.log("i", "Robox Plugin opening help document: " + url)
         try:
@@ -201,6 +371,7 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
     ######################################################################
     @pyqtSlot()
     def reportIssue(self):
+        from PyQt5.QtGui import QDesktopServices
         Logger.log("i",
                    "Robox Plugin opening issue page: https://github.com/Automaker-Unofficial/Cura-Robox-Printer-Plugin/issues/new")
         try:
@@ -229,7 +400,7 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
                    "Robox Plugin checking versions: " + installed_version + " == " + RoboxPrinterPlugin.version)
 
         try:
-            if StrictVersion(installed_version) == StrictVersion(RoboxPrinterPlugin.version):
+            if version_key(installed_version) == version_key(RoboxPrinterPlugin.version):
                 # if the version numbers match, then return true
                 Logger.log("i",
                            "Robox Plugin versions match: " + installed_version + " matches " + RoboxPrinterPlugin.version)
@@ -264,6 +435,85 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
         Logger.log("i", "Robox Plugin all files ARE installed")
         return True
 
+    ######################################################################
+    ## The manifest of the installed files and the stamp that identifies it:
+    ## the plugin version with the modification time and size of the manifest
+    ######################################################################
+    def manifestPath(self):
+        return os.path.join(Resources.getStoragePathForType(Resources.Resources), manifest_name)
+
+    def installStamp(self):
+        try:
+            manifest_stat = os.stat(self.manifestPath())
+        except OSError:
+            return None
+        return "%s:%d:%d" % (RoboxPrinterPlugin.version, manifest_stat.st_mtime_ns, manifest_stat.st_size)
+
+    def readInstallManifest(self):
+        try:
+            with open(self.manifestPath(), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if isinstance(manifest, dict) and isinstance(manifest.get("files"), dict):
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return None
+
+    ######################################################################
+    ## Returns True if the files of this version are installed.
+    ## Usually this is one stat of the manifest compared with the stamp saved
+    ## at the last check, only when the stamp differs the manifest is read and
+    ## every file in it is checked.
+    ######################################################################
+    def isUpToDate(self):
+        stamp = self.installStamp()
+        if stamp is None:
+            return False
+        if stamp == self.getPreferenceValue("install_stamp"):
+            return True
+
+        manifest = self.readInstallManifest()
+        if manifest is None or manifest.get("version") != RoboxPrinterPlugin.version:
+            return False
+        resources_path = Resources.getStoragePathForType(Resources.Resources)
+        for name, entry in manifest["files"].items():
+            try:
+                if os.stat(os.path.join(resources_path, name)).st_size != entry["size"]:
+                    Logger.log("i", "Robox Plugin installed file changed: " + name)
+                    return False
+            except OSError:
+                Logger.log("i", "Robox Plugin installed file missing: " + name)
+                return False
+        self.setPreferenceValue("install_stamp", stamp)
+        return True
+
+    ######################################################################
+    ## Writes the manifest of the installed files and saves its stamp,
+    ## by default the files are the ones in resources.zip
+    ######################################################################
+    def writeInstallManifest(self, manifest_files=None):
+        try:
+            if manifest_files is None:
+                import zipfile
+                zipdata = os.path.join(self.this_plugin_path, "resources.zip")
+                with zipfile.ZipFile(zipdata, "r") as zip_ref:
+                    manifest_files = {info.filename: {"size": info.file_size, "crc": info.CRC}
+                                      for info in zip_ref.infolist() if not info.is_dir()}
+            manifest = {"version": RoboxPrinterPlugin.version, "files": manifest_files}
+            path = self.manifestPath()
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.replace(path + ".tmp", path)
+            self.setPreferenceValue("install_stamp", self.installStamp())
+        except:  # a missing manifest only means the next start does the full check
+            Logger.logException("w", "Robox Plugin could not write the install manifest")
+
+    ######################################################################
+    ##  Boolean preferences read back from cura.cfg are strings
+    ######################################################################
+    def _preferenceEnabled(self, preferenceName):
+        return self.getPreferenceValue(preferenceName) in (True, "True", "true", 1, "1")
+
     ######################################################################
     ##  Gets a value from Cura's preferences
     ######################################################################
@@ -271,41 +521,86 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
         return self._application.getPreferences().getValue("RoboxPrinterPlugin/" + str(preferenceName))
 
     ######################################################################
-    ## Sets a value to be stored in Cura's preferences file
+    ## Registers a preference with its default value. A value read from
+    ## cura.cfg is kept, and only values that differ from the default are
+    ## written back to it, so registering doesn't change the file.
+    ######################################################################
+    def _addPreference(self, preferenceName, defaultValue):
+        self._application.getPreferences().addPreference("RoboxPrinterPlugin/" + str(preferenceName), defaultValue)
+
+    ######################################################################
+    ## Sets a value to be stored in Cura's preferences file, cura.cfg is
+    ## only written again when a value really changed
     ######################################################################
     def setPreferenceValue(self, preferenceName, preferenceValue):
         if preferenceValue is None:
             return False
         name = "RoboxPrinterPlugin/" + str(preferenceName)
+        current_value = self.getPreferenceValue(preferenceName)
+        if current_value is not None and str(current_value) == str(preferenceValue):
+            return True  # values read back from cura.cfg are strings
         Logger.log("i", "Robox Plugin: setting preference " + name + " to " + str(preferenceValue))
-        if self.getPreferenceValue(preferenceName) is None:
-            Logger.log("i", "Adding preference " + name);
-            self._application.getPreferences().addPreference(name, preferenceValue)
+        if current_value is None:  # not registered, without a default the value is always saved
+            Logger.log("i", "Adding preference " + name)
+            self._application.getPreferences().addPreference(name, None)
 
         self._application.getPreferences().setValue(name, preferenceValue)
-        return self.getPreferenceValue(preferenceName) == preferenceValue
+        changed = self.getPreferenceValue(preferenceName) == preferenceValue
+        if changed:
+            self._preferences_changed = True
+        return changed
 
     ######################################################################
     ## Install the plugin files from the included zip file.
+    ## Only the files that are missing or whose CRC differs from the one
+    ## in the manifest of the previous install are written, each through
+    ## a temporary file that is renamed when it is complete. Files of the
+    ## previous install that are no longer in the zip are removed.
     ######################################################################
     def installPluginFiles(self):
         Logger.log("i", "Robox Plugin installing printer files")
         try:
-            resources_path = os.path.join(self.this_plugin_path, "../../../")
+            import zipfile
+            resources_path = Resources.getStoragePathForType(Resources.Resources)
             zipdata = os.path.join(self.this_plugin_path, "resources.zip")
             Logger.log("i", "Robox Plugin: found zipfile: " + zipdata)
+            previous_manifest = self.readInstallManifest()
+            installed_files = previous_manifest["files"] if previous_manifest is not None else {}
+            shipped_files = {}
+            written = 0
             with zipfile.ZipFile(zipdata, "r") as zip_ref:
                 for info in zip_ref.infolist():
-                    Logger.log("i", "Robox Plugin: found in zipfile: " + info.filename)
-                    extracted_path = zip_ref.extract(info.filename, resources_path)
-                    permissions = os.stat(extracted_path).st_mode
-                    os.chmod(extracted_path, permissions | stat.S_IEXEC)  # Make these files executable.
+                    if info.is_dir():
+                        continue
+                    entry = {"size": info.file_size, "crc": info.CRC}
+                    shipped_files[info.filename] = entry
+                    target_path = resource_file_path(resources_path, info.filename)
+                    if installed_files.get(info.filename) == entry and file_size(target_path) == info.file_size:
+                        continue
+                    if info.filename not in installed_files and file_crc(target_path) == info.CRC:
+                        continue  # installed by a version without a manifest and unchanged
                     Logger.log("i", "Robox Plugin installing " + info.filename + " to " + resources_path)
+                    install_zip_entry(zip_ref, info, target_path)
+                    written += 1
+
+            removed = 0
+            for name in sorted(installed_files.keys() - shipped_files.keys()):
+                # the names come from the manifest on disk, they go through the same check as installs
+                try:
+                    target_path = resource_file_path(resources_path, name)
+                except ValueError:
+                    Logger.log("w", "Robox Plugin not removing %s, it is outside of the resources folder" % name)
+                    continue
+                if remove_file(os.path.dirname(target_path), os.path.basename(target_path)):
+                    removed += 1
+            Logger.log("i", "Robox Plugin installed %d files, %d unchanged, %d removed" % (
+                written, len(shipped_files) - written, removed))
 
             if self.isInstalled():
                 # The files are now installed, so set the curr_version prefrences value
                 if not self.setPreferenceValue("curr_version", RoboxPrinterPlugin.version):
                     Logger.log("e", "Robox Plugin could not set curr_version preference ")
+                self.writeInstallManifest(shipped_files)
 
         except:  # Installing a new plugin should never crash the application so catch any random errors and show a message.
             Logger.logException("w", "An exception occurred in Robox Printer Plugin while installing the files")
@@ -369,33 +664,136 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
             print_object("active_machine_stack", active_machine_stack)
             printer_model = active_machine_stack.getDefinition().getId()
             processor = RoboxPostProcessing.RoboxPostProcessing(printer_model, True)
+            statistics = None
+            if self._preferenceEnabled("export_statistics"):
+                statistics = RoboxPostProcessing.ExportStatistics()
+                processor.statistics = statistics
+            export_start = time.perf_counter()
+            cache_size = int(self._numberPreference("layer_cache_size_mb", 64) * 1024 * 1024)
+            if cache_size != self._layer_cache.max_bytes:
+                self._layer_cache = RoboxPostProcessing.LayerCache(cache_size)
+            cache_hits, cache_misses = self._layer_cache.hits, self._layer_cache.misses
 
             gcode_dict = getattr(scene, "gcode_dict")
             gcode_list = gcode_dict.get(active_build_plate, None)
             if gcode_list is not None:
-                has_settings = False
-                stream.write(processor.get_header().encode())
-                for gcode in gcode_list:
-                    # Logger.log("d", "got node" + gcode)
-                    try:
-                        processed = processor.execute(gcode)
-                        # Logger.log("d", "made node " + processed)
-                        if gcode[:len(self._setting_keyword)] == self._setting_keyword:
-                            has_settings = True
-                        stream.write(processed.encode())
-                    except:
-                        Logger.logException("w", "Robox Plugin - Error writing gcode to file.")
-                        return False
+                thumbnail = None
+                thumbnail_settings = self._thumbnailSettings()
+                if thumbnail_settings is not None:
+                    thumbnail_start = time.perf_counter()
+                    thumbnail = self._thumbnailImage(*thumbnail_settings)
+                    if statistics is not None:
+                        statistics.add_time("thumbnail", time.perf_counter() - thumbnail_start)
+
+                print_statistics = None
+                if self._preferenceEnabled("print_statistics"):
+                    print_statistics = RoboxPostProcessing.PrintStatistics()
+                optimizer = None
+                if self._preferenceEnabled("optimize_commands"):
+                    optimizer = RoboxPostProcessing.CommandOptimizer()
+                valve_planner = None
+                if self._preferenceEnabled("valve_planner"):
+                    valve_planner = RoboxPostProcessing.ValvePlanner(
+                        self._numberPreference("valve_max_travel_mm", 2.0),
+                        self._numberPreference("valve_max_travel_s", 0.0))
+                tool_planner = None
+                if processor.model == RoboxPostProcessing.Model.dual and self._preferenceEnabled("reorder_tool_changes"):
+                    tool_planner = RoboxPostProcessing.ToolChangePlanner(
+                        self._numberPreference("tool_change_seconds", 10.0))
+
+                # the index sees every byte that goes into the file, offsets into a gzip stream can't be seeked to
+                layer_index = None
+                index_path = self._layerIndexPath(stream)
+                if index_path is not None and self._preferenceEnabled("layer_index"):
+                    layer_index = RoboxPostProcessing.LayerIndex()
+                    stream = layer_index.wrap(stream)
+
+                # the compressor sits between the writes and the file, so the output is compressed as it is
+                # written and never held in memory as a whole
+                output_stream = stream
+                compression_level = self._compressionLevel(stream)
+                if compression_level is not None:
+                    stream = gzip.GzipFile(fileobj=output_stream, mode="wb", compresslevel=compression_level)
+
+                # every export has its own event, set by the Cancel button of its own progress message
+                cancelled = threading.Event()
+
+                def onMessageAction(message, action_id):
+                    self._onExportMessageAction(cancelled, action_id)
+
+                progress_message = Message(catalog.i18nc("@info:status", "Writing Robox g-code"), lifetime=0,
+                                           dismissable=False, progress=0,
+                                           title=catalog.i18nc("@info:title", "Robox Printer Plugin"))
+                progress_message.addAction("cancel", catalog.i18nc("@action:button", "Cancel"), "", "")
+                progress_message.actionTriggered.connect(onMessageAction)
+                progress_message.show()
+                try:
+                    has_settings = self._runOffMainThread(self._writeLayers, stream, processor, gcode_list,
+                                                          statistics, progress_message, cancelled, thumbnail,
+                                                          print_statistics, optimizer, valve_planner, tool_planner)
+                except ExportCancelled:
+                    Logger.log("i", "Robox Plugin - export cancelled, discarding the partial file.")
+                    self._closeCompressedOutput(stream, output_stream)
+                    self._discardPartialOutput(output_stream)
+                    message = Message(catalog.i18nc("@info:status", "Robox g-code export cancelled."))
+                    message.show()
+                    return False
+                except:
+                    Logger.logException("w", "Robox Plugin - Error writing gcode to file.")
+                    self._closeCompressedOutput(stream, output_stream)
+                    return False
+                finally:
+                    progress_message.hide()
                 try:
                     ## Serialise the current container stack and put it at the end of the file.
                     if not has_settings:
-                        settings = self._serialiseSettings(global_container_stack)
-                        stream.write(settings.encode())
+                        settings_start = time.perf_counter()
+                        if statistics is not None:
+                            write_seconds = statistics.seconds["write"]
+                            for chunk in self._serialiseSettings(global_container_stack):
+                                statistics.write(stream, chunk.encode())
+                            statistics.add_time("settings", time.perf_counter() - settings_start -
+                                                (statistics.seconds["write"] - write_seconds))
+                        else:
+                            for chunk in self._serialiseSettings(global_container_stack):
+                                stream.write(chunk.encode())
+                    if print_statistics is not None:
+                        stream.write(print_statistics.trailer())
+                        self.last_print_statistics = print_statistics.as_dict()
+                        Logger.log("i", "Robox Plugin print statistics: " + json.dumps(self.last_print_statistics))
+                    if optimizer is not None:
+                        self.last_optimizer_statistics = optimizer.as_dict()
+                        Logger.log("i", "Robox Plugin command optimizer: " + json.dumps(self.last_optimizer_statistics))
+                        if statistics is not None:
+                            statistics.counters["command_optimizer"] = self.last_optimizer_statistics
+                    if valve_planner is not None:
+                        self.last_valve_planner_statistics = valve_planner.as_dict()
+                        Logger.log("i", "Robox Plugin valve planner: " + json.dumps(self.last_valve_planner_statistics))
+                        if statistics is not None:
+                            statistics.counters["valve_planner"] = self.last_valve_planner_statistics
+                    if tool_planner is not None:
+                        self.last_tool_planner_statistics = tool_planner.as_dict()
+                        Logger.log("i", "Robox Plugin tool change planner: " + json.dumps(self.last_tool_planner_statistics))
+                        if statistics is not None:
+                            statistics.counters["tool_change_planner"] = self.last_tool_planner_statistics
+                    if stream is not output_stream:
+                        stream.close()  # writes the end of the gzip stream, the file itself stays open
+                        Logger.log("d", "Robox Plugin compressed output, level %d" % compression_level)
+                    if layer_index is not None:
+                        self._writeLayerIndex(layer_index, index_path)
                     Logger.log("i", "Done writing settings - write complete")
+                    Logger.log("d", "Robox Plugin layer cache: %d hits, %d misses, %d bytes cached" % (
+                        self._layer_cache.hits - cache_hits, self._layer_cache.misses - cache_misses,
+                        self._layer_cache.size))
+                    if statistics is not None:
+                        statistics.counters["layer_cache_hits"] = self._layer_cache.hits - cache_hits
+                        statistics.counters["layer_cache_misses"] = self._layer_cache.misses - cache_misses
+                        self._logExportStatistics(statistics, time.perf_counter() - export_start)
                     return True
                 except Exception as e:
                     Logger.logException("w", "Exception caught while serializing settings.")
                     Logger.log("d", sys.exc_info()[:2])
+                    self._closeCompressedOutput(stream, output_stream)
             message = Message(catalog.i18nc("@warning:status", "Please prepare G-code before exporting."))
             message.show()
             return False
@@ -404,6 +802,125 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
             Logger.log("d", sys.exc_info()[:2])
             return False
 
+    ######################################################################
+    ##  Writes the header and the post-processed layers to the stream and
+    ##  shows the fraction of layers done in the progress message.
+    ##  Raises ExportCancelled once the export's cancelled event is set.
+    ##  Returns True if the gcode already contains the settings.
+    ######################################################################
+    def _writeLayers(self, stream, processor, gcode_list, statistics, progress_message, cancelled, thumbnail=None,
+                     print_statistics=None, optimizer=None, valve_planner=None, tool_planner=None):
+        has_settings = False
+        if statistics is not None:
+            statistics.write(stream, processor.get_header().encode())
+        else:
+            stream.write(processor.get_header().encode())
+
+        if thumbnail is not None:
+            for chunk in iter_thumbnail_lines(*thumbnail):
+                if statistics is not None:
+                    statistics.write(stream, chunk)
+                else:
+                    stream.write(chunk)
+
+        if print_statistics is not None:
+            stream = print_statistics.wrap(stream)  # the statistics are taken from the processed layers as written
+        if optimizer is not None:
+            stream = optimizer.wrap(stream)  # the layer cache keeps the output before it is optimized
+        if valve_planner is not None:
+            stream = valve_planner.wrap(stream)  # before the optimizer, it may drop a retraction left without valve
+        layer_count = max(len(gcode_list), 1)
+        shown_progress = 0
+        for index, gcode in enumerate(gcode_list):
+            if cancelled.is_set():
+                raise ExportCancelled()
+            if tool_planner is not None:  # with the tool the previous layer left selected
+                if statistics is not None:
+                    reorder_start = time.perf_counter()
+                    gcode = tool_planner.reorder(gcode, processor.selectedTool)
+                    statistics.add_time("reorder", time.perf_counter() - reorder_start)
+                else:
+                    gcode = tool_planner.reorder(gcode, processor.selectedTool)
+            # the layer is processed and written block by block, so no full-size copy of it is made
+            self._layer_cache.process_into(processor, stream, gcode)
+            if gcode[:len(self._setting_keyword)] == self._setting_keyword:
+                has_settings = True
+            progress = (100 * (index + 1)) // layer_count
+            if progress != shown_progress:
+                shown_progress = progress
+                progress_message.setProgress(progress)
+        if optimizer is not None or valve_planner is not None:
+            stream.finish()  # a retraction or valve close held back at the end of the last layer
+        return has_settings
+
+    ######################################################################
+    ##  Cura calls write() from a job thread when saving to disk, in that
+    ##  case the function just runs. When called from the Qt main thread
+    ##  the function runs in a worker thread while the main thread keeps
+    ##  handling events, so the progress message is drawn and can be used
+    ######################################################################
+    def _runOffMainThread(self, function, *args):
+        if threading.current_thread() is not threading.main_thread():
+            return function(*args)
+
+        outcome = {}
+
+        def run():
+            try:
+                outcome["result"] = function(*args)
+            except BaseException as e:
+                outcome["error"] = e
+
+        worker = threading.Thread(target=run, name="RoboxPrinterPluginExport", daemon=True)
+        worker.start()
+        while worker.is_alive():
+            QApplication.processEvents()
+            worker.join(0.05)
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+    ######################################################################
+    ##  The Cancel button of an export's progress message sets the event
+    ##  of that export only
+    ######################################################################
+    def _onExportMessageAction(self, cancelled, action_id):
+        if action_id == "cancel":
+            Logger.log("i", "Robox Plugin - cancelling export")
+            cancelled.set()
+
+    ######################################################################
+    ##  Closes the gzip stream of a failed compressed export before the
+    ##  file is given back, otherwise it would write its end to the file
+    ##  whenever it is collected
+    ######################################################################
+    def _closeCompressedOutput(self, stream, output_stream):
+        if stream is output_stream:
+            return
+        try:
+            stream.close()
+        except Exception:
+            Logger.logException("w", "Robox Plugin could not close the compressed output")
+
+    ######################################################################
+    ##  Empties the stream of a cancelled export so no partial file is left
+    ######################################################################
+    def _discardPartialOutput(self, stream):
+        try:
+            stream.seek(0)
+            stream.truncate()
+        except Exception:  # not every output device gives a seekable stream
+            Logger.logException("w", "Robox Plugin could not discard the partial output")
+
+    ######################################################################
+    ##  Logs the statistics of an export as one record and keeps them
+    ##  in last_export_statistics for scripts
+    ######################################################################
+    def _logExportStatistics(self, statistics, total_seconds):
+        statistics.add_time("total", total_seconds)
+        self.last_export_statistics = statistics.as_dict()
+        Logger.log("i", "Robox Plugin export statistics: " + json.dumps(self.last_export_statistics, sort_keys=True))
+
     ##  Create a new container with container 2 as base and container 1 written over it.
     def _createFlattenedContainerInstance(self, instance_container1, instance_container2):
         flat_container = InstanceContainer(instance_container2.getName())
@@ -429,14 +946,37 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
     #   The settings are serialised, and special characters (including newline)
     #   are escaped.
     #
+    #   The flattened profiles are reused from the previous export as long
+    #   as the containers of the stack are the same and none of them changed.
+    #
     #   \param settings A container stack to serialise.
-    #   \return A serialised string of the settings.
+    #   \return The serialised settings, in chunks of whole lines.
     ######################################################################
     def _serialiseSettings(self, stack):
-        container_registry = self._application.getContainerRegistry()
-
         prefix = self._setting_keyword + str(RoboxPrinterPlugin.version) + " "  # The prefix to put before each line.
-        prefix_length = len(prefix)
+
+        key = self._settingsCacheKey(stack)
+        if key != self._settings_cache_key:
+            self._settings_cache_data = self._flattenSettings(stack)
+            self._settings_cache_key = key
+        else:
+            Logger.log("d", "Robox Plugin reusing the flattened profiles of the previous export")
+        data = self._settings_cache_data
+
+        # Check if there is any profiles
+        if data is None:
+            Logger.log("i", "No custom settings found, not writing settings to g-code.")
+            return iter(())
+
+        # The JSON is encoded piece by piece and cut into lines as it comes, so no full-size copy is made.
+        return iter_settings_footer(prefix, json.JSONEncoder().iterencode(data))
+
+    ######################################################################
+    ##  Flattens the user changes and quality changes of the stack and its
+    ##  extruders into serialised profiles, None if there are no settings
+    ######################################################################
+    def _flattenSettings(self, stack):
+        container_registry = self._application.getContainerRegistry()
 
         quality_type = stack.quality.getMetaDataEntry("quality_type")
         container_with_profile = stack.qualityChanges
@@ -512,25 +1052,101 @@ class RoboxPrinterPlugin(QObject, MeshWriter, Extension):
 
             all_setting_keys.update(flat_extruder_quality.getAllKeys())
 
-        # Check if there is any profiles
         if not all_setting_keys:
-            Logger.log("i", "No custom settings found, not writing settings to g-code.")
-            return ""
-
-        json_string = json.dumps(data)
+            return None
+        return data
 
-        # Escape characters that have a special meaning in g-code comments.
-        pattern = re.compile("|".join(RoboxPrinterPlugin.escape_characters.keys()))
-
-        # Perform the replacement with a regular expression.
-        escaped_string = pattern.sub(lambda m: RoboxPrinterPlugin.escape_characters[re.escape(m.group(0))], json_string)
-
-        # Introduce line breaks so that each comment is no longer than 80 characters. Prepend each line with the prefix.
-        result = ""
-        # Lines have 80 characters, so the payload of each line is 80 - prefix.
-        for pos in range(0, len(escaped_string), 80 - prefix_length):
-            result += prefix + escaped_string[pos: pos + 80 - prefix_length] + "\n"
-        return result
+    ######################################################################
+    ##  The key of the flattened profiles: the IDs of every container they
+    ##  are made from, and a generation that is increased whenever one of
+    ##  those containers changes or a new container object is seen
+    ######################################################################
+    def _settingsCacheKey(self, stack):
+        containers = [stack, stack.userChanges, stack.qualityChanges, stack.quality, stack.intent, stack.definition]
+        for extruder in stack.extruderList:
+            containers += [extruder, extruder.userChanges, extruder.qualityChanges, extruder.quality, extruder.intent]
+        for container in containers:
+            self._watchSettingsContainer(container)
+        return (self._settings_generation,) + tuple(container.getId() for container in containers)
+
+    def _watchSettingsContainer(self, container):
+        if self._watched_settings_containers.get(id(container)) is container:
+            return
+        for signal_name in ("propertyChanged", "metaDataChanged", "containersChanged"):
+            signal = getattr(container, signal_name, None)
+            if signal is not None:
+                signal.connect(self._onSettingsContainerChanged)
+        self._watched_settings_containers[id(container)] = container
+        self._settings_generation += 1
+
+    def _onSettingsContainerChanged(self, *args):
+        self._settings_generation += 1
+
+
+######################################################################
+##  Cuts the JSON pieces into the ;SETTING_ comment lines Cura's
+##  GCodeReader reads back: the characters with a special meaning in
+##  g-code comments are escaped, every line is the prefix followed by
+##  80 - len(prefix) characters of payload, the last line may be
+##  shorter. Yields chunks of chunk_lines lines.
+######################################################################
+def iter_settings_footer(prefix, pieces, chunk_lines=256):
+    payload = 80 - len(prefix)
+    chunk_chars = payload * chunk_lines
+    pending = []
+    pending_chars = 0
+    for piece in pieces:
+        piece = piece.translate(RoboxPrinterPlugin.escape_characters)
+        pending.append(piece)
+        pending_chars += len(piece)
+        if pending_chars >= chunk_chars:
+            text = "".join(pending)
+            end = len(text) - len(text) % payload
+            yield "".join([prefix + text[pos:pos + payload] + "\n" for pos in range(0, end, payload)])
+            pending = [text[end:]]
+            pending_chars = len(text) - end
+    text = "".join(pending)
+    if text:
+        yield "".join([prefix + text[pos:pos + payload] + "\n" for pos in range(0, len(text), payload)])
+
+
+######################################################################
+##  Yields the thumbnail comment block in chunks of lines, in the layout
+##  other slicers use for previews:
+##    ; thumbnail begin 160x120 <base64 length>
+##    ; <76 base64 characters per line>
+##    ; thumbnail end
+##  a JPG image is marked as thumbnail_JPG. The image is encoded in blocks
+##  of whole lines (57 bytes each), so no base64 copy of it is built.
+######################################################################
+def iter_thumbnail_lines(image: bytes, width: int, height: int, image_format: str = "PNG", chunk_lines: int = 256):
+    tag = b"thumbnail" if image_format == "PNG" else b"thumbnail_" + image_format.encode()
+    yield b";\n; %s begin %dx%d %d\n" % (tag, width, height, (len(image) + 2) // 3 * 4)
+    view = memoryview(image)
+    block = 57 * chunk_lines
+    for start in range(0, len(image), block):
+        encoded = base64.b64encode(view[start:start + block])
+        yield b"".join([b"; " + encoded[pos:pos + 76] + b"\n" for pos in range(0, len(encoded), 76)])
+    yield b"; %s end\n;\n" % tag
+
+
+######################################################################
+##  Turns a version number like 1.2, 1.2.3 or 1.2.3b1 into a tuple that
+##  compares the way distutils' StrictVersion did: 1.2 == 1.2.0 and a
+##  pre-release (a or b) sorts before its release.
+##  Raises ValueError for anything else, like a development version.
+######################################################################
+version_pattern = re.compile(r"^(\d+)\.(\d+)(?:\.(\d+))?(?:([ab])(\d+))?$")
+
+
+def version_key(version: str):
+    match = version_pattern.match(version)
+    if match is None:
+        raise ValueError("invalid version number " + repr(version))
+    major, minor, patch, prerelease, prerelease_number = match.groups()
+    if prerelease is None:
+        return int(major), int(minor), int(patch or 0), 1, "", 0
+    return int(major), int(minor), int(patch or 0), 0, prerelease, int(prerelease_number)
 
 
 def print_object(name, obj):
@@ -549,6 +1165,55 @@ def remove_file(path: str, file_name: str) -> bool:
     return False
 
 
+######################################################################
+##  The path a zip entry or manifest name is installed to, refusing
+##  names that would end up outside of the resources folder
+######################################################################
+def resource_file_path(resources_path: str, name: str) -> str:
+    parts = name.replace("\\", "/").split("/")
+    if os.path.isabs(name) or ".." in parts or any(os.path.splitdrive(part)[0] for part in parts):
+        raise ValueError("Robox Plugin refuses to install " + name)
+    return os.path.join(resources_path, *parts)
+
+
+def file_size(path: str):
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def file_crc(path: str):
+    try:
+        crc = 0
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                crc = zlib.crc32(block, crc)
+        return crc
+    except OSError:
+        return None
+
+
+######################################################################
+##  Writes one zip entry through a temporary file that replaces the
+##  target when it is complete, reading the entry to its end checks
+##  its CRC, so a broken zip never leaves a broken file behind
+######################################################################
+def install_zip_entry(zip_ref, info, target_path: str):
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    temp_path = target_path + ".tmp"
+    try:
+        with zip_ref.open(info, "r") as source, open(temp_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+        permissions = os.stat(temp_path).st_mode
+        os.chmod(temp_path, permissions | stat.S_IEXEC)  # Make these files executable.
+        os.replace(temp_path, target_path)
+    except BaseException:
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 def remove_dir(path: str, dir_name: str) -> bool:
     try:
         dir_path = os.path.join(path, dir_name)
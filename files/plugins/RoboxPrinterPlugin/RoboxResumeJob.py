@@ -0,0 +1,153 @@
+####################################################################
+# Resumable jobs cut from Robox g-code files at a layer
+#
+# Writes a job that prints a file from the given layer on, to finish
+# a failed print without printing the layers below again:
+#
+#   python RoboxResumeJob.py part.rb.gcode --layer 120
+#   python RoboxResumeJob.py part.rb.gcode --list
+#
+# The layer is looked up in the part.rb.gcode.layers.json index the
+# plugin writes next to the file (its layer_index preference), so
+# the file is not read up to the layer but seeked to. Files without
+# an index, or with one that doesn't fit the file any more, are
+# scanned once with RoboxPostProcessing.LayerIndex and the index is
+# saved for the next time.
+# The job is the start g-code of the file (heating, homing, priming;
+# left out with --no-start-code), a move up to the Z of the layer and
+# over to where the layer below ended, the feedrate, tool and valve
+# state the layer starts with and the rest of the file from the
+# layer's ;LAYER: line on.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+####################################################################
+
+import argparse
+import os
+import shutil
+import sys
+
+if __package__:
+    from . import RoboxPostProcessing
+else:  # run as a script
+    from _plugin_loader import load_plugin_module
+    RoboxPostProcessing = load_plugin_module("RoboxPostProcessing")
+
+
+# index_path_for - the layer index written next to a g-code file
+def index_path_for(path: str) -> str:
+    return path + RoboxPostProcessing.LayerIndex.extension
+
+
+# scan_file - indexes the layers of the whole file and saves the index next to it
+def scan_file(path: str, block_bytes: int = 1 << 20):
+    index = RoboxPostProcessing.LayerIndex()
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(block_bytes), b""):
+            index.add(block)
+    index.finish()
+    data = index.to_json()
+    try:
+        with open(index_path_for(path), "wb") as output:
+            output.write(data)
+    except OSError as e:  # a read-only directory, the index is just not kept
+        print("could not save the layer index: " + str(e), file=sys.stderr)
+    return RoboxPostProcessing.LayerIndex.from_json(data)[1]
+
+
+# load_layers - the layers of the file as {layer number: {field: value}}, from its index if that fits the file
+def load_layers(path: str):
+    try:
+        with open(index_path_for(path), "rb") as source:
+            size, layers = RoboxPostProcessing.LayerIndex.from_json(source.read())
+        if size == os.path.getsize(path):
+            return layers
+    except (OSError, ValueError, KeyError):
+        pass
+    return scan_file(path)
+
+
+# preamble - the commands that put the printer into the state the layer starts in
+def preamble(layer: dict, input_path: str) -> bytes:
+    lines = ["; Resumed at layer %d of %s" % (layer["layer"], os.path.basename(input_path)), "G90"]
+    if layer["z"] is not None:
+        lines.append("G0 Z%s" % layer["z"])  # straight up from wherever the start g-code left the head
+    if layer["x"] is not None and layer["y"] is not None:
+        lines.append("G0 X%s Y%s" % (layer["x"], layer["y"]))  # where the layer below ended
+    if layer["feedrate"] is not None:
+        lines.append("G0 F%s" % layer["feedrate"])
+    if layer["tool"] is not None:
+        lines.append(layer["tool"])
+    if layer["valve"] == RoboxPostProcessing.ValveState.Opened.value:
+        lines.append("G0 B1")
+    elif layer["valve"] == RoboxPostProcessing.ValveState.Closed.value:
+        lines.append("G0 B0")
+    return ("\n".join(lines) + "\n").encode()
+
+
+# resume_job - writes the job printing input_path from layer_number on, returns the number of bytes written
+def resume_job(input_path: str, output_path: str, layer_number: int, start_code: bool = True) -> int:
+    layers = load_layers(input_path)
+    if layer_number not in layers:
+        raise ValueError("%s has no layer %d" % (input_path, layer_number))
+    layer = layers[layer_number]
+    with open(input_path, "rb") as source, open(output_path, "wb") as output:
+        written = 0
+        if start_code:  # everything before the first layer
+            first = min(layers.values(), key=lambda record: record["offset"])
+            remaining = first["offset"]
+            while remaining > 0:
+                block = source.read(min(remaining, 1 << 20))
+                if not block:
+                    break
+                output.write(block)
+                remaining -= len(block)
+            written += first["offset"] - remaining
+        lines = preamble(layer, input_path)
+        output.write(lines)
+        written += len(lines)
+        source.seek(layer["offset"])
+        shutil.copyfileobj(source, output, 1 << 20)
+        written += os.path.getsize(input_path) - layer["offset"]
+    return written
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Cut a resumable job from a Robox g-code file at a layer")
+    parser.add_argument("file", help="the .rb.gcode file of the failed print")
+    parser.add_argument("--layer", type=int, help="the first layer to print")
+    parser.add_argument("--output", help="the job to write (default: next to the file, named after the layer)")
+    parser.add_argument("--no-start-code", action="store_true",
+                        help="leave out the start g-code, the printer has to be heated and homed already")
+    parser.add_argument("--list", action="store_true", help="print the layers of the file and exit")
+    arguments = parser.parse_args(argv)
+
+    try:
+        if arguments.list:
+            layers = sorted(load_layers(arguments.file).values(), key=lambda record: record["offset"])
+            try:
+                for layer in layers:
+                    print("layer %(layer)d at byte %(offset)d, Z %(z)s, tool %(tool)s, valve %(valve)s" % layer)
+                sys.stdout.flush()
+            except BrokenPipeError:  # piped into head..., the rest of the list isn't wanted
+                # stdout is flushed again at exit, that must not fail on the closed pipe either
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 0
+        if arguments.layer is None:
+            parser.error("--layer is needed to cut a job")
+        output_path = arguments.output
+        if output_path is None:
+            name = arguments.file
+            if name.lower().endswith(".rb.gcode"):
+                name = name[:-len(".rb.gcode")]
+            output_path = "%s.from-layer-%d.rb.gcode" % (name, arguments.layer)
+        written = resume_job(arguments.file, output_path, arguments.layer, not arguments.no_start_code)
+    except (OSError, ValueError) as e:
+        print("FAILED " + arguments.file + ": " + str(e), file=sys.stderr)
+        return 1
+    print("%s -> %s (%.1f MB from layer %d)" % (arguments.file, output_path, written / 1e6, arguments.layer))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
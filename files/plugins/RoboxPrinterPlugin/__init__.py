@@ -16,6 +16,11 @@ def getMetaData():
                 "description": catalog.i18nc("@item:inlistbox", "File for CEL Robox printers"),
                 "mime_type": "application/x-rbcode",
                 "mode": RoboxPrinterPlugin.RoboxPrinterPlugin.OutputMode.BinaryMode
+            }, {
+                "extension": "rb.gcode.gz",
+                "description": catalog.i18nc("@item:inlistbox", "Compressed file for CEL Robox printers"),
+                "mime_type": "application/x-rbcode-gz",
+                "mode": RoboxPrinterPlugin.RoboxPrinterPlugin.OutputMode.BinaryMode
             }]
         }
     }
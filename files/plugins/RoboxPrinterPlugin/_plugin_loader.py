@@ -0,0 +1,33 @@
+####################################################################
+# Loads modules of the Robox plugin outside of Cura
+#
+# RoboxBatchProcessing.py, RoboxPrintStatistics.py and
+# RoboxResumeJob.py run as scripts as well as inside the plugin. The
+# plugin's __init__ imports UM, so when they run on their own the
+# package is registered as an empty namespace pointing at the plugin
+# directory and only the requested modules are imported from it. The
+# benchmarks load the plugin the same way.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+####################################################################
+
+import importlib
+import os
+import sys
+import types
+
+plugin_path = os.path.dirname(os.path.abspath(__file__))
+
+
+# register_package - makes RoboxPrinterPlugin an empty package of the plugin directory, unless it is imported already
+def register_package():
+    if "RoboxPrinterPlugin" not in sys.modules:
+        package = types.ModuleType("RoboxPrinterPlugin")
+        package.__path__ = [plugin_path]
+        sys.modules["RoboxPrinterPlugin"] = package
+
+
+# load_plugin_module - imports RoboxPrinterPlugin.<name> without running the plugin's __init__
+def load_plugin_module(name: str):
+    register_package()
+    return importlib.import_module("RoboxPrinterPlugin." + name)